@@ -0,0 +1,63 @@
+"""Uniform selection of a binding by enumeration compared with sampling from the combinatorial space.
+
+The transition consumes one order and up to three items through a variable arc; its guard rejects bindings with
+exactly two items. For growing markings, a binding is selected uniformly either by enumerating all enabled bindings
+and choosing one, or by Transition.sample_binding.
+
+Run from the repository root: python -m benchmarks.binding_sampling_benchmark
+"""
+import time
+
+import numpy as np
+
+from qel_simulation.components.quantity_net import QuantityNet
+from qel_simulation.qnet_elements.transition import Transition
+from qel_simulation.simulation.object import create_object_type, StatusActive
+
+OBJECTS = [5, 10, 20, 30]
+SELECTIONS = 20
+
+Order = create_object_type(object_type_name="Benchmark Order")
+Item = create_object_type(object_type_name="Benchmark Item")
+
+
+def create_transition(number_of_objects: int) -> Transition:
+    quantity_net = QuantityNet(name="benchmark net")
+    quantity_net.set_net_structure(arcs=[("p_order", "t"), ("p_item", "t"), ("t", "p_done")])
+    quantity_net.set_place_types({"p_order": Order, "p_item": Item, "p_done": Order})
+    quantity_net.set_maximum_object_tokens_variable_arc({("p_item", "t"): 3})
+    for place_name, object_type in [("p_order", Order), ("p_item", Item)]:
+        objects = [object_type(timestamp=None) for _ in range(number_of_objects)]
+        for obj in objects:
+            obj.status = StatusActive()
+        quantity_net.identify_node(place_name, "place").add_tokens(objects)
+
+    transition = quantity_net.identify_node("t", "transition")
+    transition.set_object_guard(lambda binding_function: len(binding_function[Item]) != 2)
+    return transition
+
+
+def main():
+    rng = np.random.default_rng(seed=42)
+    print(f"{SELECTIONS} uniform selections of a binding")
+    print(f"{'objects':>8} {'bindings':>10} {'enumeration [s]':>16} {'sampling [s]':>13} {'acceptance':>11}")
+    for number_of_objects in OBJECTS:
+        transition = create_transition(number_of_objects=number_of_objects)
+
+        start = time.perf_counter()
+        for _ in range(SELECTIONS):
+            enabled_bindings = transition.determine_new_binding_functions()
+            _ = enabled_bindings[rng.integers(len(enabled_bindings))]
+        enumeration_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(SELECTIONS):
+            _ = transition.sample_binding(rng=rng)
+        sampling_time = time.perf_counter() - start
+
+        print(f"{number_of_objects:>8} {len(enabled_bindings):>10} {enumeration_time:>16.3f} {sampling_time:>13.4f} "
+              f"{transition.sampling_acceptance_rate:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Measures the effect of the integer microsecond clock.
+
+The first part compares the operations the queue performs for every scheduled item (determining the execution time
+from the current time and a duration, comparing execution times) on datetime/timedelta and on integer microseconds.
+The second part reports the simulation steps per second for the inventory management example.
+
+Run from the repository root: python -m benchmarks.clock_benchmark
+"""
+import contextlib
+import datetime
+import io
+import time
+
+import numpy as np
+
+from qel_simulation.simulation.clock import datetime_to_us, timedelta_to_us
+
+OPERATIONS = 1000000
+EXAMPLE_STEPS = 300
+
+
+def run_clock_operations(current_time, durations: list) -> float:
+    start = time.perf_counter()
+    matches = 0
+    for duration in durations:
+        execution_time = current_time + duration
+        if execution_time == current_time:
+            matches += 1
+        if execution_time < current_time:
+            matches -= 1
+    return time.perf_counter() - start
+
+
+def run_example(steps: int) -> dict[str, float]:
+    from examples.example_inventory_management.example_sim_config import config
+    from qel_simulation.simulation.simulation import Simulation
+
+    config.max_execution_steps = steps
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulation = Simulation(name="clock benchmark", config=config)
+        start = time.perf_counter()
+        simulation.start_simulation()
+        elapsed_time = time.perf_counter() - start
+    return {"steps": simulation.step_counter, "steps_per_s": simulation.step_counter / elapsed_time,
+            "events": simulation.number_of_events}
+
+
+def main():
+    rng = np.random.default_rng(seed=42)
+    minutes = rng.integers(low=0, high=120, size=OPERATIONS)
+    current_time = datetime.datetime(year=2019, month=10, day=12, hour=12, minute=21)
+    timedeltas = [datetime.timedelta(minutes=int(m)) for m in minutes]
+    microseconds = [timedelta_to_us(duration) for duration in timedeltas]
+
+    datetime_time = run_clock_operations(current_time, timedeltas)
+    integer_time = run_clock_operations(datetime_to_us(current_time), microseconds)
+    print(f"{OPERATIONS} schedule and compare operations")
+    print(f"{'datetime':>10}: {datetime_time:.3f} s")
+    print(f"{'integer':>10}: {integer_time:.3f} s ({datetime_time / integer_time:.1f}x)")
+    print()
+
+    result = run_example(EXAMPLE_STEPS)
+    print(f"inventory management example: {result['steps']} steps, {result['events']} events, "
+          f"{result['steps_per_s']:.1f} steps/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Enumeration of enabled bindings with transitions screened by the active token counts of their input places compared
+with enumerating the bindings of every transition.
+
+The net consists of independent transitions consuming an order and an item, of which only a few have objects in both
+input places, as it is typical for nets in which most objects wait in few places. Every step enumerates the enabled
+bindings of all transitions without incremental enabling. With count screening, one vectorized comparison of the
+active token counts with the pre incidence matrix of the compiled net rules out the transitions with empty input
+places before their bindings are enumerated.
+
+Run from the repository root: python -m benchmarks.count_screening_benchmark
+"""
+import time
+
+from qel_simulation.components.quantity_net import QuantityNet
+from qel_simulation.simulation.object import create_object_type, StatusActive
+
+TRANSITIONS = [10, 100, 1000]
+MARKED_TRANSITIONS = 5
+STEPS = 100
+
+Order = create_object_type(object_type_name="Benchmark Order")
+Item = create_object_type(object_type_name="Benchmark Item")
+
+
+def create_net(number_of_transitions: int, count_screening: bool) -> QuantityNet:
+    arcs = []
+    place_types = {}
+    for i in range(number_of_transitions):
+        arcs.extend([(f"p{i}_order", f"t{i}"), (f"p{i}_item", f"t{i}"), (f"t{i}", f"p{i}_done")])
+        place_types.update({f"p{i}_order": Order, f"p{i}_item": Item, f"p{i}_done": Order})
+    quantity_net = QuantityNet(name="benchmark net")
+    quantity_net.set_net_structure(arcs=arcs)
+    quantity_net.set_place_types(place_types)
+    quantity_net.incremental_enabling = False
+    quantity_net.count_screening = count_screening
+    quantity_net.freeze()
+
+    for i in range(MARKED_TRANSITIONS):
+        for place_name, object_type in [(f"p{i}_order", Order), (f"p{i}_item", Item)]:
+            obj = object_type(timestamp=None)
+            obj.status = StatusActive()
+            quantity_net.identify_node(place_name, "place").add_token(obj)
+    return quantity_net
+
+
+def run(number_of_transitions: int, count_screening: bool) -> tuple[float, int]:
+    """Returns the run time in seconds and the number of transitions with enabled bindings."""
+    quantity_net = create_net(number_of_transitions=number_of_transitions, count_screening=count_screening)
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        enabled_bindings = quantity_net.get_enabled_bindings_all_transitions_for_input_types()
+    return time.perf_counter() - start, len(enabled_bindings)
+
+
+def main():
+    print(f"{STEPS} steps, {MARKED_TRANSITIONS} transitions with marked input places")
+    print(f"{'transitions':>12} {'enabled':>8} {'all [s]':>8} {'screened [s]':>13}")
+    for number_of_transitions in TRANSITIONS:
+        run_time_all, number_enabled = run(number_of_transitions=number_of_transitions, count_screening=False)
+        run_time_screened, _ = run(number_of_transitions=number_of_transitions, count_screening=True)
+        print(f"{number_of_transitions:>12} {number_enabled:>8} {run_time_all:>8.3f} {run_time_screened:>13.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Latency of starting and ending the firing of a transition identified by its label, as done for every event.
+
+The net consists of independent labelled transitions, each with one input and one output place. Every firing
+identifies the transition by its label, starts the firing and ends it through the returned execution, after which the
+object is moved back to the input place.
+
+Run from the repository root: python -m benchmarks.event_start_benchmark
+"""
+import time
+
+from qel_simulation.components.quantity_net import QuantityNet
+from qel_simulation.simulation.object import create_object_type, StatusActive, BindingFunction
+
+TRANSITIONS = [10, 100, 1000]
+FIRINGS = 2000
+
+Order = create_object_type(object_type_name="Benchmark Order")
+
+
+def create_net(number_of_transitions: int) -> QuantityNet:
+    arcs = []
+    place_types = {}
+    for i in range(number_of_transitions):
+        arcs.extend([(f"p{i}_in", f"t{i}"), (f"t{i}", f"p{i}_out")])
+        place_types.update({f"p{i}_in": Order, f"p{i}_out": Order})
+    quantity_net = QuantityNet(name="benchmark net")
+    quantity_net.set_net_structure(arcs=arcs)
+    quantity_net.set_place_types(place_types)
+    quantity_net.set_transition_labels({f"t{i}": f"Activity {i}" for i in range(number_of_transitions)})
+    for i in range(number_of_transitions):
+        order = Order(timestamp=None)
+        order.status = StatusActive()
+        quantity_net.identify_node(f"p{i}_in", "place").add_token(order)
+    return quantity_net
+
+
+def main():
+    print(f"{FIRINGS} firings of transitions identified by label")
+    print(f"{'transitions':>12} {'latency [us]':>13}")
+    for number_of_transitions in TRANSITIONS:
+        quantity_net = create_net(number_of_transitions=number_of_transitions)
+        firings = []
+        for i in range(FIRINGS):
+            j = i * 7919 % number_of_transitions
+            input_place = quantity_net.identify_node(f"p{j}_in", "place")
+            output_place = quantity_net.identify_node(f"p{j}_out", "place")
+            firings.append((f"Activity {j}", input_place, output_place))
+
+        run_time = 0
+        for label, input_place, output_place in firings:
+            binding_function = BindingFunction({Order: set(input_place.marking.distinct_elements())})
+            start = time.perf_counter()
+            execution = quantity_net.start_firing_transition(transition=label, binding_function=binding_function)
+            quantity_net.end_firing_transition(execution=execution.transition_execution)
+            run_time += time.perf_counter() - start
+            output_place.remove_tokens(binding_function[Order])
+            input_place.add_tokens(binding_function[Order])
+        print(f"{number_of_transitions:>12} {run_time / FIRINGS * 1e6:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Compares the heap-backed ExecutionQueue with the previous list-based queue and the calendar queue.
+
+The queues are filled with a number of pending object creations and then run a hold model: in every step the time is
+advanced to the next scheduled item, all current items are removed and the same number of new items is scheduled.
+The heap and the calendar queue are compared on a continuous load, with exponentially distributed distinct execution
+times, and on a dense arrival load, which schedules the items on a one-second grid, as arrival rates with large lambdas
+do, so that many items share the same execution time. The per-step times include creating the queue items from
+instructions, which both queues share.
+
+Run from the repository root: python -m benchmarks.execution_queue_benchmark
+"""
+import datetime
+import gc
+import time
+
+import numpy as np
+
+from qel_simulation.simulation.calendar_queue import CalendarExecutionQueue
+from qel_simulation.simulation.execution_queue import ExecutionQueue, QueueItem
+from qel_simulation.simulation.instructions import InstructionObjectCreation
+from qel_simulation.simulation.object import create_object_type
+from qel_simulation.simulation.queue_config import QueueConfig
+
+PENDING_ITEMS = [1000, 10000, 100000]
+STEPS = 200
+DENSE_PENDING_ITEMS = [10000, 100000]
+DENSE_STEPS = 2000
+
+BenchmarkObject = create_object_type(object_type_name="Benchmark Object")
+
+
+class ListExecutionQueue(ExecutionQueue):
+    """Previous implementation of the execution queue, keeping all items in a plain list."""
+
+    def __init__(self, config: QueueConfig):
+        super().__init__(config)
+        self._queue = []
+
+    @property
+    def queue(self):
+        return sorted(self._queue, key=lambda x: x.execution_time_us)
+
+    def add_entry_to_queue(self, queue_item: QueueItem):
+        self._queue.append(queue_item)
+
+    def update_time(self):
+        if self._queue:
+            self._current_time_us = min([item.execution_time_us for item in self._queue])
+
+    def get_current_items(self) -> set[QueueItem]:
+        return {item for item in self._queue if item.execution_time_us == self.time_us}
+
+    def get_and_remove_current_items(self) -> set[QueueItem]:
+        items = self.get_current_items()
+        self.remove_items_from_queue(items)
+        return items
+
+    def remove_items_from_queue(self, items: set[QueueItem]):
+        self._queue = list(set(self._queue) - items)
+
+
+def create_instruction(rng: np.random.Generator) -> InstructionObjectCreation:
+    return InstructionObjectCreation(timedelta=datetime.timedelta(minutes=float(rng.exponential(scale=60))),
+                                     object_type=BenchmarkObject)
+
+
+def create_dense_instruction(rng: np.random.Generator) -> InstructionObjectCreation:
+    return InstructionObjectCreation(timedelta=datetime.timedelta(seconds=int(rng.exponential(scale=600))),
+                                     object_type=BenchmarkObject)
+
+
+def run_hold_model(queue: ExecutionQueue, pending_items: int, steps: int, seed: int = 42,
+                   create=create_instruction) -> dict[str, float]:
+    rng = np.random.default_rng(seed=seed)
+    gc.collect()  # garbage of previous runs must not be collected during the measurement
+
+    start = time.perf_counter()
+    for _ in range(pending_items):
+        queue.add_instruction(create(rng))
+    fill_time = time.perf_counter() - start
+
+    queue.statistics.reset()
+    start = time.perf_counter()
+    for _ in range(steps):
+        queue.update_time()
+        items = queue.get_and_remove_current_items()
+        for _ in items:
+            queue.add_instruction(create(rng))
+    hold_time = time.perf_counter() - start
+
+    return {"fill_s": fill_time, "step_ms": hold_time / steps * 1000,
+            "enqueue_per_s": queue.statistics.enqueue_throughput, "dequeue_per_s": queue.statistics.dequeue_throughput,
+            "resizes": queue.statistics.resizes}
+
+
+def run_storage_hold_model(queue: ExecutionQueue, pending_items: int, steps: int, dense: bool,
+                           seed: int = 42) -> float:
+    """Hold model on the storage of the queue only: queue items are created before and rescheduled instead of being
+    created from instructions. Returns the time per moved item in microseconds."""
+    rng = np.random.default_rng(seed=seed)
+    if dense:
+        delays = (rng.exponential(scale=600, size=pending_items + 200 * steps).astype(np.int64) * 1000000).tolist()
+    else:
+        delays = rng.exponential(scale=3600e6, size=pending_items + 200 * steps).astype(np.int64).tolist()
+    delays = iter(delays)
+    for _ in range(pending_items):
+        queue.add_entry_to_queue(QueueItem(queue.time_us + next(delays)))
+    gc.collect()
+
+    moved_items = 0
+    start = time.perf_counter()
+    for _ in range(steps):
+        queue.update_time()
+        items = queue.get_and_remove_current_items()
+        for item in items:
+            item.execution_time_us = queue.time_us + next(delays)
+            queue.add_entry_to_queue(item)
+        moved_items += len(items)
+    return (time.perf_counter() - start) / moved_items * 1e6
+
+
+def create_calendar_queue(name: str) -> CalendarExecutionQueue:
+    config = QueueConfig(name=name)
+    config.queue_type = "calendar"
+    return CalendarExecutionQueue(config)
+
+
+def main():
+    print(f"{'pending':>8} {'queue':>8} {'fill [s]':>10} {'step [ms]':>10}")
+    for pending_items in PENDING_ITEMS:
+        results = {}
+        for name, queue_class in [("list", ListExecutionQueue), ("heap", ExecutionQueue)]:
+            queue = queue_class(QueueConfig(name=f"{name} queue"))
+            results[name] = run_hold_model(queue=queue, pending_items=pending_items, steps=STEPS)
+            print(f"{pending_items:>8} {name:>8} {results[name]['fill_s']:>10.3f} {results[name]['step_ms']:>10.3f}")
+        print(f"{'':>8} {'speedup per step':>30}: {results['list']['step_ms'] / results['heap']['step_ms']:.1f}x")
+
+    print()
+    print("heap and calendar queue on continuous and dense arrival loads")
+    print(f"{'load':>10} {'pending':>8} {'queue':>8} {'fill [s]':>10} {'step [ms]':>10} {'enqueue/s':>12} "
+          f"{'dequeue/s':>12} {'resizes':>8}")
+    for load, create in [("continuous", create_instruction), ("dense", create_dense_instruction)]:
+        for pending_items in DENSE_PENDING_ITEMS:
+            for name, queue in [("heap", ExecutionQueue(QueueConfig(name="heap queue"))),
+                                ("calendar", create_calendar_queue(name="calendar queue"))]:
+                result = run_hold_model(queue=queue, pending_items=pending_items, steps=DENSE_STEPS, create=create)
+                print(f"{load:>10} {pending_items:>8} {name:>8} {result['fill_s']:>10.3f} {result['step_ms']:>10.3f} "
+                      f"{result['enqueue_per_s']:>12.0f} {result['dequeue_per_s']:>12.0f} {result['resizes']:>8}")
+
+    print()
+    print("queue storage only, items are rescheduled instead of created from instructions")
+    print(f"{'load':>10} {'pending':>8} {'heap [us/item]':>15} {'calendar [us/item]':>19}")
+    for load, dense in [("continuous", False), ("dense", True)]:
+        for pending_items in DENSE_PENDING_ITEMS:
+            heap_time = run_storage_hold_model(queue=ExecutionQueue(QueueConfig(name="heap queue")),
+                                               pending_items=pending_items, steps=DENSE_STEPS, dense=dense)
+            calendar_time = run_storage_hold_model(queue=create_calendar_queue(name="calendar queue"),
+                                                   pending_items=pending_items, steps=DENSE_STEPS, dense=dense)
+            print(f"{load:>10} {pending_items:>8} {heap_time:>15.2f} {calendar_time:>19.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Enumeration of enabled bindings in a frozen net compared with a net determining structural views on every access.
+
+The net consists of independent transitions with an input place per object type and a connected collection point.
+Every step enumerates the enabled bindings of all transitions without incremental enabling and checks whether the
+first binding of every transition is enabled, as done before firing. With small markings, the run time is dominated
+by accessing the structural views of the transitions, e.g., their input places per object type.
+
+Run from the repository root: python -m benchmarks.freeze_benchmark
+"""
+import time
+
+from qel_simulation.components.quantity_net import QuantityNet
+from qel_simulation.simulation.object import create_object_type, StatusActive
+
+TRANSITIONS = 50
+OBJECTS_PER_PLACE = 2
+STEPS = 200
+
+Order = create_object_type(object_type_name="Benchmark Order")
+Item = create_object_type(object_type_name="Benchmark Item")
+Employee = create_object_type(object_type_name="Benchmark Employee")
+
+
+def create_net() -> QuantityNet:
+    arcs = []
+    place_types = {}
+    for i in range(TRANSITIONS):
+        arcs.extend([(f"p{i}_order", f"t{i}"), (f"p{i}_item", f"t{i}"), (f"p{i}_employee", f"t{i}"),
+                     (f"t{i}", f"p{i}_done"), (f"t{i}", f"cp{i}")])
+        place_types.update({f"p{i}_order": Order, f"p{i}_item": Item, f"p{i}_employee": Employee,
+                            f"p{i}_done": Order})
+    quantity_net = QuantityNet(name="benchmark net")
+    quantity_net.set_net_structure(arcs=arcs)
+    quantity_net.set_place_types(place_types)
+    quantity_net.incremental_enabling = False
+
+    for place in quantity_net.object_places:
+        if place.name.endswith("_done"):
+            continue
+        objects = [place.object_type(timestamp=None) for _ in range(OBJECTS_PER_PLACE)]
+        for obj in objects:
+            obj.status = StatusActive()
+        place.add_tokens(objects)
+    return quantity_net
+
+
+def run(frozen: bool) -> tuple[float, int]:
+    """Returns the run time in seconds and the number of enabled bindings."""
+    quantity_net = create_net()
+    if frozen:
+        quantity_net.freeze()
+    else:
+        pass
+
+    number_enabled_bindings = 0
+    start = time.perf_counter()
+    for _ in range(STEPS):
+        for transition in quantity_net.transitions:
+            enabled_bindings = transition.determine_new_binding_functions()
+            number_enabled_bindings += len(enabled_bindings)
+            _ = transition.enabled(binding_function=enabled_bindings[0], only_input=True)
+    return time.perf_counter() - start, number_enabled_bindings
+
+
+def main():
+    print(f"{TRANSITIONS} transitions, {OBJECTS_PER_PLACE} objects per input place, {STEPS} steps")
+    print(f"{'structure':>10} {'time [s]':>9} {'bindings':>9}")
+    for name, frozen in [("unfrozen", False), ("frozen", True)]:
+        run_time, number_enabled_bindings = run(frozen=frozen)
+        print(f"{name:>10} {run_time:>9.3f} {number_enabled_bindings:>9}")
+
+
+if __name__ == "__main__":
+    main()
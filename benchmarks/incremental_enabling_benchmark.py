@@ -0,0 +1,81 @@
+"""Incremental enabling compared with the enumeration of all transitions in every simulation step.
+
+The net consists of independent transitions, each with two input places of different object types and one output
+place. Every step determines the enabled bindings of all transitions, fires one of them and returns its objects to
+the input places, so that only the places of a single transition change per step.
+
+Run from the repository root: python -m benchmarks.incremental_enabling_benchmark
+"""
+import time
+
+import numpy as np
+
+from qel_simulation.components.quantity_net import QuantityNet
+from qel_simulation.simulation.object import create_object_type, StatusActive
+
+TRANSITIONS = 250
+OBJECTS_PER_PLACE = 4
+STEPS = 500
+
+Order = create_object_type(object_type_name="Benchmark Order")
+Item = create_object_type(object_type_name="Benchmark Item")
+
+
+def create_net() -> QuantityNet:
+    arcs = []
+    place_types = {}
+    for i in range(TRANSITIONS):
+        arcs.extend([(f"p{i}_order", f"t{i}"), (f"p{i}_item", f"t{i}"), (f"t{i}", f"p{i}_done")])
+        place_types.update({f"p{i}_order": Order, f"p{i}_item": Item, f"p{i}_done": Order})
+    quantity_net = QuantityNet(name="benchmark net")
+    quantity_net.set_net_structure(arcs=arcs)
+    quantity_net.set_place_types(place_types)
+
+    for place in quantity_net.object_places:
+        if place.name.endswith("_done"):
+            continue
+        objects = [place.object_type(timestamp=None) for _ in range(OBJECTS_PER_PLACE)]
+        for obj in objects:
+            obj.status = StatusActive()
+        place.add_tokens(objects)
+    return quantity_net
+
+
+def run(incremental_enabling: bool) -> tuple[float, int]:
+    """Returns the run time of the determination of enabled bindings in seconds and the number of enabled bindings."""
+    rng = np.random.default_rng(seed=42)
+    quantity_net = create_net()
+    quantity_net.incremental_enabling = incremental_enabling
+    transitions_by_name = {transition.name: transition for transition in quantity_net.transitions}
+
+    enabling_time = 0
+    number_enabled_bindings = 0
+    for _ in range(STEPS):
+        start = time.perf_counter()
+        enabled_bindings = quantity_net.get_enabled_bindings_all_transitions_for_input_types()
+        enabling_time += time.perf_counter() - start
+        number_enabled_bindings += sum(len(bindings) for bindings in enabled_bindings.values())
+
+        # fire a random transition and return its objects to the input places
+        transition = transitions_by_name[f"t{rng.integers(TRANSITIONS)}"]
+        binding_function = enabled_bindings[transition][0]
+        transition.execute_complete_firing(binding_function=binding_function)
+        for object_type, objects in binding_function.items():
+            for place in transition.get_output_places_of_otype(object_type=object_type):
+                place.remove_tokens(objects)
+            for place in transition.get_input_places_of_otype(object_type=object_type):
+                place.add_tokens(objects)
+
+    return enabling_time, number_enabled_bindings
+
+
+def main():
+    print(f"{TRANSITIONS} transitions, {OBJECTS_PER_PLACE} objects per input place, {STEPS} steps")
+    print(f"{'enabling':>12} {'time [s]':>9} {'steps/s':>9} {'bindings':>9}")
+    for name, incremental_enabling in [("full", False), ("incremental", True)]:
+        enabling_time, number_enabled_bindings = run(incremental_enabling=incremental_enabling)
+        print(f"{name:>12} {enabling_time:>9.3f} {STEPS / enabling_time:>9.0f} {number_enabled_bindings:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Enumeration of bindings with an object guard compared with enumeration through a join guard.
+
+The transition consumes one order and one parcel, a binding is only enabled if the parcel refers to the order through
+its o2o relationships. Without join guard, all pairs of orders and parcels are generated and rejected by the object
+guard; with the join guard 'Benchmark Parcel o2o Benchmark Order', the related order of every parcel is looked up in a
+hash index of the available orders.
+
+Run from the repository root: python -m benchmarks.join_guard_benchmark
+"""
+import time
+
+from qel_simulation.components.quantity_net import QuantityNet
+from qel_simulation.qnet_elements.transition import Transition
+from qel_simulation.simulation.object import create_object_type, StatusActive
+
+OBJECTS = [50, 100, 200, 400]
+REPETITIONS = 5
+
+Order = create_object_type(object_type_name="Benchmark Order")
+Parcel = create_object_type(object_type_name="Benchmark Parcel")
+
+
+def create_transition(number_of_objects: int, join_guard: bool) -> Transition:
+    quantity_net = QuantityNet(name="benchmark net")
+    quantity_net.set_net_structure(arcs=[("p_order", "t"), ("p_parcel", "t"), ("t", "p_done")])
+    quantity_net.set_place_types({"p_order": Order, "p_parcel": Parcel, "p_done": Order})
+    orders = [Order(timestamp=None) for _ in range(number_of_objects)]
+    parcels = [Parcel(timestamp=None, o2o={order: "order"}) for order in orders]
+    for obj in orders + parcels:
+        obj.status = StatusActive()
+    quantity_net.identify_node("p_order", "place").add_tokens(orders)
+    quantity_net.identify_node("p_parcel", "place").add_tokens(parcels)
+
+    quantity_net.set_object_guard("t", lambda binding_function: all(
+        order in parcel.o2o for parcel in binding_function[Parcel] for order in binding_function[Order]))
+    if join_guard:
+        quantity_net.set_join_guards({"t": ["Benchmark Parcel o2o Benchmark Order"]})
+    else:
+        pass
+    return quantity_net.identify_node("t", "transition")
+
+
+def main():
+    print(f"{REPETITIONS} enumerations of all enabled bindings")
+    print(f"{'objects':>8} {'bindings':>9} {'object guard [s]':>17} {'join guard [s]':>15}")
+    for number_of_objects in OBJECTS:
+        run_times = []
+        for join_guard in [False, True]:
+            transition = create_transition(number_of_objects=number_of_objects, join_guard=join_guard)
+            start = time.perf_counter()
+            for _ in range(REPETITIONS):
+                enabled_bindings = transition.determine_new_binding_functions()
+            run_times.append(time.perf_counter() - start)
+        print(f"{number_of_objects:>8} {len(enabled_bindings):>9} {run_times[0]:>17.3f} {run_times[1]:>15.4f}")
+
+
+if __name__ == "__main__":
+    main()
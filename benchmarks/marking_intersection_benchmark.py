@@ -0,0 +1,57 @@
+"""Repeated enabling checks with the cached marking intersection compared with determining it on every check.
+
+The transition has three input places of the same object type holding the same objects, so that a binding is only
+enabled if its object is part of the marking of all three places. Between marking changes, the enabling of every
+binding is checked repeatedly, as done for the cached bindings of a transition before firing.
+
+Run from the repository root: python -m benchmarks.marking_intersection_benchmark
+"""
+import time
+
+from qel_simulation.components.quantity_net import QuantityNet
+from qel_simulation.qnet_elements.transition import Transition
+from qel_simulation.simulation.object import create_object_type, StatusActive, BindingFunction
+
+OBJECTS = [10, 100, 1000]
+CHECKS = 2000
+
+Order = create_object_type(object_type_name="Benchmark Order")
+
+
+def create_transition(number_of_objects: int) -> Transition:
+    quantity_net = QuantityNet(name="benchmark net")
+    quantity_net.set_net_structure(arcs=[("p_1", "t"), ("p_2", "t"), ("p_3", "t"), ("t", "p_done")])
+    quantity_net.set_place_types({"p_1": Order, "p_2": Order, "p_3": Order, "p_done": Order})
+    objects = [Order(timestamp=None) for _ in range(number_of_objects)]
+    for obj in objects:
+        obj.status = StatusActive()
+    for place_name in ["p_1", "p_2", "p_3"]:
+        quantity_net.identify_node(place_name, "place").add_tokens(objects)
+    quantity_net.freeze()
+    return quantity_net.identify_node("t", "transition")
+
+
+def check_enabling(transition: Transition, binding_functions: list[BindingFunction], cached: bool) -> float:
+    start = time.perf_counter()
+    for i in range(CHECKS):
+        if cached:
+            pass
+        else:
+            transition._marking_intersection_cache.clear()
+        _ = transition.enabled(binding_function=binding_functions[i % len(binding_functions)], only_input=True)
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{CHECKS} enabling checks")
+    print(f"{'objects':>8} {'uncached [s]':>13} {'cached [s]':>11}")
+    for number_of_objects in OBJECTS:
+        transition = create_transition(number_of_objects=number_of_objects)
+        binding_functions = transition.take(k=10)
+        uncached_time = check_enabling(transition=transition, binding_functions=binding_functions, cached=False)
+        cached_time = check_enabling(transition=transition, binding_functions=binding_functions, cached=True)
+        print(f"{number_of_objects:>8} {uncached_time:>13.3f} {cached_time:>11.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Memory and throughput of an execution queue holding one million items.
+
+Compares the slotted queue items with dict-backed items as used before, and the dispatch of items through the
+handler table with the previous isinstance chain.
+
+Run from the repository root: python -m benchmarks.queue_item_benchmark
+"""
+import datetime
+import time
+import tracemalloc
+from collections import Counter
+
+import numpy as np
+
+from qel_simulation.simulation.clock import datetime_to_us
+from qel_simulation.simulation.execution_queue import (ExecutionQueue, QueueItem, ObjectCreation, StartEvent, EndEvent,
+                                                       ObjectStatusChange, ObjectAttributeChange,
+                                                       ObjectQuantityChange)
+from qel_simulation.simulation.object import create_object_type
+from qel_simulation.simulation.queue_config import QueueConfig
+
+ITEMS = 1000000
+
+BenchmarkObject = create_object_type(object_type_name="Benchmark Object")
+
+
+class DictObjectCreation:
+    """Object creation item without __slots__, as the queue items were before."""
+
+    item_type = "object_creation"
+
+    def __init__(self, execution_time: int, object_type, initial_attributes: dict = None, quantities: Counter = None,
+                 location=None, add_to_binding: bool = False, schedule_type=None, o2o: dict = None):
+        self.execution_time_us = execution_time
+        self.object_type = object_type
+        self.initial_attributes = initial_attributes if initial_attributes else {}
+        self.initial_quantities = quantities if quantities else Counter()
+        self.o2o = o2o if o2o else {}
+        self.location = location if location else None
+        self.add_to_binding = add_to_binding if add_to_binding else False
+        self.schedule_type = schedule_type
+
+
+def create_items(item_class, execution_times: np.ndarray) -> list:
+    return [item_class(execution_time=int(execution_time), object_type=BenchmarkObject)
+            for execution_time in execution_times]
+
+
+def measure_memory(item_class, execution_times: np.ndarray) -> float:
+    """Returns the memory of a heap queue holding the items in MB."""
+    tracemalloc.start()
+    queue = ExecutionQueue(QueueConfig(name="memory queue"))
+    for item in create_items(item_class, execution_times):
+        queue.add_entry_to_queue(item)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return memory / 2 ** 20
+
+
+def measure_throughput(item_class, execution_times: np.ndarray) -> tuple[float, float]:
+    """Returns the enqueued and dequeued items per second."""
+    items = create_items(item_class, execution_times)
+    queue = ExecutionQueue(QueueConfig(name="throughput queue"))
+
+    start = time.perf_counter()
+    for item in items:
+        queue.add_entry_to_queue(item)
+    enqueue_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    while len(queue):
+        queue.update_time()
+        queue.get_and_remove_current_items()
+    dequeue_time = time.perf_counter() - start
+    return len(items) / enqueue_time, len(items) / dequeue_time
+
+
+def dispatch_isinstance(item: QueueItem, counter: Counter):
+    if isinstance(item, ObjectCreation):
+        counter["object_creation"] += 1
+    elif isinstance(item, StartEvent):
+        counter["start_event"] += 1
+    elif isinstance(item, EndEvent):
+        counter["end_event"] += 1
+    elif isinstance(item, ObjectStatusChange):
+        counter["object_status_change"] += 1
+    elif isinstance(item, ObjectAttributeChange):
+        counter["object_attribute_change"] += 1
+    elif isinstance(item, ObjectQuantityChange):
+        counter["object_quantity_change"] += 1
+    else:
+        raise ValueError("Queue item is of unknown type.")
+
+
+def create_counting_handler(counter: Counter, item_type: str):
+    def handler(item: QueueItem):
+        counter[item_type] += 1
+    return handler
+
+
+def measure_dispatch(items: list[QueueItem]) -> tuple[float, float]:
+    """Returns the dispatched items per second for the isinstance chain and the handler table."""
+    counter = Counter()
+    start = time.perf_counter()
+    for item in items:
+        dispatch_isinstance(item, counter)
+    isinstance_time = time.perf_counter() - start
+
+    handlers = {item_type: create_counting_handler(counter, item_type)
+                for item_type in ["object_creation", "start_event", "end_event", "object_status_change",
+                                  "object_attribute_change", "object_quantity_change"]}
+    start = time.perf_counter()
+    for item in items:
+        handler = handlers.get(item.item_type)
+        if handler:
+            handler(item)
+        else:
+            raise ValueError("Queue item is of unknown type.")
+    table_time = time.perf_counter() - start
+    return len(items) / isinstance_time, len(items) / table_time
+
+
+def main():
+    rng = np.random.default_rng(seed=42)
+    start_us = datetime_to_us(datetime.datetime(year=2019, month=10, day=12))
+    execution_times = start_us + rng.integers(low=0, high=365 * 24 * 3600, size=ITEMS) * 1000000
+
+    print(f"queue with {ITEMS} object creations")
+    print(f"{'items':>8} {'memory [MB]':>12} {'enqueue/s':>12} {'dequeue/s':>12}")
+    for name, item_class in [("dict", DictObjectCreation), ("slots", ObjectCreation)]:
+        memory = measure_memory(item_class, execution_times)
+        enqueue_throughput, dequeue_throughput = measure_throughput(item_class, execution_times)
+        print(f"{name:>8} {memory:>12.1f} {enqueue_throughput:>12.0f} {dequeue_throughput:>12.0f}")
+
+    print()
+    # the last item type is checked last by the isinstance chain
+    items = [ObjectQuantityChange(execution_time=int(execution_time), object=None, quantity_changes=Counter())
+             for execution_time in execution_times]
+    isinstance_throughput, table_throughput = measure_dispatch(items)
+    print(f"dispatch of {ITEMS} quantity changes")
+    print(f"{'isinstance':>10}: {isinstance_throughput:>12.0f} items/s")
+    print(f"{'table':>10}: {table_throughput:>12.0f} items/s")
+
+
+if __name__ == "__main__":
+    main()
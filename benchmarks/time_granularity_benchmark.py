@@ -0,0 +1,57 @@
+"""Effect of the time granularity of the execution queue on the inventory management example.
+
+The example is simulated for the same period of time with different granularities. For each granularity, the number
+of simulation steps, the run time and the shift of the executed items from their scheduled execution time (mean and
+maximum snap error) are reported. Every run uses a fresh process, as the example configuration keeps the state of
+its object types on module level.
+
+Run from the repository root: python -m benchmarks.time_granularity_benchmark
+"""
+import contextlib
+import datetime
+import io
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+SIMULATED_TIME = datetime.timedelta(days=3)
+GRANULARITIES = [datetime.timedelta(0), datetime.timedelta(seconds=10), datetime.timedelta(minutes=1),
+                 datetime.timedelta(minutes=10), datetime.timedelta(hours=1)]
+
+
+def run_example(granularity: datetime.timedelta) -> dict:
+    from examples.example_inventory_management.example_sim_config import config
+    from qel_simulation.simulation.simulation import Simulation
+
+    config.max_simulation_time = SIMULATED_TIME
+    config.max_execution_steps = 100000
+    config.queue_config.time_granularity = granularity
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulation = Simulation(name="granularity benchmark", config=config)
+        start = time.perf_counter()
+        simulation.start_simulation()
+        elapsed_time = time.perf_counter() - start
+    statistics = simulation.queue.statistics
+    return {"steps": simulation.step_counter, "events": simulation.number_of_events, "run_time_s": elapsed_time,
+            "snapped": statistics.snapped, "dequeued": statistics.dequeued,
+            "mean_snap_error": statistics.mean_snap_error, "max_snap_error": statistics.max_snap_error}
+
+
+def main():
+    print(f"inventory management example, {SIMULATED_TIME.days} days simulated")
+    print(f"{'granularity':>12} {'steps':>6} {'reduction':>10} {'events':>7} {'time [s]':>9} {'snapped':>13} "
+          f"{'mean error':>15} {'max error':>15}")
+    baseline_steps = None
+    for granularity in GRANULARITIES:
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            result = executor.submit(run_example, granularity).result()
+        baseline_steps = baseline_steps if baseline_steps else result["steps"]
+        reduction = 1 - result["steps"] / baseline_steps
+        snapped = f"{result['snapped']}/{result['dequeued']}"
+        print(f"{str(granularity):>12} {result['steps']:>6} {reduction:>10.1%} {result['events']:>7} "
+              f"{result['run_time_s']:>9.2f} {snapped:>13} {str(result['mean_snap_error']):>15} "
+              f"{str(result['max_snap_error']):>15}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1141,8 +1141,7 @@ class DistributePaletteToInventory(Qalculator):
 def prioritise_boxes(transition):
     """When determining the palettes to place into storage, prioritise palettes carrying boxes."""
 
-    all_palettes = transition._input_places_marking_intersection(object_type=Palette)
-    active_palettes = {obj for obj in all_palettes if obj.status_active}
+    active_palettes = set(transition.get_active_input_objects(object_type=Palette))
     if active_palettes:
         pass
     else:
@@ -1167,9 +1166,8 @@ def prioritise_boxes(transition):
         maximum_objects = transition.maximum_binding_function_quantities[object_type]
         # print(f"Object type: {object_type.object_type_name}, required: {required_objects}, min: {minimum_objects}, max: {maximum_objects}")
 
-        # get objects that are part of all input places of that type
-        marking_intersection = transition._input_places_marking_intersection(object_type=object_type)
-        marking_intersection_active = {obj for obj in marking_intersection if obj.status_active}
+        # get active objects that are part of all input places of that type
+        marking_intersection_active = set(transition.get_active_input_objects(object_type=object_type))
         # print(f"Marking intersection of {object_type.object_type_name}: {marking_intersection_active}")
 
         # create all combinations of subsets of available objects required length
@@ -1370,20 +1368,10 @@ class RegisterIncomingCustomerOrder(Event):
 # none
 
 ## Guards
-def object_guard_t5(binding_function: BindingFunction) -> bool:
-    """Transition is only enabled if the order is accepted and if binding refers to corresponding Customer Order and
-    RemainingCO objects."""
-    rco = list(binding_function[RemainingCO])[0]
-    co = list(binding_function[CustomerOrder])[0]
-
-    # order is accepted
+def object_filter_t5(co: CustomerOrder) -> bool:
+    """Transition is only enabled if the order is accepted. That the binding refers to corresponding Customer Order and
+    RemainingCO objects is ensured by the join guard 'Remaining Customer Order o2o Customer Order'."""
     if co.customer_order_accepted:
-        pass
-    else:
-        return False
-
-    # rco refers to co
-    if co in rco.o2o.keys():
         return True
     else:
         return False
@@ -1707,19 +1695,7 @@ class PickAndPackItemsForCustomerOrder(Event):
 # none
 
 ## Guards
-def object_guard_t6(binding_function: BindingFunction) -> bool:
-    """Transition is only enabled if binding refers to the same employee who picked items."""
-    # identify parcel and employee
-    parcel_ot = [ot for ot in binding_function.keys() if ot.object_type_name == "Parcel"][0]
-    parcel = list(binding_function[parcel_ot])[0]
-    emp = list(binding_function[WarehouseEmployees])[0]
-
-    if emp in parcel.o2o.keys():
-        return True
-    else:
-        return False
-
-
+# the parcel is sent by the employee who picked its items, ensured by the join guard 'Parcel o2o Warehouse Employee'
 ## Quantity Calculator
 # none
 
@@ -1731,12 +1707,9 @@ def object_guard_t6(binding_function: BindingFunction) -> bool:
 # none
 
 ## Guards
-def object_guard_t8(binding_function: BindingFunction) -> bool:
+def object_filter_t8(co: CustomerOrder) -> bool:
     """Transition is only enabled if involved customer order has fully settled demand."""
 
-    # identify customer order
-    co = list(binding_function[CustomerOrder])[0]
-
     if "Full Order" in co.o2o.values() or "Remaining Order" in co.o2o.values():
         return True
     else:
@@ -1754,12 +1727,10 @@ def object_guard_t8(binding_function: BindingFunction) -> bool:
 #none
 
 ## Guards
-def object_guard_t9(binding_function: BindingFunction) -> bool:
+def object_filter_t9(co: CustomerOrder) -> bool:
     """Transition is only enabled if involved customer order only has partially settled demand which has not yet been
     completed."""
 
-    # identify customer order
-    co = list(binding_function[CustomerOrder])[0]
     # print(co.o2o.values())
 
     if ("Full Order" not in co.o2o.values()) and ("Remaining Order" not in co.o2o.values()):
@@ -1779,9 +1750,8 @@ def object_guard_t9(binding_function: BindingFunction) -> bool:
 # none
 
 ## Guards
-def object_guard_t10(binding_function: BindingFunction) -> bool:
+def object_filter_t10(co: CustomerOrder) -> bool:
     """Transition is only enabled if involved customer order has been cancelled."""
-    co = list(binding_function[CustomerOrder])[0]
     return not co.customer_order_accepted
 
 
@@ -1815,11 +1785,10 @@ quantity_guards = {"t3": quantity_guard_t3,
                    "t5": QuardT5()}
 
 object_guards = {"t1": object_guard_t1,
-                 "t5": object_guard_t5, # typical example for object guard
-                 "t6": object_guard_t6,
-                 "t8": object_guard_t8,
-                 "t9": object_guard_t9,
-                 "t10": object_guard_t10}
+                 "t5": {"Customer Order": object_filter_t5}, # typical example for object filter
+                 "t8": {"Customer Order": object_filter_t8},
+                 "t9": {"Customer Order": object_filter_t9},
+                 "t10": {"Customer Order": object_filter_t10}}
 
 qualculators = {"t11": InitialisedReplenishments(),
                 "t0": ReplenishmentOrderQualculator(),
@@ -1929,6 +1898,8 @@ qnet_conf.silent_transitions = silent_transitions
 qnet_conf.manually_initiated_transitions = {"t10"}
 
 qnet_conf.transition_binding_selection = {"t3": prioritise_boxes}
+qnet_conf.transition_join_guards = {"t5": ["Remaining Customer Order o2o Customer Order"],
+                                    "t6": ["Parcel o2o Warehouse Employee"]}
 
 qnet_conf.initial_marking_object_types = {LoadingBay: loading_bays,
                                           CustomerOrder: 2,
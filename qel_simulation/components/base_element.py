@@ -78,10 +78,40 @@ class ConnectedElement(BaseElement):
         super().__init__(name=name, label=label, properties=properties)
         self._input_arcs = set()
         self._output_arcs = set()
+        # structural views of the element, only kept while the element is frozen
+        self._structure_cache = None
+
+    @property
+    def frozen(self) -> bool:
+        return self._structure_cache is not None
+
+    def freeze(self):
+        """Keep structural views (arcs, connected elements) as frozensets once determined, until the structure of the
+        element changes or the element is unfrozen."""
+        self._structure_cache = {}
+
+    def unfreeze(self):
+        self._structure_cache = None
+
+    def invalidate_structure_cache(self):
+        if self._structure_cache:
+            self._structure_cache.clear()
+        else:
+            pass
+
+    def _structural_view(self, key, determine_view):
+        if self._structure_cache is None:
+            return determine_view()
+        elif key in self._structure_cache:
+            return self._structure_cache[key]
+        else:
+            view = frozenset(determine_view())
+            self._structure_cache[key] = view
+            return view
 
     @property
     def arcs(self):
-        return self.input_arcs | self.output_arcs
+        return self._structural_view("arcs", lambda: self.input_arcs | self.output_arcs)
 
     @property
     def input_arcs(self) -> set:
@@ -94,29 +124,34 @@ class ConnectedElement(BaseElement):
     @input_arcs.setter
     def input_arcs(self, input_arcs: set[ConnectingElement]):
         self._input_arcs = input_arcs
+        self.invalidate_structure_cache()
 
     @output_arcs.setter
     def output_arcs(self, output_arcs: set[ConnectingElement]):
         self._output_arcs = output_arcs
+        self.invalidate_structure_cache()
 
     @property
     def inputs(self):
         """
         set of all input elements
         """
-        return set([arc.source for arc in self.input_arcs if isinstance(arc.source, ConnectedElement)])
+        return self._structural_view("inputs", lambda: set(
+            [arc.source for arc in self.input_arcs if isinstance(arc.source, ConnectedElement)]))
 
     @property
     def outputs(self):
         """
         set of all output elements
         """
-        return set([arc.target for arc in self.output_arcs if isinstance(arc.target, ConnectedElement)])
+        return self._structural_view("outputs", lambda: set(
+            [arc.target for arc in self.output_arcs if isinstance(arc.target, ConnectedElement)]))
 
     def add_input_arc(self, arc: ConnectingElement):
         if isinstance(arc, ConnectingElement) and not isinstance(arc.source, type(arc.target)):
             if self == arc.target:
                 self._input_arcs.add(arc)
+                self.invalidate_structure_cache()
             else:
                 raise ValueError("Only arcs connected to the elements itsself can be added as input arcs.")
         else:
@@ -127,6 +162,7 @@ class ConnectedElement(BaseElement):
         if isinstance(arc, ConnectingElement) and type(arc.source) is not type(arc.target):
             if self == arc.source:
                 self._output_arcs.add(arc)
+                self.invalidate_structure_cache()
             else:
                 raise ValueError("Only arcs connected to the elements itsself can be added as output arcs.")
         else:
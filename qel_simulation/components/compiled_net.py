@@ -0,0 +1,97 @@
+from typing import Any, Type
+
+import numpy as np
+
+from qel_simulation.qnet_elements.collection_point import CollectionPoint
+from qel_simulation.qnet_elements.object_place import ObjectPlace
+from qel_simulation.qnet_elements.transition import Transition
+from qel_simulation.simulation.object import Object
+
+
+class CompiledNet:
+    """Integer indexed representation of the structure of a quantity net. Places, transitions and collection points
+    are numbered, and the pre and post incidence matrices hold the number of objects a firing of a transition consumes
+    from and produces to every object place, using the minimum number of objects for variable arcs. Together with the
+    number of active tokens per place, kept in an array, transitions that cannot be enabled as one of their input
+    places holds too few active objects are screened out with one vectorized comparison, before the bindings of the
+    remaining transitions are enumerated. The screen is a necessary condition only: transitions passing it may still
+    not be enabled. Transitions with a binding selection function always pass the screen, as the function decides
+    which objects are bound. The compiled net has to be built again after changes to the net structure or the binding
+    specification of its transitions."""
+
+    def __init__(self, quantity_net: Any):
+        self.quantity_net = quantity_net
+        self.places: list[ObjectPlace] = sorted(quantity_net.object_places, key=lambda place: place.name)
+        self.transitions: list[Transition] = sorted(quantity_net.transitions, key=lambda transition: transition.name)
+        self.collection_points: list[CollectionPoint] = sorted(quantity_net.collection_points,
+                                                               key=lambda place: place.name)
+        self.place_index = {place: i for i, place in enumerate(self.places)}
+        self.transition_index = {transition: i for i, transition in enumerate(self.transitions)}
+        self.collection_point_index = {collection_point: i for i, collection_point in enumerate(self.collection_points)}
+
+        # objects consumed from / produced to places per firing, transitions by rows and places by columns
+        self.pre = np.zeros((len(self.transitions), len(self.places)), dtype=np.int64)
+        self.post = np.zeros((len(self.transitions), len(self.places)), dtype=np.int64)
+        # collection points whose counts are updated by the firing of a transition
+        self.collection_point_incidence = np.zeros((len(self.transitions), len(self.collection_points)), dtype=bool)
+        for i, transition in enumerate(self.transitions):
+            for object_type in transition.input_object_types:
+                required_objects = self._required_objects(transition=transition, object_type=object_type)
+                for place in transition.get_input_places_of_otype(object_type=object_type):
+                    self.pre[i, self.place_index[place]] = required_objects
+            for object_type in transition.output_object_types:
+                produced_objects = self._required_objects(transition=transition, object_type=object_type)
+                for place in transition.get_output_places_of_otype(object_type=object_type):
+                    self.post[i, self.place_index[place]] = produced_objects
+            for collection_point in transition.connected_counters:
+                self.collection_point_incidence[i, self.collection_point_index[collection_point]] = True
+
+        # transitions with a binding selection function are never screened out
+        self.screenable = np.array([not transition.binding_selection_function for transition in self.transitions],
+                                   dtype=bool)
+        # the screen only compares the non-zero entries of the pre incidence matrix with the active token counts
+        self._pre_transitions, self._pre_places = np.nonzero(self.pre)
+        self._pre_objects = self.pre[self._pre_transitions, self._pre_places]
+
+        self.active_token_counts = np.zeros(len(self.places), dtype=np.int64)
+        self._seen_marking_versions = [None] * len(self.places)
+        self.screened_out_transitions = 0
+
+    @staticmethod
+    def _required_objects(transition: Transition, object_type: Type[Object]) -> int:
+        """Number of objects of the type bound by every binding of the transition. For variable arcs, this is the
+        minimum number of objects."""
+
+        required_objects = transition.binding_function_quantities[object_type]
+        if required_objects == 0:
+            return transition.minimum_binding_function_quantities[object_type]
+        else:
+            return required_objects
+
+    def update_active_token_counts(self):
+        """Reads the number of active tokens of places whose marking version changed since the last update."""
+
+        for i, place in enumerate(self.places):
+            if place.marking_version == self._seen_marking_versions[i]:
+                pass
+            else:
+                self._seen_marking_versions[i] = place.marking_version
+                self.active_token_counts[i] = len(place.active_tokens)
+
+    def screen(self) -> np.ndarray:
+        """Returns a boolean array that is False for every transition that cannot be enabled, as one of its input places
+        holds fewer active objects than the transition requires."""
+
+        self.update_active_token_counts()
+        unmet = self.active_token_counts[self._pre_places] < self._pre_objects
+        possibly_enabled = np.ones(len(self.transitions), dtype=bool)
+        possibly_enabled[self._pre_transitions[unmet]] = False
+        possibly_enabled |= ~self.screenable
+        return possibly_enabled
+
+    def possibly_enabled_transitions(self) -> set[Transition]:
+        """Transitions passing the screen, only their bindings have to be enumerated."""
+
+        possibly_enabled = self.screen()
+        self.screened_out_transitions += int(len(self.transitions) - possibly_enabled.sum())
+        return {self.transitions[i] for i in np.flatnonzero(possibly_enabled)}
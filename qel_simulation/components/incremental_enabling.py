@@ -0,0 +1,97 @@
+from typing import Any
+
+from qel_simulation.qnet_elements.place import Place
+from qel_simulation.qnet_elements.transition import Transition, BindingFunction
+
+
+class IncrementalEnabling:
+    """Keeps the enabled bindings of the transitions of a quantity net between simulation steps and only recomputes
+    the bindings of transitions whose input places or connected collection points changed their marking since the
+    previous step. Changes are detected by comparing the marking versions of places, which also change if the status
+    of a marked object changes. Transitions whose enabling depends on object attributes or relations (object guards,
+    quantity guards evaluating the binding, binding selection functions) are recomputed in every step. Changed
+    transitions whose input places hold too few active objects are not enumerated if the net screens transitions.
+    The reverse index from places to transitions is built on first use and has to be reset after changes to the net
+    structure or the binding specification of transitions."""
+
+    def __init__(self, quantity_net: Any):
+        self.quantity_net = quantity_net
+        self.recomputed_transitions = 0
+        self.reused_transitions = 0
+        self._built = False
+        self._transitions: list[Transition] = []
+        self._state_dependent_transitions: list[Transition] = []
+        self._transitions_of_place: dict[Place, list[Transition]] = {}
+        self._seen_marking_versions: dict[Place, int] = {}
+        self._enabled_bindings: dict[Transition, list[BindingFunction] | None] = {}
+        self._changed_transitions: set[Transition] = set()
+
+    def reset(self):
+        """Drops the reverse index and all kept bindings, they are rebuilt on the next call."""
+        self._built = False
+        self._transitions = []
+        self._state_dependent_transitions = []
+        self._transitions_of_place = {}
+        self._seen_marking_versions = {}
+        self._enabled_bindings = {}
+        self._changed_transitions = set()
+
+    def _build(self):
+        for transition in self.quantity_net.transitions:
+            if transition.manually_initiated:
+                continue
+            else:
+                pass
+            self._transitions.append(transition)
+            if transition.enabling_depends_on_object_state:
+                self._state_dependent_transitions.append(transition)
+            else:
+                pass
+            for place in transition.input_places | transition.connected_counters:
+                self._transitions_of_place.setdefault(place, []).append(transition)
+
+        self._seen_marking_versions = {place: place.marking_version for place in self._transitions_of_place}
+        self._changed_transitions = set(self._transitions)
+        self._built = True
+
+    def _collect_changed_transitions(self):
+        for place, seen_marking_version in self._seen_marking_versions.items():
+            if place.marking_version == seen_marking_version:
+                pass
+            else:
+                self._seen_marking_versions[place] = place.marking_version
+                self._changed_transitions.update(self._transitions_of_place[place])
+        self._changed_transitions.update(self._state_dependent_transitions)
+
+    def get_enabled_bindings(self) -> dict[Transition: list[BindingFunction]]:
+        """Returns the enabled binding functions per transition with at least one enabled binding."""
+
+        if self._built:
+            pass
+        else:
+            self._build()
+
+        self._collect_changed_transitions()
+        if self._changed_transitions:
+            possibly_enabled_transitions = self.quantity_net.possibly_enabled_transitions()
+        else:
+            possibly_enabled_transitions = set()
+        enabled_input_bindings = {}
+        for transition in self._transitions:
+            if transition in self._changed_transitions:
+                if transition in possibly_enabled_transitions:
+                    self._enabled_bindings[transition] = transition.get_enabled_binding_functions_inputs()
+                else:
+                    self._enabled_bindings[transition] = None
+                self.recomputed_transitions += 1
+            else:
+                self.reused_transitions += 1
+
+            enabled_input_binding_functions = self._enabled_bindings[transition]
+            if enabled_input_binding_functions is not None:
+                enabled_input_bindings[transition] = enabled_input_binding_functions
+            else:
+                pass
+        self._changed_transitions.clear()
+
+        return enabled_input_bindings
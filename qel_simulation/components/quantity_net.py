@@ -2,18 +2,30 @@ import uuid
 from collections import Counter
 from typing import Type, Callable
 
+import numpy as np
+
 from qel_simulation.components.base_element import BaseElement, ConnectedElement
 from qel_simulation.simulation.execution import Execution
 from qel_simulation.simulation.object import Object, create_object_type
 from qel_simulation.qnet_elements.arc import Arc
 from qel_simulation.qnet_elements.collection_point import CollectionPoint, CollectionCounter
 from qel_simulation.qnet_elements.guard import QuantityGuardSmallStock, QuantityGuard
+from qel_simulation.qnet_elements.join_guard import JoinGuard, parse_join_guard
 from qel_simulation.qnet_elements.object_arc import ObjectArc
 from qel_simulation.qnet_elements.object_place import ObjectPlace
 from qel_simulation.qnet_elements.place import Place
 from qel_simulation.qnet_elements.qalculator import Qalculator
 from qel_simulation.qnet_elements.qarc import Qarc
 from qel_simulation.qnet_elements.transition import Transition, BindingFunction, TransitionExecution
+from qel_simulation.components.incremental_enabling import IncrementalEnabling
+from qel_simulation.components.compiled_net import CompiledNet
+
+
+PLACE_ELEMENT_TYPES = ["place", "places", "p", Place, "object place", "objectplace", ObjectPlace, "ObjectPlace",
+                       "object_place", "collection point", "collection points", "collection_point",
+                       "collection_points", "cp", "cps", CollectionPoint]
+TRANSITION_ELEMENT_TYPES = ["transition", "transitions", "t", Transition]
+ARC_ELEMENT_TYPES = ["arc", "a", "objectarc", "object_arc", "ObjectArc", "quantity arc", "quantity_arc", "qa"]
 
 
 # assumption: Provided OCPN is well-formed.
@@ -24,7 +36,22 @@ class QuantityNet(BaseElement):
         self._places = set()
         self._transitions = set()
         self._arcs = set()
+        # object places per object, kept up to date by the places of the net
+        self._object_locations: dict[Object, dict[ObjectPlace, None]] = {}
+        # nodes by name and label and elements by id, kept up to date when elements are added or labelled by the net
+        self._nodes_by_name: dict[str, list[Transition | Place]] = {}
+        self._nodes_by_label: dict[str, list[Transition | Place]] = {}
+        self._elements_by_id: dict[uuid.UUID, list[Transition | Place | Arc]] = {}
         self.executions = []
+        self._executions_by_id: dict[uuid.UUID, Execution] = {}
+        self._executions_by_transition_execution: dict[TransitionExecution, Execution] = {}
+        # only recompute enabled bindings of transitions whose inputs changed between steps
+        self.incremental_enabling = True
+        self.enabling = IncrementalEnabling(quantity_net=self)
+        # skip the enumeration of bindings of transitions whose input places hold too few active objects
+        self.count_screening = True
+        self._compiled_net: CompiledNet | None = None
+        self._frozen = False
 
     @property
     def places(self):
@@ -33,12 +60,16 @@ class QuantityNet(BaseElement):
     @places.setter
     def places(self, places: set[places]):
         if isinstance(places, (set, list, tuple)):
-            if all(isinstance(element, Transition) for element in places):
-                self._transitions = places
+            if all(isinstance(element, Place) for element in places):
+                self._places = set(places)
+                for place in self.object_places:
+                    place.location_index = self._object_locations
+                self.rebuild_indexes()
+                self.reset_enabling()
             else:
-                raise ValueError("Passed transitions must be a set of Transition objects.")
+                raise ValueError("Passed places must be a set of Place objects.")
         else:
-            raise ValueError("Passed transitions must be a set of Transition objects.")
+            raise ValueError("Passed places must be a set of Place objects.")
 
     @property
     def object_types(self):
@@ -69,6 +100,8 @@ class QuantityNet(BaseElement):
         if isinstance(transitions, (set, list, tuple)):
             if all(isinstance(element, Transition) for element in transitions):
                 self._transitions = transitions
+                self.rebuild_indexes()
+                self.reset_enabling()
             else:
                 raise ValueError("Passed transitions must be a set of Transition objects.")
         else:
@@ -84,6 +117,7 @@ class QuantityNet(BaseElement):
         if isinstance(arcs, (set, list, tuple)):
             if all(isinstance(element, Arc) for element in arcs):
                 self._arcs = arcs
+                self.rebuild_indexes()
             else:
                 raise ValueError("Passed arcs must be a set of Arc objects.")
         else:
@@ -238,6 +272,7 @@ class QuantityNet(BaseElement):
                                      f"Define net using method 'set_net_structure'.")
 
             transition_element.label = label
+        self.rebuild_indexes()
 
     def set_collection_point_labels(self, cp_labels: dict[str | CollectionPoint | uuid.UUID, str]):
         """
@@ -270,9 +305,15 @@ class QuantityNet(BaseElement):
                                      f"Define net using method 'set_net_structure'.")
 
             cp_element.label = label
+        self.rebuild_indexes()
 
     def set_object_guard(self, transition: Transition | str | uuid.UUID,
-                         object_guard: Callable[[BindingFunction], bool]):
+                         object_guard: Callable[[BindingFunction], bool] |
+                                       dict[Type[Object] | str, Callable[[Object], bool]]):
+        """
+        Pass object guard for transition. Either a function evaluating a binding function or a dict of object filters,
+        functions evaluating a single object of the object type (or object type name) they are assigned to. Object
+        filters are applied to the available objects before any binding function is built."""
 
         if isinstance(transition, Transition) and transition in self.transitions:
             transition_element = transition
@@ -286,6 +327,17 @@ class QuantityNet(BaseElement):
 
         if callable(object_guard):
             transition_element.set_object_guard(object_guard)
+            self.reset_enabling()
+        elif isinstance(object_guard, dict):
+            for object_type, object_filter in object_guard.items():
+                object_type_element = object_type if isinstance(object_type, type) \
+                    else self.identify_object_type(object_type)
+                if object_type_element in transition_element.input_object_types and callable(object_filter):
+                    transition_element.add_object_filter(object_type=object_type_element, object_filter=object_filter)
+                else:
+                    raise ValueError(f"Object filter for {object_type} of transition {transition} must be a function "
+                                     f"taking a single object of an input object type as input and return a boolean.")
+            self.reset_enabling()
         else:
             raise ValueError(f"Passed object guard for transition {transition} must be a function taking an object of "
                              f"class BindingFunction as input and return a boolean.")
@@ -310,8 +362,10 @@ class QuantityNet(BaseElement):
 
         if callable(quantity_guard):
             transition_element.set_quantity_guard(quantity_guard)
+            self.reset_enabling()
         elif isinstance(quantity_guard, QuantityGuardSmallStock):
             transition_element.set_quantity_guard(quantity_guard)
+            self.reset_enabling()
         else:
             raise ValueError(f"Passed quantity guard for transition {transition} must be a function taking an objects of "
                              f"class BindingFunction and class CollectionCounter as inputs and return a boolean.")
@@ -334,6 +388,7 @@ class QuantityNet(BaseElement):
 
             if isinstance(binding_object_quantities, dict):
                 transition_element.binding_function_quantities = binding_object_quantities
+                self.reset_enabling()
             else:
                 raise ValueError("Passed number of required objects per object type for transition {transition} must "
                                  "be a dict of {ObjectType: int}.")
@@ -356,6 +411,7 @@ class QuantityNet(BaseElement):
 
             if isinstance(maximum_binding_object_quantities, dict):
                 transition_element.maximum_binding_function_quantities = maximum_binding_object_quantities
+                self.reset_enabling()
             else:
                 raise ValueError(f"Passed number of required objects per object type for transition {transition} must "
                                  "be a dict of {ObjectType: int}.")
@@ -378,6 +434,7 @@ class QuantityNet(BaseElement):
 
             if isinstance(minimum_binding_object_quantities, dict):
                 transition_element.minimum_binding_function_quantities = minimum_binding_object_quantities
+                self.reset_enabling()
             else:
                 raise ValueError(f"Passed number of required objects per object type for transition {transition} must "
                                  "be a dict of {ObjectType: int}.")
@@ -398,6 +455,7 @@ class QuantityNet(BaseElement):
 
             if isinstance(binding_selection, Callable):
                 transition_element.binding_selection_function = binding_selection
+                self.reset_enabling()
             else:
                 raise ValueError(f"Passed binding selection for transition {transition} must be a function.")
 
@@ -458,6 +516,7 @@ class QuantityNet(BaseElement):
                     place_element.object_type = create_object_type(otype)
             else:
                 place_element.object_type = otype
+        self.reset_enabling()
 
     def set_net_structure(self, arcs: set | list[tuple[str, str]]) -> (list[Transition | ObjectPlace | CollectionPoint],
                                                                        list[Qarc | ObjectArc]):
@@ -484,6 +543,9 @@ class QuantityNet(BaseElement):
         self._places = set()
         self._transitions = set()
         self._arcs = set()
+        self._object_locations.clear()
+        self.rebuild_indexes()
+        self.reset_enabling()
         node_elements = []
         arc_elements = []
 
@@ -617,7 +679,62 @@ class QuantityNet(BaseElement):
                     raise ValueError(f"Passed Transition {transition} is not part of the net. "
                                      f"Define net using method 'set_net_structure'.")
             transition_element.manually_initiated = True
+            self.reset_enabling()
+
+
+    def set_sampled_binding_transitions(self, sampled_binding_transitions: set[Transition | str | uuid.UUID]):
+        """
+        Pass set of transitions, their enabled bindings are drawn uniformly at random instead of being enumerated.
+        Requirements:
+        - Transition must be part of net."""
+
+        for transition in sampled_binding_transitions:
+            if isinstance(transition, Transition) and transition in self.transitions:
+                transition_element = transition
+            else:
+                transition_element = self.identify_node(node=transition, element_type="transition")
+                if isinstance(transition_element, Transition):
+                    pass
+                else:
+                    raise ValueError(f"Passed Transition {transition} is not part of the net. "
+                                     f"Define net using method 'set_net_structure'.")
+            transition_element.sample_bindings = True
 
+    def set_join_guards(self, transition_join_guards: dict[Transition | str | uuid.UUID: list[JoinGuard | str]]):
+        """
+        Pass join guards per transition, either as JoinGuard or as specification like 'Parcel o2o Warehouse Employee'
+        or 'Customer Order.id == Parcel.order_id'. Bindings of the transition are enumerated by joining related objects.
+        Requirements:
+        - Transition must be part of net.
+        - Both object types of a join guard must be input object types of the transition."""
+
+        for transition, join_guards in transition_join_guards.items():
+            if isinstance(transition, Transition) and transition in self.transitions:
+                transition_element = transition
+            else:
+                transition_element = self.identify_node(node=transition, element_type="transition")
+                if isinstance(transition_element, Transition):
+                    pass
+                else:
+                    raise ValueError(f"Passed Transition {transition} is not part of the net. "
+                                     f"Define net using method 'set_net_structure'.")
+
+            for join_guard_specification in join_guards:
+                join_guard = parse_join_guard(join_guard_specification)
+                join_guard.resolve_object_types(
+                    lambda object_type: object_type if isinstance(object_type, type)
+                    else self.identify_object_type(object_type))
+                if set(join_guard.object_types).issubset(transition_element.input_object_types):
+                    transition_element.add_join_guard(join_guard)
+                else:
+                    raise ValueError(f"Object types of join guard {join_guard} must be input object types of "
+                                     f"transition {transition_element}.")
+        self.reset_enabling()
+
+    def set_random_generator(self, rng: np.random.Generator):
+        """Pass random generator used by transitions to sample bindings."""
+        for transition in self.transitions:
+            transition.rng = rng
 
     def create_and_add_quantity_arc(self, source: Transition | CollectionPoint, target: Transition | CollectionPoint):
 
@@ -723,6 +840,9 @@ class QuantityNet(BaseElement):
     def _add_transition(self, transition: Transition):
         if isinstance(transition, Transition):
             self._transitions.add(transition)
+            self._index_node(transition)
+            self._freeze_added_node(transition)
+            self.reset_enabling()
         else:
             raise ValueError("Passed transition is not an object of type transition.")
 
@@ -745,18 +865,25 @@ class QuantityNet(BaseElement):
 
             # add arc to the net
             self._arcs.add(arc)
+            self._index_arc(arc)
+            self.reset_enabling()
         else:
             raise ValueError("Passed arc is neither object arc nor quantity arc.")
 
     def _add_object_place(self, place: ObjectPlace):
         if isinstance(place, ObjectPlace):
             self._places.add(place)
+            place.location_index = self._object_locations
+            self._index_node(place)
+            self._freeze_added_node(place)
         else:
             raise ValueError("Passed place is not an object of type objectplace.")
 
     def _add_collection_point(self, cp: CollectionPoint):
         if isinstance(cp, CollectionPoint):
             self._places.add(cp)
+            self._index_node(cp)
+            self._freeze_added_node(cp)
         else:
             raise ValueError("Passed collection point is not an object of type CollectionPoint.")
 
@@ -780,7 +907,7 @@ class QuantityNet(BaseElement):
         """
 
         if isinstance(node, (Place, Transition)):
-            if node in self.nodes:
+            if node in self._places or node in self._transitions:
                 return node
             else:
                 return None
@@ -808,57 +935,16 @@ class QuantityNet(BaseElement):
         :param element_type: place, transition, collection point, arc, quantity arc (optional)
         :return: object or None if doesn't exist
         """
-        if element_type:
-            if element_type in ["place", "places" "p", Place, "object place", "objectplace", ObjectPlace, "ObjectPlace",
-                                "object_place", "collection point", "collection points", "collection_point",
-                                "collection_points", "cp", "cps", CollectionPoint]:
-                places = self.places
-                matching_name = [element for element in places if element.id == identifier]
-                if len(matching_name) == 1:
-                    return matching_name[0]
-                elif len(matching_name) == 0:
-                    return None
-                else:
-                    raise ValueError(f"Passed id {identifier} cannot be uniquely identified. "
-                                     f"More than one object arc between the same two nodes in the same direction "
-                                     f"does not make any sense. Define a net structure with only a single such arc.")
-            elif element_type in ["transition", "transitions", "t", Transition]:
-                transitions = self.transitions
-                matching_name = [element for element in transitions if element.id == identifier]
-                if len(matching_name) == 1:
-                    return matching_name[0]
-                elif len(matching_name) == 0:
-                    return None
-                else:
-                    raise ValueError(f"Passed id {identifier} cannot be uniquely identified. "
-                                     f"More than one object arc between the same two nodes in the same direction "
-                                     f"does not make any sense. Define a net structure with only a single such arc.")
-            elif element_type in ["arc", "a", "objectarc", "object_arc", "ObjectArc", "quantity arc",
-                                  "quantity_arc", "qa"]:
-                arcs = self.arcs
-                matching_name = [element for element in arcs if element.id == identifier]
-                if len(matching_name) == 1:
-                    return matching_name[0]
-                elif len(matching_name) == 0:
-                    return None
-                else:
-                    raise ValueError(f"Passed id {identifier} cannot be uniquely identified. "
-                                     f"More than one object arc between the same two nodes in the same direction "
-                                     f"does not make any sense. Define a net structure with only a single such arc.")
-            else:
-                raise ValueError(f"Element type {element_type} not identified. "
-                                 f"Valid types: place, transition, collection point, arc, quantity arc")
-
+        matching_id = self._filter_element_type(self._elements_by_id.get(identifier, []), element_type=element_type,
+                                                include_arcs=True)
+        if len(matching_id) == 1:
+            return matching_id[0]
+        elif len(matching_id) == 0:
+            return None
         else:
-            matching_name = [element for element in (self.nodes | self.arcs) if element.id == identifier]
-            if len(matching_name) == 1:
-                return matching_name[0]
-            elif len(matching_name) == 0:
-                return None
-            else:
-                raise ValueError(f"Passed id {identifier} cannot be uniquely identified. "
-                                 f"More than one object arc between the same two nodes in the same direction "
-                                 f"does not make any sense. Define a net structure with only a single such arc.")
+            raise ValueError(f"Passed id {identifier} cannot be uniquely identified. "
+                             f"More than one object arc between the same two nodes in the same direction "
+                             f"does not make any sense. Define a net structure with only a single such arc.")
 
     def _identify_node_by_name(self, name: str, element_type: str = None):
         """
@@ -867,45 +953,15 @@ class QuantityNet(BaseElement):
         :param element_type: place, transition, collection point, arc, quantity arc (optional)
         :return: object or None if doesn't exist
         """
-        if element_type:
-            if element_type in ["place", "places" "p", Place, "object place", "objectplace", ObjectPlace, "ObjectPlace",
-                                "object_place", "collection point", "collection points", "collection_point",
-                                "collection_points", "cp", "cps", CollectionPoint]:
-                places = self.places
-                matching_name = [element for element in places if element.name == name]
-                if len(matching_name) == 1:
-                    return matching_name[0]
-                elif len(matching_name) == 0:
-                    return None
-                else:
-                    raise ValueError(f"Passed name {name} cannot be uniquely identified. "
-                                     f"More than one object arc between the same two nodes in the same direction "
-                                     f"does not make any sense. Define a net structure with only a single such arc.")
-            elif element_type in ["transition", "transitions", "t", Transition]:
-                transitions = self.transitions
-                matching_name = [element for element in transitions if element.name == name]
-                if len(matching_name) == 1:
-                    return matching_name[0]
-                elif len(matching_name) == 0:
-                    return None
-                else:
-                    raise ValueError(f"Passed name {name} cannot be uniquely identified. "
-                                     f"More than one object arc between the same two nodes in the same direction "
-                                     f"does not make any sense. Define a net structure with only a single such arc.")
-            else:
-                raise ValueError(f"Element type {element_type} not identified. "
-                                 f"Valid types: place, transition, collection point, arc, quantity arc")
-
+        matching_name = self._filter_element_type(self._nodes_by_name.get(name, []), element_type=element_type)
+        if len(matching_name) == 1:
+            return matching_name[0]
+        elif len(matching_name) == 0:
+            return None
         else:
-            matching_name = [element for element in self.nodes if element.name == name]
-            if len(matching_name) == 1:
-                return matching_name[0]
-            elif len(matching_name) == 0:
-                return None
-            else:
-                raise ValueError(f"Passed name {name} cannot be uniquely identified. "
-                                 f"More than one object arc between the same two nodes in the same direction "
-                                 f"does not make any sense. Define a net structure with only a single such arc.")
+            raise ValueError(f"Passed name {name} cannot be uniquely identified. "
+                             f"More than one object arc between the same two nodes in the same direction "
+                             f"does not make any sense. Define a net structure with only a single such arc.")
 
     def _identify_node_by_label(self, label: str, element_type: str = None) -> (ConnectedElement | None):
         """
@@ -914,45 +970,52 @@ class QuantityNet(BaseElement):
         :param element_type: place, transition, collection point, arc, quantity arc (optional)
         :return: object or None if doesn't exist
         """
-        if element_type:
-            if element_type in ["place", "places" "p", Place, "object place", "objectplace", ObjectPlace, "ObjectPlace",
-                                "object_place", "collection point", "collection points", "collection_point",
-                                "collection_points", "cp", "cps", CollectionPoint]:
-                places = self.places
-                matching_name = [element for element in places if element.label == label]
-                if len(matching_name) == 1:
-                    return matching_name[0]
-                elif len(matching_name) == 0:
-                    return None
-                else:
-                    raise ValueError(f"Passed node {label} cannot be uniquely identified. "
-                                     f"More than one object arc between the same two nodes in the same direction "
-                                     f"does not make any sense. Define a net structure with only a single such arc.")
-            elif element_type in ["transition", "transitions" "t", Transition]:
-                transitions = self.transitions
-                matching_name = [element for element in transitions if element.label == label]
-                if len(matching_name) == 1:
-                    return matching_name[0]
-                elif len(matching_name) == 0:
-                    return None
-                else:
-                    raise ValueError(f"Passed node {label} cannot be uniquely identified. "
-                                     f"More than one object arc between the same two nodes in the same direction "
-                                     f"does not make any sense. Define a net structure with only a single such arc.")
-            else:
-                raise ValueError(f"Element type {element_type} not identified. "
-                                 f"Valid types: place, transition, collection point, arc, quantity arc")
+        matching_label = self._filter_element_type(self._nodes_by_label.get(label, []), element_type=element_type)
+        if len(matching_label) == 1:
+            return matching_label[0]
+        elif len(matching_label) == 0:
+            return None
+        else:
+            raise ValueError(f"Passed node {label} cannot be uniquely identified. "
+                             f"More than one object arc between the same two nodes in the same direction "
+                             f"does not make any sense. Define a net structure with only a single such arc.")
+
+    def _filter_element_type(self, elements: list, element_type: str | type = None, include_arcs: bool = False) -> list:
+        """Returns the passed elements that are part of the net and of the passed element type."""
+        if element_type is None:
+            return [element for element in elements if element in self._places or element in self._transitions
+                    or (include_arcs and element in self._arcs)]
+        elif element_type in PLACE_ELEMENT_TYPES:
+            return [element for element in elements if element in self._places]
+        elif element_type in TRANSITION_ELEMENT_TYPES:
+            return [element for element in elements if element in self._transitions]
+        elif include_arcs and element_type in ARC_ELEMENT_TYPES:
+            return [element for element in elements if element in self._arcs]
+        else:
+            raise ValueError(f"Element type {element_type} not identified. "
+                             f"Valid types: place, transition, collection point, arc, quantity arc")
 
+    def _index_node(self, node: Transition | ObjectPlace | CollectionPoint):
+        self._nodes_by_name.setdefault(node.name, []).append(node)
+        if node.label:
+            self._nodes_by_label.setdefault(node.label, []).append(node)
         else:
-            matching_name = [element for element in self.nodes if element.label == label]
-            if len(matching_name) == 1:
-                return matching_name[0]
-            elif len(matching_name) == 0:
-                return None
-            else:
-                raise ValueError(f"Passed node {label} cannot be uniquely identified. "
-                                 f"More than one object arc between the same two nodes in the same direction "
-                                 f"does not make any sense. Define a net structure with only a single such arc.")
+            pass
+        self._elements_by_id.setdefault(node.id, []).append(node)
+
+    def _index_arc(self, arc: ObjectArc | Qarc):
+        self._elements_by_id.setdefault(arc.id, []).append(arc)
+
+    def rebuild_indexes(self):
+        """Index all nodes and arcs of the net by name, label and id again. Has to be called if names or labels of
+        elements are changed directly instead of through the methods of the net."""
+        self._nodes_by_name = {}
+        self._nodes_by_label = {}
+        self._elements_by_id = {}
+        for node in self.nodes:
+            self._index_node(node)
+        for arc in self.arcs:
+            self._index_arc(arc)
 
     def identify_arc(self,
                      arc: tuple[ObjectPlace | CollectionPoint | Transition, ObjectPlace | CollectionPoint | Transition]
@@ -979,7 +1042,8 @@ class QuantityNet(BaseElement):
                 return None
 
         elif isinstance(arc, uuid.UUID):
-            matching_name = [element for element in self.arcs if element.id == arc]
+            matching_name = self._filter_element_type(self._elements_by_id.get(arc, []), element_type="arc",
+                                                      include_arcs=True)
             if len(matching_name) == 1:
                 return matching_name[0]
             else:
@@ -1048,25 +1112,30 @@ class QuantityNet(BaseElement):
     def _add_execution(self, transition_execution: TransitionExecution, transition: Transition):
         execution = Execution(transition_execution=transition_execution, transition=transition)
         self.executions.append(execution)
+        self._executions_by_id[execution.execution_item_id] = execution
+        self._executions_by_id[transition_execution.execution_id] = execution
+        self._executions_by_transition_execution[transition_execution] = execution
         return execution
 
     def _remove_execution(self, execution: TransitionExecution | Execution | uuid.UUID):
         execution =  self._identify_execution(execution)
         self.executions.remove(execution)
+        self._executions_by_id.pop(execution.execution_item_id, None)
+        self._executions_by_id.pop(execution.transition_execution.execution_id, None)
+        self._executions_by_transition_execution.pop(execution.transition_execution, None)
 
     def _identify_execution(self, execution: TransitionExecution | Execution | uuid.UUID) -> Execution:
+        """Pass execution, transition execution or the id of either of them, get execution of the net."""
         if isinstance(execution, TransitionExecution):
-            matching_execution = [item for item in self.executions if item.execution == execution]
-            if len(matching_execution) == 1:
-                return matching_execution[0]
+            if execution in self._executions_by_transition_execution:
+                return self._executions_by_transition_execution[execution]
             else:
                 raise ValueError(f"Execution {execution} not part of the net.")
         elif isinstance(execution, Execution):
             return execution
         elif isinstance(execution, uuid.UUID):
-            matching_execution = [item for item in self.executions if item.execution.id == execution]
-            if len(matching_execution) == 1:
-                return matching_execution[0]
+            if execution in self._executions_by_id:
+                return self._executions_by_id[execution]
             else:
                 raise ValueError(f"Execution {execution} not part of the net.")
         else:
@@ -1078,6 +1147,59 @@ class QuantityNet(BaseElement):
         execution = self._identify_execution(execution)
         execution.transition.end_firing(execution=execution.transition_execution)
 
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
+    def freeze(self):
+        """Precompute the structural views of all nodes (connected places, counters, arcs and object types) and keep
+        them until the structure changes. Nodes invalidate their views themselves if arcs are added or object types of
+        places change; nodes added later are frozen as well. Call unfreeze to determine views on every access again,
+        e.g., to compare run times."""
+        self._frozen = True
+        for node in self.nodes:
+            node.freeze()
+        for transition in self.transitions:
+            _ = transition.object_types, transition.output_object_types, transition.connected_counters
+            _ = transition.object_arcs, transition.quantity_arcs, transition.input_object_types
+            for object_type in transition.object_types:
+                _ = transition.get_input_places_of_otype(object_type=object_type)
+                _ = transition.get_output_places_of_otype(object_type=object_type)
+
+    def unfreeze(self):
+        self._frozen = False
+        for node in self.nodes:
+            node.unfreeze()
+
+    def _freeze_added_node(self, node: Transition | ObjectPlace | CollectionPoint):
+        if self._frozen:
+            node.freeze()
+        else:
+            pass
+
+    def reset_enabling(self):
+        """Has to be called after changing the structure of the net or the binding specification of its transitions
+        directly, so that the enabled bindings are recomputed for all transitions."""
+        self.enabling.reset()
+        self._compiled_net = None
+
+    @property
+    def compiled_net(self) -> CompiledNet:
+        """Integer indexed representation of the net, built on first use after the structure changed."""
+        if self._compiled_net is None:
+            self._compiled_net = CompiledNet(quantity_net=self)
+        else:
+            pass
+        return self._compiled_net
+
+    def possibly_enabled_transitions(self) -> set[Transition]:
+        """Transitions whose input places hold enough active objects to be enabled, or all transitions if count
+        screening is switched off."""
+        if self.count_screening:
+            return self.compiled_net.possibly_enabled_transitions()
+        else:
+            return self.transitions
+
     def get_enabled_bindings_all_transitions_for_input_types(self) -> dict[Transition: list[BindingFunction]]:
         """
         Iterate through transitions of the net and get all enabled binding functions per transition. Returns dict of all
@@ -1085,10 +1207,16 @@ class QuantityNet(BaseElement):
         :return:
         """
 
+        if self.incremental_enabling:
+            return self.enabling.get_enabled_bindings()
+        else:
+            pass
+
         enabled_input_bindings = {}
+        possibly_enabled_transitions = self.possibly_enabled_transitions()
 
         for transition in self.transitions:
-            if transition.manually_initiated:
+            if transition.manually_initiated or transition not in possibly_enabled_transitions:
                 continue
             else:
                 pass
@@ -1218,15 +1346,7 @@ class QuantityNet(BaseElement):
 
     def get_locations_of_object(self, obj: Object) -> set[ObjectPlace]:
         """Pass object and get all places in which object is part of marking."""
-
-        obj_location = set()
-        for place in self.object_places:
-            if obj in place.marking:
-                obj_location.add(place)
-            else:
-                pass
-
-        return obj_location
+        return set(self._object_locations.get(obj, ()))
 
     def get_quantity_operations_of_execution(self, execution: TransitionExecution | Execution | uuid.UUID) -> CollectionCounter:
         """
@@ -1276,6 +1396,7 @@ class QuantityNet(BaseElement):
             binding_function_quantities = arc_element.transition.binding_function_quantities
             binding_function_quantities[arc_element.object_type] = 0
             arc_element.transition.binding_function_quantities = binding_function_quantities
+        self.reset_enabling()
 
     def set_maximum_object_tokens_variable_arc(self, variable_arc_maximum: dict[ObjectArc | tuple: int | None]):
         """update maximum object tokens for variable arcs and the corresponding binding function quantities of the transition."""
@@ -1289,6 +1410,7 @@ class QuantityNet(BaseElement):
             binding_function_quantities = arc_element.transition.binding_function_quantities
             binding_function_quantities[arc_element.object_type] = 0
             arc_element.transition.binding_function_quantities = binding_function_quantities
+        self.reset_enabling()
 
     def set_minimum_object_tokens_variable_arc(self, variable_arc_minimum: dict[ObjectArc | tuple: int | None]):
         """update maximum object tokens for variable arcs and the corresponding binding function quantities of the transition."""
@@ -1302,6 +1424,7 @@ class QuantityNet(BaseElement):
             binding_function_quantities = arc_element.transition.binding_function_quantities
             binding_function_quantities[arc_element.object_type] = 0
             arc_element.transition.binding_function_quantities = binding_function_quantities
+        self.reset_enabling()
 
     def specify_number_of_object_tokens_variable_arc(self, variable_arc_fixed: dict[ObjectArc | tuple: int | None]):
         """set the number of object tokens the transition needs for firing to a fixed number."""
@@ -1317,4 +1440,4 @@ class QuantityNet(BaseElement):
             binding_function_quantities = arc_element.transition.minimum_binding_function_quantities
             binding_function_quantities[arc_element.object_type] = value
             arc_element.transition.minimum_binding_function_quantities = binding_function_quantities
-
+        self.reset_enabling()
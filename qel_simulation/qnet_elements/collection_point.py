@@ -51,6 +51,7 @@ class CollectionPoint(Place):
     def update_marking(self, quantity_update: Counter):
         if isinstance(quantity_update, Counter):
             self._marking.update(quantity_update)
+            self._marking_version += 1
             if set(dict(quantity_update).keys()).issubset(self.item_types):
                 pass
             else:
@@ -1,8 +1,9 @@
 from collections import Counter
-from typing import Callable
+from typing import Callable, Type
 
-from qel_simulation.simulation.object import BindingFunction
+from qel_simulation.simulation.object import BindingFunction, Object
 from qel_simulation.qnet_elements.collection_point import CollectionPoint, CollectionCounter
+from qel_simulation.qnet_elements.join_guard import JoinGuard
 
 
 
@@ -16,6 +17,8 @@ class QuantityGuardSmallstockConfig:
         self.all_counter_condition = all_counter_condition
 
 class QuantityGuard():
+    # set to True in subclasses whose enablement only depends on the quantity state, not on the binding function
+    binding_independent = False
 
     def __init__(self):
         pass
@@ -60,6 +63,8 @@ class QuantityGuard():
 
 
 class QuantityGuardSmallStock(QuantityGuard):
+    binding_independent = True
+
     def __init__(self, counter_threshold: CollectionCounter,
                  counter_all_item_types: dict[CollectionPoint: bool] = None,
                  all_counter_condition: bool = True):
@@ -154,8 +159,31 @@ class Guard():
     def __init__(self):
         self._object_guard = None
         self._quantity_guard = None
+        self._join_guards: list[JoinGuard] = []
+        self._object_filters: dict[Type[Object], list[Callable[[Object], bool]]] = {}
         pass
 
+    @property
+    def object_filters(self) -> dict[Type[Object], list[Callable[[Object], bool]]]:
+        return self._object_filters
+
+    def add_object_filter(self, object_type: Type[Object], object_filter: Callable[[Object], bool]):
+        """Add requirement on single objects of the object type, e.g., on their attributes. Objects not fulfilling it
+        are removed from the candidates before binding functions are built."""
+        self._object_filters.setdefault(object_type, []).append(object_filter)
+
+    def filter_objects(self, object_type: Type[Object], objects: list[Object]) -> list[Object]:
+        """Returns the objects fulfilling all object filters of the object type."""
+        object_filters = self._object_filters.get(object_type, [])
+        return [obj for obj in objects if all(object_filter(obj) for object_filter in object_filters)]
+
+    @property
+    def join_guards(self) -> list[JoinGuard]:
+        return self._join_guards
+
+    def add_join_guard(self, join_guard: JoinGuard):
+        self._join_guards.append(join_guard)
+
     @property
     def object_guard(self):
         if self._object_guard:
@@ -177,11 +205,31 @@ class Guard():
     def get_quantity_guard(self):
         return self._quantity_guard
 
+    @property
+    def quantity_guard_binding_independent(self) -> bool:
+        """Whether the quantity guard only depends on the quantity state. Plain functions are assumed to evaluate the
+        binding function."""
+        if self.quantity_guard:
+            return getattr(self._quantity_guard, "binding_independent", False)
+        else:
+            return False
+
     @quantity_guard.setter
     def quantity_guard(self, quantity_guard: Callable[[BindingFunction, CollectionCounter], bool] | QuantityGuardSmallStock):
         self._quantity_guard = quantity_guard
 
     def check_objects(self, binding_function: BindingFunction) -> bool:
+        for object_type, object_filters in self._object_filters.items():
+            for obj in binding_function.get(object_type, ()):
+                if all(object_filter(obj) for object_filter in object_filters):
+                    pass
+                else:
+                    return False
+        for join_guard in self._join_guards:
+            if join_guard(binding_function):
+                pass
+            else:
+                return False
         if self.object_guard:
             return self._object_guard(binding_function)
         else:
@@ -194,6 +242,10 @@ class Guard():
         else:
             return True
 
+    def check_binding_independent_quantities(self, quantity_state: CollectionCounter) -> bool:
+        """Evaluates a binding independent quantity guard without binding function."""
+        return self.check_quantities(binding_function=None, quantity_state=quantity_state)
+
     def __call__(self, binding_function: BindingFunction, quantity_state: CollectionCounter) -> bool:
         """Guard specifies if transition should fire given the current state of the net."""
         if self.check_objects(binding_function=binding_function):
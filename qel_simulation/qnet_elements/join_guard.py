@@ -0,0 +1,189 @@
+import re
+from abc import ABC, abstractmethod
+from typing import Type, Callable, Hashable, Iterable
+
+from qel_simulation.simulation.object import Object, BindingFunction
+
+O2O_SPECIFICATION = re.compile(r"^\s*(?P<left>.+?)\s+o2o\s+(?P<right>.+?)\s*$")
+ATTRIBUTE_SPECIFICATION = re.compile(r"^\s*(?P<left>.+?)\.(?P<left_attribute>\w+)\s*==\s*"
+                                     r"(?P<right>.+?)\.(?P<right_attribute>\w+)\s*$")
+
+
+class JoinGuard(ABC):
+    """Declarative requirement relating the objects of two object types in a binding: every pair of a left and a
+    right object in the binding has to be related. As the relation is known, the enumeration of bindings can look up
+    related objects in an index instead of generating all combinations and rejecting them afterwards."""
+
+    def __init__(self, left_object_type: Type[Object] | str, right_object_type: Type[Object] | str):
+        self.left_object_type = left_object_type
+        self.right_object_type = right_object_type
+
+    @property
+    def object_types(self) -> tuple[Type[Object], Type[Object]]:
+        return self.left_object_type, self.right_object_type
+
+    def resolve_object_types(self, identify_object_type: Callable[[Type[Object] | str], Type[Object] | None]):
+        """Exchange object type names for the actual object types."""
+        for attribute in ["left_object_type", "right_object_type"]:
+            object_type = identify_object_type(getattr(self, attribute))
+            if object_type is None:
+                raise ValueError(f"Object type {getattr(self, attribute)} of join guard {self} not found.")
+            else:
+                setattr(self, attribute, object_type)
+
+    @abstractmethod
+    def related(self, left_object: Object, right_object: Object) -> bool:
+        ...
+
+    @abstractmethod
+    def create_right_index(self, right_objects: Iterable[Object]) -> dict[Hashable, list[Object]]:
+        """Index of the right objects by the keys they are looked up with for a left object."""
+        ...
+
+    @abstractmethod
+    def right_lookup_keys(self, left_object: Object) -> Iterable[Hashable]:
+        ...
+
+    @abstractmethod
+    def create_left_index(self, left_objects: Iterable[Object]) -> dict[Hashable, list[Object]]:
+        """Index of the left objects by the keys they are looked up with for a right object."""
+        ...
+
+    @abstractmethod
+    def left_lookup_keys(self, right_object: Object) -> Iterable[Hashable]:
+        ...
+
+    def related_right_objects(self, left_object: Object, index: dict[Hashable, list[Object]]) -> list[Object]:
+        """Right objects of the index that are related to the passed left object."""
+        return _lookup(index=index, keys=self.right_lookup_keys(left_object))
+
+    def related_left_objects(self, right_object: Object, index: dict[Hashable, list[Object]]) -> list[Object]:
+        """Left objects of the index that are related to the passed right object."""
+        return _lookup(index=index, keys=self.left_lookup_keys(right_object))
+
+    def __call__(self, binding_function: BindingFunction) -> bool:
+        """Returns whether all pairs of left and right objects in the binding function are related."""
+        left_objects = binding_function.get(self.left_object_type, ())
+        right_objects = binding_function.get(self.right_object_type, ())
+        for left_object in left_objects:
+            for right_object in right_objects:
+                if self.related(left_object, right_object):
+                    pass
+                else:
+                    return False
+        return True
+
+
+class O2OJoinGuard(JoinGuard):
+    """The right object is part of the o2o relationships of the left object, e.g., 'Parcel o2o Warehouse Employee'."""
+
+    def __repr__(self):
+        return f"{_object_type_name(self.left_object_type)} o2o {_object_type_name(self.right_object_type)}"
+
+    def related(self, left_object: Object, right_object: Object) -> bool:
+        return right_object in left_object.o2o
+
+    def create_right_index(self, right_objects: Iterable[Object]) -> dict[Hashable, list[Object]]:
+        return {right_object: [right_object] for right_object in right_objects}
+
+    def right_lookup_keys(self, left_object: Object) -> Iterable[Hashable]:
+        return left_object.o2o.keys()
+
+    def create_left_index(self, left_objects: Iterable[Object]) -> dict[Hashable, list[Object]]:
+        index = {}
+        for left_object in left_objects:
+            for related_object in left_object.o2o:
+                index.setdefault(related_object, []).append(left_object)
+        return index
+
+    def left_lookup_keys(self, right_object: Object) -> Iterable[Hashable]:
+        return [right_object]
+
+
+class AttributeJoinGuard(JoinGuard):
+    """An attribute of the left object equals an attribute of the right object, e.g.,
+    'Customer Order.id == Parcel.order_id'. Objects without the attribute are not related to any object."""
+
+    def __init__(self, left_object_type: Type[Object] | str, left_attribute: str,
+                 right_object_type: Type[Object] | str, right_attribute: str):
+        super().__init__(left_object_type=left_object_type, right_object_type=right_object_type)
+        self.left_attribute = left_attribute
+        self.right_attribute = right_attribute
+
+    def __repr__(self):
+        return (f"{_object_type_name(self.left_object_type)}.{self.left_attribute} == "
+                f"{_object_type_name(self.right_object_type)}.{self.right_attribute}")
+
+    def related(self, left_object: Object, right_object: Object) -> bool:
+        if hasattr(left_object, self.left_attribute) and hasattr(right_object, self.right_attribute):
+            return getattr(left_object, self.left_attribute) == getattr(right_object, self.right_attribute)
+        else:
+            return False
+
+    def create_right_index(self, right_objects: Iterable[Object]) -> dict[Hashable, list[Object]]:
+        return _attribute_index(objects=right_objects, attribute=self.right_attribute)
+
+    def right_lookup_keys(self, left_object: Object) -> Iterable[Hashable]:
+        return _attribute_values(obj=left_object, attribute=self.left_attribute)
+
+    def create_left_index(self, left_objects: Iterable[Object]) -> dict[Hashable, list[Object]]:
+        return _attribute_index(objects=left_objects, attribute=self.left_attribute)
+
+    def left_lookup_keys(self, right_object: Object) -> Iterable[Hashable]:
+        return _attribute_values(obj=right_object, attribute=self.right_attribute)
+
+
+def _attribute_index(objects: Iterable[Object], attribute: str) -> dict[Hashable, list[Object]]:
+    index = {}
+    for obj in objects:
+        if hasattr(obj, attribute):
+            index.setdefault(getattr(obj, attribute), []).append(obj)
+        else:
+            pass
+    return index
+
+
+def _attribute_values(obj: Object, attribute: str) -> list[Hashable]:
+    if hasattr(obj, attribute):
+        return [getattr(obj, attribute)]
+    else:
+        return []
+
+
+def _lookup(index: dict[Hashable, list[Object]], keys: Iterable[Hashable]) -> list[Object]:
+    related_objects = []
+    for key in keys:
+        related_objects.extend(index.get(key, ()))
+    return list(dict.fromkeys(related_objects))
+
+
+def _object_type_name(object_type: Type[Object] | str) -> str:
+    return object_type if isinstance(object_type, str) else object_type.object_type_name
+
+
+def parse_join_guard(specification: str | JoinGuard) -> JoinGuard:
+    """Create join guard from specifications like 'Parcel o2o Warehouse Employee' or
+    'Customer Order.id == Parcel.order_id'. Object types are referred to by name and resolved later."""
+
+    if isinstance(specification, JoinGuard):
+        return specification
+    elif isinstance(specification, str):
+        pass
+    else:
+        raise ValueError(f"Join guard must be a JoinGuard or a string, not {type(specification)}.")
+
+    attribute_match = ATTRIBUTE_SPECIFICATION.match(specification)
+    if attribute_match:
+        return AttributeJoinGuard(left_object_type=attribute_match["left"],
+                                  left_attribute=attribute_match["left_attribute"],
+                                  right_object_type=attribute_match["right"],
+                                  right_attribute=attribute_match["right_attribute"])
+    else:
+        pass
+
+    o2o_match = O2O_SPECIFICATION.match(specification)
+    if o2o_match:
+        return O2OJoinGuard(left_object_type=o2o_match["left"], right_object_type=o2o_match["right"])
+    else:
+        raise ValueError(f"Join guard '{specification}' is neither of the form '<object type> o2o <object type>' "
+                         f"nor '<object type>.<attribute> == <object type>.<attribute>'.")
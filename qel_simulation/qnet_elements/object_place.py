@@ -1,6 +1,6 @@
 from typing import Type
 
-from qel_simulation.simulation.object import Object, DefaultObject, MultisetObject
+from qel_simulation.simulation.object import Object, DefaultObject, MultisetObject, Status
 from qel_simulation.qnet_elements.place import Place
 
 
@@ -12,6 +12,11 @@ class ObjectPlace(Place):
 
         self._object_type = object_type if object_type else DefaultObject
         self._marking = MultisetObject()
+        # tokens of the marking by status of the object, dicts are used as insertion ordered sets
+        self._active_tokens: dict[Object, None] = {}
+        self._inactive_tokens: dict[Object, None] = {}
+        # index of the places of a net per object, shared by all places of the net
+        self._location_index: dict[Object, dict["ObjectPlace", None]] | None = None
 
     def __repr__(self):
         return f"{self.name} ({self._object_type.__name__})"
@@ -23,11 +28,55 @@ class ObjectPlace(Place):
     @object_type.setter
     def object_type(self, object_type: Type[Object]):
         self._object_type = object_type
+        # views of connected transitions depend on the object types of their places
+        for element in self.inputs | self.outputs:
+            element.invalidate_structure_cache()
+
+    @property
+    def active_tokens(self):
+        """Objects of the marking that are active, i.e., available for bindings."""
+        return self._active_tokens.keys()
+
+    @property
+    def inactive_tokens(self):
+        """Objects of the marking that are not active."""
+        return self._inactive_tokens.keys()
+
+    @property
+    def location_index(self) -> dict[Object, dict["ObjectPlace", None]] | None:
+        return self._location_index
+
+    @location_index.setter
+    def location_index(self, location_index: dict[Object, dict["ObjectPlace", None]] | None):
+        """Set the object location index of the net, the objects of the current marking are added to it."""
+        self._location_index = location_index
+        if location_index is not None:
+            for obj in self._marking.distinct_elements():
+                location_index.setdefault(obj, {})[self] = None
+        else:
+            pass
+
+    def _index_token(self, obj: Object):
+        if obj.status_active:
+            self._active_tokens[obj] = None
+        else:
+            self._inactive_tokens[obj] = None
 
     def add_token(self, obj: Object):
         # make sure passed element is an object of the correct type
         if isinstance(obj, self.object_type):
+            # only active objects are considered for bindings, so status changes of marked objects change the marking
+            if obj in self._marking:
+                pass
+            else:
+                obj.add_status_observer(self._update_status_of_marked_object)
+                self._index_token(obj)
+                if self._location_index is not None:
+                    self._location_index.setdefault(obj, {})[self] = None
+                else:
+                    pass
             self._marking.add(obj)
+            self._marking_version += 1
         else:
             raise ValueError(f"Variable passed to changes marking of ObjectPlace is not an object of the correct type.")
 
@@ -35,9 +84,34 @@ class ObjectPlace(Place):
         # remove element if it exists in marking
         if obj in self.marking:
             self._marking.remove(obj)
+            obj.remove_status_observer(self._update_status_of_marked_object)
+            self._active_tokens.pop(obj, None)
+            self._inactive_tokens.pop(obj, None)
+            if self._location_index is not None:
+                self._remove_location(obj)
+            else:
+                pass
+            self._marking_version += 1
         else:
             raise ValueError(f"Passed object is not part of place's marking.")
 
+    def _remove_location(self, obj: Object):
+        locations = self._location_index.get(obj)
+        if locations is not None:
+            locations.pop(self, None)
+            if locations:
+                pass
+            else:
+                del self._location_index[obj]
+        else:
+            pass
+
+    def _update_status_of_marked_object(self, obj: Object, previous_status: Status, status: Status):
+        self._active_tokens.pop(obj, None)
+        self._inactive_tokens.pop(obj, None)
+        self._index_token(obj)
+        self._marking_version += 1
+
     def remove_tokens(self, objs: set[Object]):
         for obj in objs:
             self.remove_token(obj)
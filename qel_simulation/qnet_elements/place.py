@@ -10,6 +10,8 @@ class Place(ConnectedElement):
         self._initial = None
         self._final = None
         self._marking = None
+        # incremented on every change of the marking, lets enabling skip transitions whose inputs did not change
+        self._marking_version = 0
 
     def __str__(self):
         return self.name
@@ -50,14 +52,20 @@ class Place(ConnectedElement):
     def marking(self):
         return self._marking
 
+    @property
+    def marking_version(self) -> int:
+        return self._marking_version
+
     def add_token(self, tokens: int):
         if isinstance(tokens, int):
             self._marking += tokens
+            self._marking_version += 1
         else:
             raise ValueError(f"Variable passed to mark decoupling point is not an integer.")
 
     def remove_token(self, tokens: int):
         if isinstance(tokens, int) and self.marking >= tokens:
             self._marking -= tokens
+            self._marking_version += 1
         else:
             raise ValueError(f"Trying to remove more lazy tokens from decoupling point than available.")
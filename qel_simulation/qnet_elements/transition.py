@@ -1,11 +1,16 @@
 import uuid
-from itertools import combinations, product
-from typing import Type, Callable
+from collections import Counter
+from itertools import combinations, islice
+from math import comb, prod
+from typing import Type, Callable, Iterator
+
+import numpy as np
 
 from qel_simulation.components.base_element import ConnectedElement
 from qel_simulation.simulation.object import Object, BindingFunction, MultisetObject
 from qel_simulation.qnet_elements.collection_point import CollectionPoint, CollectionCounter
 from qel_simulation.qnet_elements.guard import Guard
+from qel_simulation.qnet_elements.join_guard import JoinGuard
 from qel_simulation.qnet_elements.object_arc import ObjectArc
 from qel_simulation.qnet_elements.object_place import ObjectPlace
 from qel_simulation.qnet_elements.qalculator import Qalculator, DefaulQalculator
@@ -33,11 +38,26 @@ class Transition(ConnectedElement):
         self._qalculator = None
         self._has_qalculator = False
         self._enabled_bindings_cache = None
+        self._enabled_bindings_iterator = None
         self.binding_recalculation_default = True # TODO: Binding Specification config
         self.return_single_binding = True # TODO: Binding Selection config
         self._binding_selection_function = None
         self.qalculator = qalculator if qalculator else DefaulQalculator()
         self._manually_initiated = False
+        # draw a uniformly random enabled binding instead of enumerating bindings in single binding mode
+        self.sample_bindings = False
+        self.rng = None
+        self.maximum_sampling_attempts = 64
+        self.minimum_acceptance_rate = 0.05
+        self.sampling_attempts = 0
+        self.sampling_acceptances = 0
+        # candidate objects per object type before and after applying the object filters of the guard
+        self.candidates_before_filtering: Counter = Counter()
+        self.candidates_after_filtering: Counter = Counter()
+        # marking intersection and its active objects per input object type, keyed by the marking versions of the places
+        self._marking_intersection_cache: dict[Type[Object], tuple[tuple, MultisetObject, list[Object]]] = {}
+        self.marking_intersection_cache_hits = 0
+        self.marking_intersection_cache_misses = 0
 
     def __repr__(self):
         return f"{self.name} ({self.label})"
@@ -104,24 +124,26 @@ class Transition(ConnectedElement):
 
     @property
     def object_types(self) -> set[Type[Object]]:
-        surrounding_places = list(self.input_places | self.output_places)
-        return {place.object_type for place in surrounding_places}
+        return self._structural_view("object_types", lambda: {
+            place.object_type for place in self.input_places | self.output_places})
 
     @property
     def input_object_types(self) -> set[Type[Object]]:
-        return {place.object_type for place in self.inputs if isinstance(place, ObjectPlace)}
+        return self._structural_view("input_object_types", lambda: {
+            place.object_type for place in self.inputs if isinstance(place, ObjectPlace)})
 
     @property
     def output_object_types(self) -> set[Type[Object]]:
-        return {place.object_type for place in self.outputs if isinstance(place, ObjectPlace)}
+        return self._structural_view("output_object_types", lambda: {
+            place.object_type for place in self.outputs if isinstance(place, ObjectPlace)})
 
     @property
     def quantity_arcs(self) -> set[Qarc]:
-        return {arc for arc in self.arcs if isinstance(arc, Qarc)}
+        return self._structural_view("quantity_arcs", lambda: {arc for arc in self.arcs if isinstance(arc, Qarc)})
 
     @property
     def object_arcs(self) -> set[ObjectArc]:
-        return {arc for arc in self.arcs if isinstance(arc, ObjectArc)}
+        return self._structural_view("object_arcs", lambda: {arc for arc in self.arcs if isinstance(arc, ObjectArc)})
 
     @property
     def variable_object_types(self) -> set[Type[Object]]:
@@ -150,25 +172,51 @@ class Transition(ConnectedElement):
     def set_quantity_guard(self, quantity_guard: Callable[[BindingFunction, CollectionCounter], bool]):
         self._guard.quantity_guard = quantity_guard
 
+    def add_object_filter(self, object_type: Type[Object], object_filter: Callable[[Object], bool]):
+        self._guard.add_object_filter(object_type=object_type, object_filter=object_filter)
+
+    @property
+    def join_guards(self) -> list[JoinGuard]:
+        return self._guard.join_guards
+
+    def add_join_guard(self, join_guard: JoinGuard):
+        self._guard.add_join_guard(join_guard)
+
+    @property
+    def enabling_depends_on_object_state(self) -> bool:
+        """Whether enabled bindings may depend on more than the markings of the input places and connected counters,
+        i.e., on object attributes or relations read by an object guard, an object filter, a join guard, a quantity guard
+        evaluating the binding or a binding selection function."""
+        if self.binding_selection_function or self.guard.object_guard or self.guard.object_filters or self.join_guards:
+            return True
+        elif self.guard.quantity_guard:
+            return not self.guard.quantity_guard_binding_independent
+        else:
+            return False
+
     @property
     def input_places(self) -> set[ObjectPlace]:
-        return {place for place in self.inputs if isinstance(place, ObjectPlace)}
+        return self._structural_view("input_places", lambda: {
+            place for place in self.inputs if isinstance(place, ObjectPlace)})
 
     @property
     def input_counters(self) -> set[CollectionPoint]:
-        return {place for place in self.inputs if isinstance(place, CollectionPoint)}
+        return self._structural_view("input_counters", lambda: {
+            place for place in self.inputs if isinstance(place, CollectionPoint)})
 
     @property
     def output_counters(self) -> set[CollectionPoint]:
-        return {place for place in self.outputs if isinstance(place, CollectionPoint)}
+        return self._structural_view("output_counters", lambda: {
+            place for place in self.outputs if isinstance(place, CollectionPoint)})
 
     @property
     def connected_counters(self) -> set[CollectionPoint]:
-        return set.union(self.input_counters, self.output_counters)
+        return self._structural_view("connected_counters", lambda: self.input_counters | self.output_counters)
 
     @property
     def output_places(self) -> set[ObjectPlace]:
-        return {place for place in self.outputs if isinstance(place, ObjectPlace)}
+        return self._structural_view("output_places", lambda: {
+            place for place in self.outputs if isinstance(place, ObjectPlace)})
 
     @property
     def output_types_not_input_types(self) -> dict[Type[Object], int]:
@@ -236,10 +284,12 @@ class Transition(ConnectedElement):
                              "transition object types.")
 
     def get_input_places_of_otype(self, object_type: Type[Object]) -> set[ObjectPlace]:
-        return {oplace for oplace in self.input_places if oplace.object_type == object_type}
+        return self._structural_view(("input_places_of_otype", object_type), lambda: {
+            oplace for oplace in self.input_places if oplace.object_type == object_type})
 
     def get_output_places_of_otype(self, object_type: Object) -> set[ObjectPlace]:
-        return {oplace for oplace in self.output_places if oplace.object_type == object_type}
+        return self._structural_view(("output_places_of_otype", object_type), lambda: {
+            oplace for oplace in self.output_places if oplace.object_type == object_type})
 
     def determine_new_binding_functions(self):
         """Returns all possible binding functions that are enabled under the current marking of the input places.
@@ -253,80 +303,333 @@ class Transition(ConnectedElement):
                 conditions are not met the calculation of possible object bindings can be skipped, returning no enabled bindings.
                 If the are, no checking for each binding is necessary. For Dependent weights, the quantity conditions are
                 checked for every possible binding and only quantity enabled bindings are returned."""
-        # print("#####", self.label)
 
-        object_type_sets = dict()
-        # print(f"Input object types: {self.input_object_types}")
+        enabled_bindings = list(self.iter_enabled_binding_functions())
+
+        if enabled_bindings:
+            return enabled_bindings
+        else:
+            return None
+
+    def iter_enabled_binding_functions(self) -> Iterator[BindingFunction]:
+        """Lazily yields the binding functions that are enabled under the current marking of the input places, in the
+        order of determine_new_binding_functions. Subsets of objects per object type and their combinations are
+        created one at a time and checked against the guard, so that neither all subsets nor all combinations are held
+        in memory. Object types bound to exactly one object and related by join guards are combined by hash joins
+        instead, i.e., only related objects are looked up, which changes the order of the bindings."""
+
+        binding_guard = self._binding_guard()
+        if binding_guard is None:
+            return
+        else:
+            pass
+
+        subsets_per_object_type = self._binding_candidate_subsets()
+        if subsets_per_object_type is None:
+            return
+        else:
+            pass
+
+        object_types = list(subsets_per_object_type.keys())
+        if self.join_guards:
+            combinations_of_subsets = self._iter_joined_subset_combinations(
+                subsets_per_object_type=subsets_per_object_type, object_types=object_types)
+        else:
+            combinations_of_subsets = self._iter_subset_combinations(subsets_per_object_type=subsets_per_object_type,
+                                                                     object_types=object_types)
+        for combination in combinations_of_subsets:
+            binding_function = BindingFunction(zip(object_types, combination))
+            # check if binding fulfills guard requirements - join guards are checked again as residual predicates
+            if binding_guard(binding_function):
+                yield binding_function
+            else:
+                pass
+
+    def _binding_guard(self) -> Callable[[BindingFunction], bool] | None:
+        """Returns the guard to check candidate binding functions with under the current quantity state. A binding
+        independent quantity guard is evaluated once here: if it is not fulfilled, no binding can be enabled and None is
+        returned, otherwise candidates only have to fulfill the object conditions."""
+        quantity_state = self.quantity_state
+        if self.guard.quantity_guard_binding_independent:
+            if self.guard.check_binding_independent_quantities(quantity_state=quantity_state):
+                return self.guard.check_objects
+            else:
+                return None
+        else:
+            return lambda binding_function: self.guard(binding_function=binding_function, quantity_state=quantity_state)
+
+    def _binding_candidate_subsets(self) -> dict[Type[Object], tuple[list[Object], range]] | None:
+        """Returns the active objects available for every input object type together with the sizes of the subsets
+        of these objects a binding may contain. Returns None if there are not enough objects of some type."""
+
+        subsets_per_object_type = dict()
 
         for object_type in self.input_object_types:
-            object_sets = []
             required_objects = self.binding_function_quantities[object_type]
             minimum_objects = self.minimum_binding_function_quantities[object_type]
             maximum_objects = self.maximum_binding_function_quantities[object_type]
-            # print(f"Object type: {object_type.object_type_name}, required: {required_objects}, min: {minimum_objects}, max: {maximum_objects}")
 
-            # get objects that are part of all input places of that type
-            marking_intersection = self._input_places_marking_intersection(object_type=object_type)
-            marking_intersection_active = {obj for obj in marking_intersection if obj.status_active}
-            # print(f"Marking intersection of {object_type.object_type_name}: {marking_intersection_active}")
-
-            # create all combinations of subsets of available objects required length
-            if len(marking_intersection_active) >= required_objects:  # make sure enough are available of this type
-                # print(f"Enough objects of {object_type.object_type_name} available.")
-                if required_objects == 0:
-                    if maximum_objects == 0:  # if truly variable requirement: all subsets of all possible sizes
-                        for subset_size in range(minimum_objects, len(marking_intersection_active) + 1):
-                            subsets = [set(combination) for combination in
-                                       combinations(marking_intersection_active, subset_size)]
-                            object_sets.extend(subsets)
-                        if minimum_objects == 0:
-                            object_sets.append(set())
-                        else:
-                            pass
-                    else:  # if maximum number of objects is set, create all subsets up to maximum size
-                        for subset_size in range(minimum_objects, maximum_objects + 1):
-                            subsets = [set(combination) for combination in
-                                       combinations(marking_intersection_active, subset_size)]
-                            object_sets.extend(subsets)
-                        if minimum_objects == 0:
-                            object_sets.append(set())
-                        else:
-                            pass
-                else:  # create all subsets of required size
-                    subsets = [set(combination) for combination in
-                               combinations(marking_intersection_active, required_objects)]
-                    object_sets.extend(subsets)
+            # get active objects that are part of all input places of that type
+            marking_intersection_active = self.get_active_input_objects(object_type=object_type)
 
-                object_type_sets[object_type] = object_sets
+            # remove objects not fulfilling the object filters before any subsets are built
+            if object_type in self.guard.object_filters:
+                self.candidates_before_filtering[object_type] += len(marking_intersection_active)
+                marking_intersection_active = self.guard.filter_objects(object_type=object_type,
+                                                                        objects=marking_intersection_active)
+                self.candidates_after_filtering[object_type] += len(marking_intersection_active)
+            else:
+                pass
 
+            # not enough input objects means that no binding function can be enabled
+            if len(marking_intersection_active) >= required_objects:
+                pass
             else:
-                # not enough input objects means that no binding function can be enabled
                 return None
-            # print(f"Object sets of {object_type.object_type_name}: {object_sets}")
 
-        if not object_type_sets:
-            possibly_enabled_binding_functions = [BindingFunction()]
+            if required_objects == 0:
+                if maximum_objects == 0:  # if truly variable requirement: all subsets of all possible sizes
+                    subset_sizes = range(minimum_objects, len(marking_intersection_active) + 1)
+                else:  # if maximum number of objects is set, all subsets up to maximum size
+                    subset_sizes = range(minimum_objects, maximum_objects + 1)
+            else:  # all subsets of required size
+                subset_sizes = range(required_objects, required_objects + 1)
+
+            subsets_per_object_type[object_type] = (marking_intersection_active, subset_sizes)
+
+        return subsets_per_object_type
+
+    @staticmethod
+    def _iter_object_subsets(objects: list[Object], subset_sizes: range) -> Iterator[set[Object]]:
+        for subset_size in subset_sizes:
+            for combination in combinations(objects, subset_size):
+                yield set(combination)
+
+    def _iter_subset_combinations(self, subsets_per_object_type: dict[Type[Object], tuple[list[Object], range]],
+                                  object_types: list[Type[Object]], position: int = 0) -> Iterator[tuple[set[Object], ...]]:
+        """Yields one subset per object type for every combination, the first object type changing slowest. Unlike
+        itertools.product, the subsets are created again for every prefix instead of being materialised."""
+        if position == len(object_types):
+            yield ()
+            return
+        else:
+            pass
+
+        objects, subset_sizes = subsets_per_object_type[object_types[position]]
+        for subset in self._iter_object_subsets(objects=objects, subset_sizes=subset_sizes):
+            for remaining_subsets in self._iter_subset_combinations(subsets_per_object_type=subsets_per_object_type,
+                                                                    object_types=object_types, position=position + 1):
+                yield (subset,) + remaining_subsets
+
+    def _iter_joined_subset_combinations(self, subsets_per_object_type: dict[Type[Object], tuple[list[Object], range]],
+                                         object_types: list[Type[Object]]) -> Iterator[tuple[set[Object], ...]]:
+        """Yields one subset per object type like _iter_subset_combinations. Object types bound to exactly one object
+        that occur in join guards are joined first: each of them is either enumerated or, if a join guard relates it to
+        an object type joined before, looked up in a hash index of its available objects. The remaining object types
+        are combined with every joined tuple."""
+
+        single_object_types = {object_type for object_type, (_, subset_sizes) in subsets_per_object_type.items()
+                               if subset_sizes == range(1, 2)}
+        joined_object_types = []
+        lookups = []
+        for join_guard in self.join_guards:
+            for object_type in join_guard.object_types:
+                if object_type in single_object_types and object_type not in joined_object_types:
+                    joined_object_types.append(object_type)
+                    lookups.append(None)
+                else:
+                    pass
+
+        # use the first join guard relating an object type to one joined before for lookups of its objects
+        for position, object_type in enumerate(joined_object_types):
+            for join_guard in self.join_guards:
+                left_object_type, right_object_type = join_guard.object_types
+                objects = subsets_per_object_type[object_type][0]
+                if object_type == right_object_type and left_object_type in joined_object_types[:position]:
+                    lookups[position] = (left_object_type, join_guard.related_right_objects,
+                                         join_guard.create_right_index(objects))
+                    break
+                elif object_type == left_object_type and right_object_type in joined_object_types[:position]:
+                    lookups[position] = (right_object_type, join_guard.related_left_objects,
+                                         join_guard.create_left_index(objects))
+                    break
+                else:
+                    pass
+
+        remaining_object_types = [object_type for object_type in object_types
+                                  if object_type not in joined_object_types]
+        for joined_objects in self._iter_joined_objects(subsets_per_object_type=subsets_per_object_type,
+                                                        object_types=joined_object_types, lookups=lookups,
+                                                        bound_objects={}):
+            for remaining_subsets in self._iter_subset_combinations(subsets_per_object_type=subsets_per_object_type,
+                                                                    object_types=remaining_object_types):
+                subsets = dict(zip(remaining_object_types, remaining_subsets))
+                yield tuple({joined_objects[object_type]} if object_type in joined_objects else subsets[object_type]
+                            for object_type in object_types)
+
+    def _iter_joined_objects(self, subsets_per_object_type: dict[Type[Object], tuple[list[Object], range]],
+                             object_types: list[Type[Object]], lookups: list, bound_objects: dict[Type[Object], Object],
+                             position: int = 0) -> Iterator[dict[Type[Object], Object]]:
+        if position == len(object_types):
+            yield dict(bound_objects)
+            return
+        else:
+            pass
+
+        object_type = object_types[position]
+        if lookups[position] is None:
+            candidates = subsets_per_object_type[object_type][0]
         else:
-            # create all possible sets of tokens containing one subset of available tokens for each object type
-            object_type_keys = list(object_type_sets.keys())
+            bound_object_type, related_objects, index = lookups[position]
+            candidates = related_objects(bound_objects[bound_object_type], index)
+        for obj in candidates:
+            bound_objects[object_type] = obj
+            yield from self._iter_joined_objects(subsets_per_object_type=subsets_per_object_type,
+                                                 object_types=object_types, lookups=lookups,
+                                                 bound_objects=bound_objects, position=position + 1)
+        bound_objects.pop(object_type, None)
+
+    def first_enabled(self) -> BindingFunction | None:
+        """Returns the first enabled binding function, stops enumerating at the first hit."""
+        return next(self.iter_enabled_binding_functions(), None)
+
+    def any_enabled(self) -> bool:
+        """Returns whether the transition has at least one enabled binding function."""
+        return self.first_enabled() is not None
+
+    def take(self, k: int) -> list[BindingFunction]:
+        """Returns up to k enabled binding functions, stops enumerating after k hits."""
+        return list(islice(self.iter_enabled_binding_functions(), k))
 
-            # select one subset per dict entry
-            all_combinations = product(*(object_type_sets[key] for key in object_type_keys))
+    @property
+    def metrics(self) -> dict:
+        """Counters on the determination of enabled bindings of this transition."""
+        return {"sampling_attempts": self.sampling_attempts,
+                "sampling_acceptances": self.sampling_acceptances,
+                "candidates_before_filtering": dict(self.candidates_before_filtering),
+                "candidates_after_filtering": dict(self.candidates_after_filtering),
+                "marking_intersection_cache_hits": self.marking_intersection_cache_hits,
+                "marking_intersection_cache_misses": self.marking_intersection_cache_misses}
+
+    @property
+    def sampling_acceptance_rate(self) -> float:
+        if self.sampling_attempts:
+            return self.sampling_acceptances / self.sampling_attempts
+        else:
+            return 1
+
+    def sample_binding(self, rng: np.random.Generator = None) -> BindingFunction | None:
+        """Draws an enabled binding function uniformly at random without enumerating all bindings. A subset of objects
+        is drawn per object type by unranking a uniformly drawn rank among all its possible subsets, which gives a
+        uniformly drawn candidate binding; candidates are rejected until one passes the guard. If no candidate is
+        accepted within the maximum number of attempts, or if the acceptance rate observed for this transition is
+        below the minimum acceptance rate, the enabled bindings are enumerated and one of them is chosen instead."""
+
+        if rng is None:
+            if self.rng is None:
+                self.rng = np.random.default_rng()
+            else:
+                pass
+            rng = self.rng
+        else:
+            pass
+
+        binding_guard = self._binding_guard()
+        if binding_guard is None:
+            return None
+        else:
+            pass
+
+        subsets_per_object_type = self._binding_candidate_subsets()
+        if subsets_per_object_type is None:
+            return None
+        else:
+            pass
 
-            # create new dict per possible combination
-            possibly_enabled_binding_functions = [BindingFunction((zip(object_type_keys, combination)))
-                                                  for combination in all_combinations]
+        object_types = list(subsets_per_object_type.keys())
+        numbers_of_subsets = [sum(comb(len(objects), subset_size) for subset_size in subset_sizes)
+                              for objects, subset_sizes in subsets_per_object_type.values()]
+        if 0 in numbers_of_subsets:
+            return None
+        else:
+            pass
 
-        # check if binding fulfills guard requirements - object and quantity conditions
-        enabled_bindings = [binding_function for binding_function in possibly_enabled_binding_functions
-                            if self.guard(binding_function=binding_function,
-                                          quantity_state=self.quantity_state)]
+        if self.sampling_attempts >= self.maximum_sampling_attempts and \
+                self.sampling_acceptance_rate < self.minimum_acceptance_rate:
+            return self._choose_enumerated_binding(rng=rng, number_of_candidates=prod(numbers_of_subsets))
+        else:
+            pass
+
+        for _ in range(self.maximum_sampling_attempts):
+            self.sampling_attempts += 1
+            binding_function = BindingFunction()
+            for object_type, number_of_subsets in zip(object_types, numbers_of_subsets):
+                objects, subset_sizes = subsets_per_object_type[object_type]
+                rank = self._draw_rank(rng=rng, number=number_of_subsets)
+                binding_function[object_type] = self._unrank_object_subset(objects=objects, subset_sizes=subset_sizes,
+                                                                           rank=rank)
+            if binding_guard(binding_function):
+                self.sampling_acceptances += 1
+                return binding_function
+            else:
+                pass
+
+        return self._choose_enumerated_binding(rng=rng, number_of_candidates=prod(numbers_of_subsets))
 
+    def _choose_enumerated_binding(self, rng: np.random.Generator, number_of_candidates: int) -> BindingFunction | None:
+        """Enumerates all enabled bindings and chooses one uniformly. As the exact share of accepted candidates is
+        known afterwards, it replaces the sampling statistics of the transition."""
+        enabled_bindings = list(self.iter_enabled_binding_functions())
+        self.sampling_attempts = number_of_candidates
+        self.sampling_acceptances = len(enabled_bindings)
         if enabled_bindings:
-            return enabled_bindings
+            return enabled_bindings[rng.integers(len(enabled_bindings))]
         else:
             return None
 
+    @staticmethod
+    def _draw_rank(rng: np.random.Generator, number: int) -> int:
+        """Draws an integer uniformly from [0, number), also beyond the range of 64 bit integers."""
+        if number < 2 ** 63:
+            return int(rng.integers(number))
+        else:
+            bits = number.bit_length()
+            while True:
+                rank = int.from_bytes(rng.bytes((bits + 7) // 8), "little") >> (-bits % 8)
+                if rank < number:
+                    return rank
+                else:
+                    pass
+
+    @staticmethod
+    def _unrank_object_subset(objects: list[Object], subset_sizes: range, rank: int) -> set[Object]:
+        """Returns the subset with the passed rank in the order of _iter_object_subsets, i.e., by size and then in
+        lexicographic order of the positions of the objects."""
+        number_of_objects = len(objects)
+        for subset_size in subset_sizes:
+            number_of_subsets = comb(number_of_objects, subset_size)
+            if rank < number_of_subsets:
+                break
+            else:
+                rank -= number_of_subsets
+        else:
+            raise ValueError("Rank exceeds the number of subsets.")
+
+        subset = set()
+        position = 0
+        for remaining in range(subset_size, 0, -1):
+            # skip all subsets starting with objects before the selected one
+            while True:
+                number_of_subsets = comb(number_of_objects - position - 1, remaining - 1)
+                if rank < number_of_subsets:
+                    break
+                else:
+                    rank -= number_of_subsets
+                    position += 1
+            subset.add(objects[position])
+            position += 1
+        return subset
+
     def get_enabled_binding_functions_inputs(self) -> list[BindingFunction] | None:
         """Save processing time by returning cached enabled bindings. If no cached bindings are available, determine new
                 bindings. Also creates a pseudo-first-in-first-out order of bindings if FIFO binding selection is enabled."""
@@ -336,14 +639,22 @@ class Transition(ConnectedElement):
         else:
             pass
 
+        if self.sample_bindings and self.return_single_binding:
+            binding_function = self.sample_binding()
+            if binding_function is None:
+                return None
+            else:
+                return [binding_function]
+        else:
+            pass
+
         if self.binding_recalculation_default:
             # check if the cached bindings are still enabled. If yes, return them.
             if self.return_single_binding:
-                if self._enabled_bindings_cache is not None:
-                    # remove bindings as long as an enabled binding is found and return it.
-                    while len(self._enabled_bindings_cache) > 0:
-                        binding_function = self._enabled_bindings_cache.pop(0)
-                        if self.enabled(binding_function=binding_function, only_input=True):
+                if self._enabled_bindings_iterator is not None:
+                    # take bindings from the running enumeration as long as an enabled binding is found and return it.
+                    for binding_function in self._enabled_bindings_iterator:
+                        if self.enabled(binding_function=binding_function, only_input=True, only_active=True):
                             return [binding_function]
                         else:
                             pass
@@ -351,23 +662,20 @@ class Transition(ConnectedElement):
                 else:
                     pass
 
-                enabled_bindings = self.determine_new_binding_functions()
-                if enabled_bindings:
-                    if len(enabled_bindings) > 1:
-                        binding_function = enabled_bindings.pop(0)
-                        self._enabled_bindings_cache = enabled_bindings
-                        return [binding_function]
-                    else:
-                        self._enabled_bindings_cache = None
+                # start a new enumeration, which stops at the first enabled binding
+                self._enabled_bindings_iterator = self.iter_enabled_binding_functions()
+                binding_function = next(self._enabled_bindings_iterator, None)
+                if binding_function is None:
+                    self._enabled_bindings_iterator = None
+                    return None
                 else:
-                    self._enabled_bindings_cache = None
-
-                return enabled_bindings
+                    return [binding_function]
 
             else:
                 if self._enabled_bindings_cache is not None:
                     enabled_bindings = [binding_function for binding_function in self._enabled_bindings_cache if
-                                    self.enabled(binding_function=binding_function, only_input=True)]
+                                    self.enabled(binding_function=binding_function, only_input=True,
+                                                 only_active=True)]
 
                     if len(enabled_bindings) > 0:
                         self._enabled_bindings_cache = enabled_bindings
@@ -387,14 +695,41 @@ class Transition(ConnectedElement):
     def _input_places_marking_intersection(self, object_type: Type[Object]) -> set[Object] | set[None]:
         """Pass object type, returns set of objects which are part of the marking of all input places of this type."""
 
+        return self._cached_marking_intersection(object_type=object_type)[0]
+
+    def get_active_input_objects(self, object_type: Type[Object]) -> list[Object]:
+        """Pass object type, returns the active objects which are part of the marking of all input places of this
+        type, i.e., the objects available for bindings. The returned list must not be changed."""
+        return self._cached_marking_intersection(object_type=object_type)[1]
+
+    def _cached_marking_intersection(self, object_type: Type[Object]) -> tuple[MultisetObject, list[Object]]:
+        """Returns the marking intersection of the input places of the object type and its active objects. Both are
+        only determined again if the marking version of one of the places changed, which includes status changes of
+        marked objects."""
+
         places_of_type = self.get_input_places_of_otype(object_type=object_type)
+        marking_versions = tuple((place, place.marking_version) for place in places_of_type)
+        cached_intersection = self._marking_intersection_cache.get(object_type)
+        if cached_intersection is not None and cached_intersection[0] == marking_versions:
+            self.marking_intersection_cache_hits += 1
+            return cached_intersection[1], cached_intersection[2]
+        else:
+            self.marking_intersection_cache_misses += 1
+
         markings_of_places = [place.marking for place in places_of_type]
         marking_intersection = MultisetObject.intersection(*markings_of_places)
+        # read the active objects from the token index of the places instead of checking the status of every object
+        first_place, *other_places = places_of_type
+        marking_intersection_active = [obj for obj in first_place.active_tokens
+                                       if all(obj in place.active_tokens for place in other_places)]
+        self._marking_intersection_cache[object_type] = (marking_versions, marking_intersection,
+                                                         marking_intersection_active)
 
-        return marking_intersection
+        return marking_intersection, marking_intersection_active
 
 
-    def _binding_enabled(self, binding_function: BindingFunction, only_input: bool = False) -> bool:
+    def _binding_enabled(self, binding_function: BindingFunction, only_input: bool = False,
+                         only_active: bool = False) -> bool:
         """
         Checks whether a provided binding function dict {object_type: set of objects} can be executed with regard to the
         validity of the binding function and the availability of objects.
@@ -403,7 +738,8 @@ class Transition(ConnectedElement):
         types, the programme is halted): 1) checks whether the corresponding set contains exactly one element (if not,
         only continues if object type is variable), 2) creates intersection of all input places of the corresponding
         input type, 3) checks the set of object is a subset of the place markings. Returns True only if 3) is True for all
-        object types.
+        object types. If only_active is set, the objects also have to be active, as required for enabled bindings
+        before the execution of an event sets the bound objects active.
         Requirements:
         - binding function uses the classes of the ObjectTypes as keys and has a set of objects as value.
         - All none-variable object types refer to a set containing exactly one object.
@@ -449,18 +785,19 @@ class Transition(ConnectedElement):
             # get intersection of all markings of places of corresponding object type
             marking_intersection = self._input_places_marking_intersection(object_type=object_type)
 
-            # make sure that the referenced objects are part of all places of that type
-            if objects.issubset(marking_intersection):
+            # make sure that the referenced objects are part of all places of that type, membership is tested per
+            # object as set.issubset would convert the multiset into a set first
+            if all(obj in marking_intersection and (obj.status_active or not only_active) for obj in objects):
                 pass
             else:
                 return False
 
         return True
 
-    def enabled(self, binding_function: BindingFunction, only_input: bool = False) -> bool:
+    def enabled(self, binding_function: BindingFunction, only_input: bool = False, only_active: bool = False) -> bool:
         """ Returns True if quantity net is enabled under provided binding function."""
 
-        if self._binding_enabled(binding_function=binding_function, only_input=only_input):
+        if self._binding_enabled(binding_function=binding_function, only_input=only_input, only_active=only_active):
             if self.guard(binding_function=binding_function, quantity_state=self.quantity_state):
                 return True
             else:
@@ -533,7 +870,8 @@ class Transition(ConnectedElement):
                 if ex.execution_id == transition_execution:
                     return ex
                 else:
-                    raise ValueError(f"No execution with id {transition_execution} is a active in transition {self.name}.")
+                    pass
+            raise ValueError(f"No execution with id {transition_execution} is a active in transition {self.name}.")
         else:
             raise ValueError(f"Execution {transition_execution} cannot be identified -- passed element must be execution id "
                              f"(uuid) or execution object.")
@@ -0,0 +1,93 @@
+import numpy as np
+
+from qel_simulation.simulation.clock import MICROSECONDS_PER_DAY, MICROSECONDS_PER_HOUR
+
+# 1970-01-01, the epoch of the simulation clock, is a Thursday
+EPOCH_WEEKDAY = 3
+
+
+class ArrivalProcess:
+    """Poisson arrival process of objects with an expected number of arrivals per day (lambda). The rate can be
+    modulated by multipliers per hour of the day (24 values) and per weekday (7 values, starting with Monday), which
+    makes the process non-homogeneous; it is then sampled by thinning the process of the maximum rate, i.e., each
+    candidate arrival is accepted with probability rate(t) / maximum rate.
+    Exponential interarrival times (and acceptance draws) are sampled in batches of the passed size."""
+
+    def __init__(self, rate_per_day: float, rng: np.random.Generator, batch_size: int = 1024,
+                 hourly_profile: list[float] = None, weekday_profile: list[float] = None):
+
+        if rate_per_day >= 0:
+            pass
+        else:
+            raise ValueError("Arrival rate may not be negative.")
+        if batch_size >= 1:
+            pass
+        else:
+            raise ValueError("Batch size of arrival process has to be positive.")
+        if hourly_profile is None or (len(hourly_profile) == 24 and min(hourly_profile) >= 0):
+            pass
+        else:
+            raise ValueError("Hourly profile of arrival rate requires 24 non-negative multipliers.")
+        if weekday_profile is None or (len(weekday_profile) == 7 and min(weekday_profile) >= 0):
+            pass
+        else:
+            raise ValueError("Weekday profile of arrival rate requires 7 non-negative multipliers.")
+
+        self.rate_per_day = rate_per_day
+        self.rng = rng
+        self.batch_size = batch_size
+        self.hourly_profile = list(hourly_profile) if hourly_profile else None
+        self.weekday_profile = list(weekday_profile) if weekday_profile else None
+
+        max_multiplier = (max(self.hourly_profile) if self.hourly_profile else 1) * \
+                         (max(self.weekday_profile) if self.weekday_profile else 1)
+        self.max_rate_per_day = rate_per_day * max_multiplier
+
+        self._interarrival_times: list[int] = []
+        self._acceptance_draws: list[float] = []
+        self._position = 0
+
+    @property
+    def homogeneous(self) -> bool:
+        return self.hourly_profile is None and self.weekday_profile is None
+
+    def rate_multiplier(self, time_us: int) -> float:
+        """Multiplier of the arrival rate at the passed time of the simulation clock."""
+        multiplier = 1
+        if self.hourly_profile:
+            multiplier *= self.hourly_profile[(time_us % MICROSECONDS_PER_DAY) // MICROSECONDS_PER_HOUR]
+        if self.weekday_profile:
+            multiplier *= self.weekday_profile[(time_us // MICROSECONDS_PER_DAY + EPOCH_WEEKDAY) % 7]
+        return multiplier
+
+    def _refill(self):
+        scale = MICROSECONDS_PER_DAY / self.max_rate_per_day
+        interarrival_times = np.rint(self.rng.exponential(scale=scale, size=self.batch_size)).astype(np.int64)
+        self._interarrival_times = interarrival_times.tolist()
+        if self.homogeneous:
+            pass
+        else:
+            self._acceptance_draws = self.rng.uniform(size=self.batch_size).tolist()
+        self._position = 0
+
+    def next_arrival(self, time_us: int) -> int | None:
+        """Returns the time of the next arrival after the passed time, None if no objects arrive."""
+        if self.max_rate_per_day > 0:
+            pass
+        else:
+            return None
+
+        max_multiplier = self.max_rate_per_day / self.rate_per_day
+        while True:
+            if self._position < len(self._interarrival_times):
+                pass
+            else:
+                self._refill()
+            time_us += self._interarrival_times[self._position]
+            if self.homogeneous:
+                self._position += 1
+                return time_us
+            acceptance_draw = self._acceptance_draws[self._position]
+            self._position += 1
+            if acceptance_draw * max_multiplier < self.rate_multiplier(time_us):
+                return time_us
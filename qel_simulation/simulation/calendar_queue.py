@@ -0,0 +1,162 @@
+import bisect
+import datetime
+import heapq
+
+from qel_simulation.simulation.clock import timedelta_to_us, us_to_timedelta
+from qel_simulation.simulation.execution_queue import ExecutionQueue
+from qel_simulation.simulation.queue_config import QueueConfig
+
+
+class CalendarExecutionQueue(ExecutionQueue):
+    """Execution queue following the calendar queue of Brown (1988). Entries are hashed into a ring of buckets
+    ("days") of a fixed time width; each bucket is kept sorted by execution time and insertion sequence. Scheduling
+    and retrieving items takes amortized constant time as long as the bucket width matches the typical distance
+    between scheduled items. The number of buckets follows the number of queued items and the bucket width is
+    re-estimated from the items at the front of the queue whenever the queue is resized.
+    The calendar queue pays off for dense arrivals, i.e., many items per execution time as scheduled by arrival rates
+    with large lambdas: on a one-second grid, rescheduling an item takes about 2 us instead of 4 us in the heap queue
+    with 100000 pending items (benchmarks/execution_queue_benchmark.py, queue storage only). With distinct
+    execution times, every step moves a single item and the heap queue is faster (about 6 to 8 us instead of 9 to
+    12 us per item). In full simulation steps, creating the queue items dominates and both queues perform alike."""
+
+    # resize if the number of items exceeds (falls below) the number of buckets times the threshold
+    grow_threshold = 2
+    shrink_threshold = 0.5
+    # number of distinct execution times at the front of the queue used to estimate the bucket width on resize
+    width_sample_size = 25
+
+    def __init__(self, config: QueueConfig):
+        super().__init__(config)
+        if config.calendar_bucket_width > datetime.timedelta(0):
+            pass
+        else:
+            raise ValueError("Bucket width of the calendar queue has to be positive.")
+        if config.calendar_initial_buckets >= 1:
+            pass
+        else:
+            raise ValueError("Calendar queue requires at least one bucket.")
+
+        self._origin: int = self._current_time_us
+        self._bucket_width: int = timedelta_to_us(config.calendar_bucket_width)  # microseconds
+        self._minimum_buckets: int = config.calendar_initial_buckets
+        self._buckets: list[list[tuple]] = [[] for _ in range(self._minimum_buckets)]
+        self._size = 0
+        self._current_slot = 0  # slot (index of the bucket on an unbounded time axis) to start searching from
+
+    @property
+    def bucket_width(self) -> datetime.timedelta:
+        return us_to_timedelta(self._bucket_width)
+
+    @property
+    def number_of_buckets(self) -> int:
+        return len(self._buckets)
+
+    def _slot(self, execution_time: int) -> int:
+        return (execution_time - self._origin) // self._bucket_width
+
+    ##### storage #####
+
+    def _number_of_entries(self) -> int:
+        return self._size
+
+    def _push_entry(self, entry: tuple):
+        slot = (entry[0] - self._origin) // self._bucket_width
+        bucket = self._buckets[slot % len(self._buckets)]
+        # entries usually arrive in time order within a bucket, appending keeps it sorted without searching
+        if not bucket or entry > bucket[-1]:
+            bucket.append(entry)
+        else:
+            bisect.insort(bucket, entry)
+        self._size += 1
+        # items scheduled before the current search position (e.g., initial schedules) move the search back
+        if slot < self._current_slot:
+            self._current_slot = slot
+        if self._size > self.grow_threshold * len(self._buckets):
+            self._resize(2 * len(self._buckets))
+
+    def _push_entries(self, entries: list[tuple]):
+        for entry in entries:
+            self._push_entry(entry)
+
+    def _peek_entry(self) -> tuple | None:
+        if self._size:
+            pass
+        else:
+            return None
+
+        number_of_buckets = len(self._buckets)
+        slot = self._current_slot
+        for _ in range(number_of_buckets):
+            bucket = self._buckets[slot % number_of_buckets]
+            if bucket and self._slot(bucket[0][0]) == slot:
+                self._current_slot = slot
+                return bucket[0]
+            slot += 1
+
+        # no item within one full cycle of the calendar: search the earliest item directly
+        entry = min(bucket[0] for bucket in self._buckets if bucket)
+        self._current_slot = self._slot(entry[0])
+        return entry
+
+    def _pop_front_entry(self) -> tuple:
+        entry = self._peek_entry()
+        del self._buckets[self._current_slot % len(self._buckets)][0]
+        self._size -= 1
+        return entry
+
+    def _pop_entries_before(self, horizon: int) -> list[tuple]:
+        entries = []
+        entry = self._peek_entry()
+        while entry is not None and entry[0] < horizon:
+            bucket = self._buckets[self._current_slot % len(self._buckets)]
+            # entries are sorted, so the entries of the current slot before the horizon form a prefix of the bucket
+            slot_end = self._origin + (self._current_slot + 1) * self._bucket_width
+            number_of_entries = bisect.bisect_left(bucket, min(horizon, slot_end), key=lambda e: e[0])
+            entries.extend(bucket[:number_of_entries])
+            del bucket[:number_of_entries]
+            self._size -= number_of_entries
+            entry = self._peek_entry()
+
+        if len(self._buckets) > self._minimum_buckets and self._size < self.shrink_threshold * len(self._buckets):
+            self._resize(len(self._buckets) // 2)
+        return entries
+
+    def _entries(self) -> list[tuple]:
+        return [entry for bucket in self._buckets for entry in bucket]
+
+    def _rebuild(self, entries: list[tuple]):
+        self._distribute(entries=entries, number_of_buckets=len(self._buckets))
+
+    def _distribute(self, entries: list[tuple], number_of_buckets: int):
+        buckets = [[] for _ in range(number_of_buckets)]
+        origin, bucket_width = self._origin, self._bucket_width
+        for entry in entries:
+            buckets[(entry[0] - origin) // bucket_width % number_of_buckets].append(entry)
+        # sorting the buckets separately is cheaper than sorting all entries
+        for bucket in buckets:
+            if len(bucket) > 1:
+                bucket.sort()
+            else:
+                pass
+        self._buckets = buckets
+        self._size = len(entries)
+        self._current_slot = self._slot(min(entries)[0]) if entries else self._slot(self._current_time_us)
+
+    ##### resizing #####
+
+    def _estimate_bucket_width(self) -> int:
+        """Estimates the bucket width as the average distance between the next distinct execution times. Items
+        sharing an execution time cannot be split across buckets, so with many simultaneous items (e.g., arrivals on
+        a grid of seconds) a bucket holds about one execution time and new items are appended to it."""
+        times = heapq.nsmallest(self.width_sample_size, {entry[0] for entry in self._entries()})
+        if len(times) > 1:
+            return (times[-1] - times[0]) // (len(times) - 1)
+        else:
+            return self._bucket_width
+
+    def _resize(self, number_of_buckets: int):
+        entries = self._entries()
+        self._bucket_width = max(self._estimate_bucket_width(), 1)
+        self._origin = self._current_time_us
+        self._distribute(entries=entries, number_of_buckets=number_of_buckets)
+        self.statistics.resizes += 1
@@ -0,0 +1,27 @@
+import datetime
+
+# The simulation clock counts integer microseconds since the epoch. Queue items, the execution queue and the duration
+# samplers work on this representation; datetime and timedelta are only used at the API boundary (configuration,
+# events, objects and the quantity event log).
+EPOCH = datetime.datetime(1970, 1, 1)
+MICROSECOND = datetime.timedelta(microseconds=1)
+MICROSECONDS_PER_SECOND = 1_000_000
+MICROSECONDS_PER_MINUTE = 60 * MICROSECONDS_PER_SECOND
+MICROSECONDS_PER_HOUR = 60 * MICROSECONDS_PER_MINUTE
+MICROSECONDS_PER_DAY = 24 * MICROSECONDS_PER_HOUR
+
+
+def datetime_to_us(timestamp: datetime.datetime) -> int:
+    return (timestamp - EPOCH) // MICROSECOND
+
+
+def us_to_datetime(timestamp_us: int) -> datetime.datetime:
+    return EPOCH + datetime.timedelta(microseconds=timestamp_us)
+
+
+def timedelta_to_us(duration: datetime.timedelta) -> int:
+    return duration // MICROSECOND
+
+
+def us_to_timedelta(duration_us: int) -> datetime.timedelta:
+    return datetime.timedelta(microseconds=duration_us)
@@ -0,0 +1,132 @@
+import datetime
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from qel_simulation.simulation.clock import MICROSECONDS_PER_MINUTE, timedelta_to_us
+
+
+class DurationSampler(ABC):
+    """Draws non-negative durations in microseconds of the simulation clock. Parameters are specified in minutes.
+    Durations are drawn in batches of the passed size and handed out one by one; a new batch is drawn once the
+    current one is exhausted."""
+
+    def __init__(self, rng: np.random.Generator, batch_size: int = 1024):
+        if batch_size >= 1:
+            pass
+        else:
+            raise ValueError("Batch size of duration sampler has to be positive.")
+        self.rng = rng
+        self.batch_size = batch_size
+        self._batch: list[int] = []
+        self._position = 0
+
+    def __call__(self) -> int:
+        if self._position < len(self._batch):
+            pass
+        else:
+            self._refill()
+        duration = self._batch[self._position]
+        self._position += 1
+        return duration
+
+    def _refill(self):
+        minutes = self._draw_minutes(self.batch_size)
+        self._batch = np.rint(minutes * MICROSECONDS_PER_MINUTE).astype(np.int64).tolist()
+        self._position = 0
+
+    @abstractmethod
+    def _draw_minutes(self, size: int) -> np.ndarray:
+        """Draws a batch of durations in minutes."""
+        ...
+
+
+class FixedDurationSampler(DurationSampler):
+    """Hands out the same duration, served in batches like the drawn durations."""
+
+    def __init__(self, duration: datetime.timedelta | int | float, rng: np.random.Generator = None,
+                 batch_size: int = 1024):
+        super().__init__(rng=rng, batch_size=batch_size)
+        if isinstance(duration, datetime.timedelta):
+            self.duration = timedelta_to_us(duration)
+        elif isinstance(duration, (int, float)):
+            self.duration = round(duration * MICROSECONDS_PER_MINUTE)
+        else:
+            raise ValueError("Duration has to be of type datetime.timedelta, int or float.")
+        if self.duration >= 0:
+            pass
+        else:
+            raise ValueError("Fixed duration may not be negative.")
+
+    def _draw_minutes(self, size: int) -> np.ndarray:
+        return np.full(size, self.duration / MICROSECONDS_PER_MINUTE)
+
+
+class UniformDurationSampler(DurationSampler):
+    """Uniform distribution truncated to non-negative values, i.e., uniform between max(low, 0) and high."""
+
+    def __init__(self, low: float, high: float, rng: np.random.Generator, batch_size: int = 1024):
+        super().__init__(rng=rng, batch_size=batch_size)
+        if high >= 0 and high >= low:
+            pass
+        else:
+            raise ValueError("Uniform duration requires 0 <= high and low <= high.")
+        self.low = max(low, 0)
+        self.high = high
+
+    def _draw_minutes(self, size: int) -> np.ndarray:
+        return self.rng.uniform(low=self.low, high=self.high, size=size)
+
+
+class TruncatedNormalDurationSampler(DurationSampler):
+    """Normal distribution truncated to non-negative values, drawn by vectorised rejection sampling."""
+
+    # maximum number of rejection rounds per batch before the parameters are considered unsuitable
+    max_rounds = 50
+
+    def __init__(self, mean: float, std: float, rng: np.random.Generator, batch_size: int = 1024):
+        super().__init__(rng=rng, batch_size=batch_size)
+        if std >= 0:
+            pass
+        else:
+            raise ValueError("Standard deviation of normal duration may not be negative.")
+        self.mean = mean
+        self.std = std
+
+    def _draw_minutes(self, size: int) -> np.ndarray:
+        accepted = []
+        number_accepted = 0
+        for _ in range(self.max_rounds):
+            draws = self.rng.normal(loc=self.mean, scale=self.std, size=size)
+            draws = draws[draws >= 0]
+            accepted.append(draws)
+            number_accepted += len(draws)
+            if number_accepted >= size:
+                return np.concatenate(accepted)[:size]
+        if number_accepted:
+            return np.concatenate(accepted)
+        else:
+            raise ValueError("The provided parameters for drawing a duration did not achieve a positive duration. "
+                             "Provide different parameters and try again..")
+
+
+class BetaDurationSampler(DurationSampler):
+
+    def __init__(self, a: float, b: float, rng: np.random.Generator, batch_size: int = 1024):
+        super().__init__(rng=rng, batch_size=batch_size)
+        self.a = a
+        self.b = b
+
+    def _draw_minutes(self, size: int) -> np.ndarray:
+        return self.rng.beta(a=self.a, b=self.b, size=size)
+
+
+class GammaDurationSampler(DurationSampler):
+
+    def __init__(self, shape: float, scale: float, rng: np.random.Generator, batch_size: int = 1024):
+        super().__init__(rng=rng, batch_size=batch_size)
+        self.shape = shape
+        self.scale = scale
+
+    def _draw_minutes(self, size: int) -> np.ndarray:
+        return self.rng.gamma(shape=self.shape, scale=self.scale, size=size)
@@ -1,7 +1,11 @@
 import datetime
+import heapq
+import itertools
+import time
 from collections import Counter
-from typing import Type
+from typing import Type, Callable, Iterable
 
+from qel_simulation.simulation.clock import datetime_to_us, us_to_datetime, timedelta_to_us, us_to_timedelta
 from qel_simulation.simulation.event import Event
 from qel_simulation.simulation.object import Object, Status
 from qel_simulation.qnet_elements.object_place import ObjectPlace
@@ -37,13 +41,28 @@ class ScheduleTypeArrivalRate(ScheduleType):
 
 
 class QueueItem:
+    """Base of all scheduled items. Items use __slots__ to keep queues with many items small; the item type tag is
+    used to dispatch items to their handlers without isinstance checks."""
+    __slots__ = ("execution_time_us",)
+    item_type: str = None
 
-    def __init__(self, execution_time: datetime.datetime):
-        self.execution_time = execution_time
+    def __init__(self, execution_time: datetime.datetime | int):
+        """Execution time is either a datetime or a timestamp of the simulation clock in microseconds."""
+        self.execution_time_us = execution_time if isinstance(execution_time, int) else datetime_to_us(execution_time)
+
+    @property
+    def execution_time(self) -> datetime.datetime:
+        return us_to_datetime(self.execution_time_us)
+
+    @execution_time.setter
+    def execution_time(self, execution_time: datetime.datetime):
+        self.execution_time_us = datetime_to_us(execution_time)
 
 class EndEvent(QueueItem):
+    __slots__ = ("event", "execution")
+    item_type = "end_event"
 
-    def __init__(self, execution_time: datetime.datetime,
+    def __init__(self, execution_time: datetime.datetime | int,
                  event: Event,
                  execution):
         super().__init__(execution_time)
@@ -57,8 +76,10 @@ class EndEvent(QueueItem):
         return f"End Event '{self.event.activity.activity_name}'"
 
 class StartEvent(QueueItem):
+    __slots__ = ("activity", "input_binding", "event_duration")
+    item_type = "start_event"
 
-    def __init__(self, execution_time: datetime.datetime,
+    def __init__(self, execution_time: datetime.datetime | int,
                  activity: Type[Event],
                  input_binding: dict[Type[Object]: set[Object]],
                  event_duration: datetime.timedelta = None):
@@ -75,8 +96,11 @@ class StartEvent(QueueItem):
 
 
 class ObjectCreation(QueueItem):
+        __slots__ = ("object_type", "initial_attributes", "initial_quantities", "o2o", "location", "add_to_binding",
+                     "schedule_type")
+        item_type = "object_creation"
 
-        def __init__(self, execution_time: datetime.datetime, object_type: Type[Object] | str, initial_attributes: dict = None,
+        def __init__(self, execution_time: datetime.datetime | int, object_type: Type[Object] | str, initial_attributes: dict = None,
                      quantities: Counter = None, location: set[ObjectPlace] | set[str] = None, add_to_binding: bool = False,
                      schedule_type: ScheduleType = None, o2o: dict[Object: str] = None):
             super().__init__(execution_time)
@@ -96,8 +120,10 @@ class ObjectCreation(QueueItem):
 
 class ObjectAttributeChange(QueueItem):
     """Entry defining the changing of object attributes at specified time."""
+    __slots__ = ("object", "attribute_changes")
+    item_type = "object_attribute_change"
 
-    def __init__(self, execution_time: datetime.datetime, object: Object, attribute_changes: dict):
+    def __init__(self, execution_time: datetime.datetime | int, object: Object, attribute_changes: dict):
         super().__init__(execution_time)
         self.object = object
         self.attribute_changes = attribute_changes
@@ -110,16 +136,20 @@ class ObjectAttributeChange(QueueItem):
 
 class ObjectQuantityChange(QueueItem):
     """Entry defining the changing of object quantities at specified time."""
+    __slots__ = ("object", "quantity_changes")
+    item_type = "object_quantity_change"
 
-    def __init__(self, execution_time: datetime.datetime, object: Object, quantity_changes: Counter):
+    def __init__(self, execution_time: datetime.datetime | int, object: Object, quantity_changes: Counter):
         super().__init__(execution_time)
         self.object = object
         self.quantity_changes = quantity_changes
 
 class ObjectStatusChange(QueueItem):
     """Entry defining the changing of object status at specified time."""
+    __slots__ = ("object", "status")
+    item_type = "object_status_change"
 
-    def __init__(self, execution_time: datetime.datetime, object: Object, status: Status):
+    def __init__(self, execution_time: datetime.datetime | int, object: Object, status: Status):
         super().__init__(execution_time)
         self.object = object
         self.status = status
@@ -131,40 +161,271 @@ class ObjectStatusChange(QueueItem):
         return f"Object Status -> {self.status} '{self.object}'"
 
 
+class QueueStatistics:
+    """Counts the operations of a queue and reports the resulting throughput since the queue was created."""
+
+    def __init__(self):
+        self.enqueued = 0
+        self.dequeued = 0
+        self.resizes = 0
+        self.cancelled = 0
+        self.compactions = 0
+        self.batches = 0
+        self.snapped = 0  # items executed before their execution time due to the time granularity
+        self.total_snap_error_us = 0
+        self.max_snap_error_us = 0
+        self._start = time.perf_counter()
+
+    @property
+    def elapsed_time(self) -> float:
+        return time.perf_counter() - self._start
+
+    @property
+    def enqueue_throughput(self) -> float:
+        """Enqueued items per second."""
+        return self.enqueued / self.elapsed_time
+
+    @property
+    def dequeue_throughput(self) -> float:
+        """Dequeued items per second."""
+        return self.dequeued / self.elapsed_time
+
+    def reset(self):
+        self.enqueued = 0
+        self.dequeued = 0
+        self.resizes = 0
+        self.cancelled = 0
+        self.compactions = 0
+        self.batches = 0
+        self.snapped = 0
+        self.total_snap_error_us = 0
+        self.max_snap_error_us = 0
+        self._start = time.perf_counter()
+
+    @property
+    def mean_snap_error(self) -> datetime.timedelta:
+        """Mean shift of the dequeued items from their execution time to the time they were executed at."""
+        return us_to_timedelta(self.total_snap_error_us // self.dequeued if self.dequeued else 0)
+
+    @property
+    def max_snap_error(self) -> datetime.timedelta:
+        return us_to_timedelta(self.max_snap_error_us)
+
+
+class QueueHandle:
+    """Handle of a scheduled queue item, returned by the scheduling methods of the queue and used to cancel it."""
+
+    def __init__(self, item: QueueItem, sequence: int):
+        self.item = item
+        self.sequence = sequence
+        self.cancelled = False
+        self.dequeued = False
+
+    @property
+    def execution_time(self) -> datetime.datetime:
+        return self.item.execution_time
+
+    @property
+    def execution_time_us(self) -> int:
+        return self.item.execution_time_us
+
+    @property
+    def pending(self) -> bool:
+        return not (self.cancelled or self.dequeued)
+
+
 class ExecutionQueue:
+    """Queue of scheduled items. Items are kept in a binary heap keyed by their execution time and an insertion
+    sequence number, so items scheduled for the same time are returned in the order in which they were added.
+    Internally, all times are integer microseconds of the simulation clock; the datetime of the current time is only
+    determined when the time changes. With a time granularity, all items scheduled within [t, t + granularity) are
+    treated as one batch that is executed at time t, preserving their order.
+    Alternative storages (e.g., the calendar queue) override the methods of the storage section below.
+    Scheduled items can be cancelled through the handle returned by the schedule methods. Cancelled entries stay in
+    the storage as tombstones and are skipped when they reach the front of the queue; the storage is compacted once
+    the share of tombstones exceeds the compaction ratio of the queue config."""
 
     def __init__(self, config: QueueConfig):
-        self._queue = []
+        self._queue = []  # heap of (execution time, sequence number, queue item)
+        self._sequence = itertools.count()
         self.config: QueueConfig = config
+        self._current_time_us = datetime_to_us(self.config.initial_time)
         self._current_time = self.config.initial_time
+        self._granularity_us: int = max(timedelta_to_us(self.config.time_granularity), 1)
+        self._horizon_us = self._current_time_us + self._granularity_us  # items before the horizon are current
+        self.statistics = QueueStatistics()
+        self._handles: dict[int, QueueHandle] = {}  # pending items scheduled with a handle by sequence number
+        self._tombstones: set[int] = set()  # sequence numbers of cancelled entries still in the storage
+        # transformations of instructions to queue items by instruction type, subclasses are resolved on first use
+        self._instruction_handlers: dict[Type[Instruction], Callable[[Instruction, ScheduleType], QueueItem]] = {
+            InstructionExecuteEvent:
+                lambda instruction, schedule_type: self.transform_event_start_instruction_to_queue_item(instruction),
+            InstructionObjectCreation: self.transform_object_creation_instruction_to_queue_item,
+            InstructionTerminateEvent:
+                lambda instruction, schedule_type: self.transform_end_instruction_to_queue_item(instruction),
+            InstructionObjectStatusUpdate:
+                lambda instruction, schedule_type: self.transform_status_change_instruction_to_queue_item(instruction),
+            InstructionObjectAttributeUpdate:
+                lambda instruction, schedule_type: self.transform_attribute_change_instruction_to_queue_item(
+                    instruction),
+            InstructionObjectQuantityUpdate:
+                lambda instruction, schedule_type: self.transform_quantity_change_instruction_to_queue_item(
+                    instruction),
+        }
 
 
     @property
-    def time(self):
+    def time(self) -> datetime.datetime:
         return self._current_time
 
+    @property
+    def time_us(self) -> int:
+        return self._current_time_us
+
+    def is_current(self, queue_item: QueueItem) -> bool:
+        """Returns whether the queue item belongs to the batch of the current time."""
+        return self._current_time_us <= queue_item.execution_time_us < self._horizon_us
+
     @property
     def queue(self):
-        return sorted(self._queue, key=lambda x: x.execution_time)
+        return [entry[-1] for entry in sorted(self._entries()) if entry[1] not in self._tombstones]
 
-    def add_entry_to_queue(self, queue_item: QueueItem):
-        # time_new_item = queue_item.execution_time
-        # if time_new_item in self.get_all_execution_times_in_queue():
-        #     time_new_item += datetime.timedelta(seconds=uniform(1, 600))
-        #     queue_item.execution_time = time_new_item
-        self._queue.append(queue_item)
+    def __len__(self):
+        return self._number_of_entries() - len(self._tombstones)
 
-    def update_time(self):
-        self._current_time = min([item.execution_time for item in self._queue]) if self._queue else self._current_time
+    ##### storage #####
+
+    def _number_of_entries(self) -> int:
+        return len(self._queue)
+
+    def _push_entry(self, entry: tuple):
+        heapq.heappush(self._queue, entry)
 
-    def get_current_items(self) -> set[QueueItem]:
-        relevant_items = {item for item in self._queue if item.execution_time == self.time}
-        return relevant_items
+    def _push_entries(self, entries: list[tuple]):
+        # re-heapifying takes linear time, pushing each entry k log n: heapify only for large batches
+        if len(entries) * max(len(self._queue), 2).bit_length() > len(self._queue) + len(entries):
+            self._queue.extend(entries)
+            heapq.heapify(self._queue)
+        else:
+            for entry in entries:
+                heapq.heappush(self._queue, entry)
+
+    def _peek_entry(self) -> tuple | None:
+        return self._queue[0] if self._queue else None
+
+    def _pop_front_entry(self) -> tuple:
+        return heapq.heappop(self._queue)
+
+    def _pop_entries_before(self, horizon: int) -> list[tuple]:
+        """Pops all entries scheduled before the horizon in the order of the queue."""
+        entries = []
+        while self._queue and self._queue[0][0] < horizon:
+            entries.append(heapq.heappop(self._queue))
+        return entries
+
+    def _entries(self) -> list[tuple]:
+        return self._queue
+
+    def _rebuild(self, entries: list[tuple]):
+        self._queue = entries
+        heapq.heapify(self._queue)
+
+    ##### scheduling #####
+
+    def add_entry_to_queue(self, queue_item: QueueItem) -> tuple:
+        """Adds the queue item and returns its queue entry (execution time, sequence number, queue item)."""
+        entry = (queue_item.execution_time_us, next(self._sequence), queue_item)
+        self._push_entry(entry)
+        self.statistics.enqueued += 1
+        return entry
+
+    def add_entries_to_queue(self, queue_items: list[QueueItem]) -> list[tuple]:
+        """Adds the queue items in one batch and returns their queue entries."""
+        entries = [(queue_item.execution_time_us, next(self._sequence), queue_item) for queue_item in queue_items]
+        self._push_entries(entries)
+        self.statistics.enqueued += len(entries)
+        return entries
+
+    def schedule_item(self, queue_item: QueueItem) -> QueueHandle:
+        """Adds the queue item and returns a handle to cancel it."""
+        return self._register_handle(self.add_entry_to_queue(queue_item))
+
+    def schedule_instruction(self, instruction: Instruction, schedule_type: ScheduleType = None) -> QueueHandle:
+        """Schedules the instruction like add_instruction and returns a handle to cancel the resulting queue item."""
+        return self._register_handle(self.add_instruction(instruction, schedule_type=schedule_type))
+
+    def _register_handle(self, entry: tuple) -> QueueHandle:
+        handle = QueueHandle(item=entry[-1], sequence=entry[1])
+        self._handles[entry[1]] = handle
+        return handle
+
+    def cancel(self, handle: QueueHandle) -> bool:
+        """Cancels the scheduled item of the handle. Returns False if the item was already dequeued or cancelled."""
+        if self._handles.pop(handle.sequence, None) is handle:
+            pass
+        else:
+            return False
+
+        handle.cancelled = True
+        self._tombstones.add(handle.sequence)
+        self.statistics.cancelled += 1
+        if len(self._tombstones) > self.config.compaction_ratio * self._number_of_entries():
+            self.compact()
+        return True
+
+    def compact(self):
+        """Removes all tombstones from the storage."""
+        if self._tombstones:
+            self._rebuild([entry for entry in self._entries() if entry[1] not in self._tombstones])
+            self._tombstones.clear()
+            self.statistics.compactions += 1
+
+    def _filter_dequeued_entries(self, entries: list[tuple]) -> list[tuple]:
+        if self._tombstones:
+            live_entries = [entry for entry in entries if entry[1] not in self._tombstones]
+            self._tombstones.difference_update(entry[1] for entry in entries)
+            entries = live_entries
+        if self._handles:
+            for entry in entries:
+                handle = self._handles.pop(entry[1], None)
+                if handle:
+                    handle.dequeued = True
+        return entries
 
-    def get_and_remove_current_items(self) -> set[QueueItem]:
-        items = self.get_current_items()
-        self.remove_items_from_queue(items)
-        return items
+    def update_time(self):
+        entry = self._peek_entry()
+        # discard cancelled entries at the front so that the time only advances to items that are executed
+        while entry is not None and entry[1] in self._tombstones:
+            self._pop_front_entry()
+            self._tombstones.remove(entry[1])
+            entry = self._peek_entry()
+        if entry is not None and entry[0] != self._current_time_us:
+            self._current_time_us = entry[0]
+            self._current_time = us_to_datetime(entry[0])
+            self._horizon_us = entry[0] + self._granularity_us
+
+    def get_current_items(self) -> list[QueueItem]:
+        """Returns the items scheduled for the current time without removing them from the queue."""
+        relevant_entries = sorted(entry for entry in self._entries()
+                                  if self._current_time_us <= entry[0] < self._horizon_us
+                                  and entry[1] not in self._tombstones)
+        return [entry[-1] for entry in relevant_entries]
+
+    def get_and_remove_current_items(self) -> list[QueueItem]:
+        """Pops all items of the current batch in the order of their execution time and the order they were added to
+        the queue."""
+        entries = self._filter_dequeued_entries(self._pop_entries_before(self._horizon_us))
+        statistics = self.statistics
+        statistics.dequeued += len(entries)
+        statistics.batches += 1
+        if entries and entries[-1][0] > self._current_time_us:
+            for entry in entries:
+                snap_error = entry[0] - self._current_time_us
+                if snap_error > 0:
+                    statistics.snapped += 1
+                    statistics.total_snap_error_us += snap_error
+                    statistics.max_snap_error_us = max(statistics.max_snap_error_us, snap_error)
+        return [entry[-1] for entry in entries]
 
     # def get_and_remove_current_object_creations(self) -> set[ObjectCreation]:
     #     items = self.get_current_items()
@@ -173,25 +434,26 @@ class ExecutionQueue:
     #     return object_creations
 
     def remove_items_from_queue(self, items: set[QueueItem]):
-        self._queue = list(set(self._queue) - items)
+        self._rebuild([entry for entry in self._entries() if entry[-1] not in items and entry[1] not in self._tombstones])
+        self._tombstones.clear()
+        for sequence, handle in list(self._handles.items()):
+            if handle.item in items:
+                handle.dequeued = True
+                del self._handles[sequence]
 
-    def determine_timestamp_from_duration(self, duration: datetime.timedelta) -> datetime.datetime:
-        return self.time + duration
+    def determine_timestamp_from_duration(self, duration_us: int) -> int:
+        return self._current_time_us + duration_us
 
     def add_object_creation(self, object_creation: InstructionObjectCreation, schedule_type: ScheduleType = None):
 
-        qitem = self.transform_object_creation_instruction_to_queue_item(object_creation)
+        qitem = self.transform_object_creation_instruction_to_queue_item(object_creation, schedule_type=schedule_type)
 
-        if isinstance(schedule_type, ScheduleType):
-            qitem.schedule_type = schedule_type
-        else:
-            pass
-
-        self.add_entry_to_queue(qitem)
+        return self.add_entry_to_queue(qitem)
 
-    def transform_object_creation_instruction_to_queue_item(self, object_creation: InstructionObjectCreation) -> ObjectCreation:
+    def transform_object_creation_instruction_to_queue_item(self, object_creation: InstructionObjectCreation,
+                                                            schedule_type: ScheduleType = None) -> ObjectCreation:
 
-        execution_timestamp = self.determine_timestamp_from_duration(object_creation.timedelta)
+        execution_timestamp = self.determine_timestamp_from_duration(object_creation.timedelta_us)
 
         qitem = ObjectCreation(execution_time=execution_timestamp,
                                object_type=object_creation.object_type,
@@ -201,17 +463,22 @@ class ExecutionQueue:
                                add_to_binding=object_creation.add_to_binding,
                                o2o=object_creation.o2o)
 
+        if isinstance(schedule_type, ScheduleType):
+            qitem.schedule_type = schedule_type
+        else:
+            pass
+
         return qitem
 
     def add_event_start(self, event_instruction: InstructionExecuteEvent):
 
         qitem = self.transform_event_start_instruction_to_queue_item(event_instruction)
 
-        self.add_entry_to_queue(qitem)
+        return self.add_entry_to_queue(qitem)
 
     def transform_event_start_instruction_to_queue_item(self, event_instruction: InstructionExecuteEvent) -> StartEvent:
 
-        execution_timestamp = self.determine_timestamp_from_duration(event_instruction.timedelta)
+        execution_timestamp = self.determine_timestamp_from_duration(event_instruction.timedelta_us)
 
         qitem = StartEvent(execution_time=execution_timestamp,
                            activity=event_instruction.activity,
@@ -222,13 +489,19 @@ class ExecutionQueue:
 
     def add_end_queue_item(self, termination_instruction: InstructionTerminateEvent):
 
-        execution_timestamp = self.determine_timestamp_from_duration(duration=termination_instruction.timedelta)
+        qitem = self.transform_end_instruction_to_queue_item(termination_instruction)
+
+        return self.add_entry_to_queue(qitem)
+
+    def transform_end_instruction_to_queue_item(self, termination_instruction: InstructionTerminateEvent) -> EndEvent:
+
+        execution_timestamp = self.determine_timestamp_from_duration(termination_instruction.timedelta_us)
 
         qitem = EndEvent(execution_time=execution_timestamp,
                          event=termination_instruction.event,
                          execution=termination_instruction.execution)
 
-        self.add_entry_to_queue(qitem)
+        return qitem
 
     # def get_and_remove_current_event_starts(self) -> set[StartEvent]:
     #     items = self.get_current_items()
@@ -236,45 +509,69 @@ class ExecutionQueue:
     #     self.remove_items_from_queue(event_starts)
     #     return event_starts
 
-    def add_instruction(self, instruction: Instruction, schedule_type: ScheduleType = None):
-
-        if isinstance(instruction, InstructionExecuteEvent):
-            self.add_event_start(instruction)
-        elif isinstance(instruction, InstructionObjectCreation):
-            self.add_object_creation(instruction, schedule_type=schedule_type)
-        elif isinstance(instruction, InstructionTerminateEvent):
-            self.add_end_queue_item(instruction)
-        elif isinstance(instruction, InstructionObjectStatusUpdate):
-            self.add_status_change_item(instruction)
-        elif isinstance(instruction, InstructionObjectAttributeUpdate):
-            self.add_attribute_change_item(instruction)
-        elif isinstance(instruction, InstructionObjectQuantityUpdate):
-            self.add_quantity_change_item(instruction)
+    def add_instruction(self, instruction: Instruction, schedule_type: ScheduleType = None) -> tuple:
+        """Schedules the instruction and returns the queue entry of the resulting queue item."""
+        return self.add_entry_to_queue(self.transform_instruction_to_queue_item(instruction, schedule_type))
+
+    def add_instructions(self, instructions: Iterable[Instruction], schedule_type: ScheduleType = None) -> bool:
+        """Schedules all instructions in one batch. Returns whether any of them belongs to the batch of the current
+        time."""
+        queue_items = [self.transform_instruction_to_queue_item(instruction, schedule_type)
+                       for instruction in instructions]
+        self.add_entries_to_queue(queue_items)
+        return any(self.is_current(queue_item) for queue_item in queue_items)
+
+    def transform_instruction_to_queue_item(self, instruction: Instruction,
+                                            schedule_type: ScheduleType = None) -> QueueItem:
+        handler = self._instruction_handlers.get(instruction.__class__)
+        if handler:
+            pass
         else:
-            raise ValueError("Instruction type not supported.")
+            handler = self._resolve_instruction_handler(instruction.__class__)
+        return handler(instruction, schedule_type)
+
+    def _resolve_instruction_handler(self, instruction_type: Type[Instruction]) \
+            -> Callable[[Instruction, ScheduleType], QueueItem]:
+        for base_type in instruction_type.__mro__:
+            if base_type in self._instruction_handlers:
+                self._instruction_handlers[instruction_type] = self._instruction_handlers[base_type]
+                return self._instruction_handlers[base_type]
+        raise ValueError("Instruction type not supported.")
 
     def add_status_change_item(self, instruction: InstructionObjectStatusUpdate):
+        return self.add_entry_to_queue(self.transform_status_change_instruction_to_queue_item(instruction))
 
-        execution_timestamp = self.determine_timestamp_from_duration(duration=instruction.timedelta)
+    def transform_status_change_instruction_to_queue_item(self, instruction: InstructionObjectStatusUpdate) \
+            -> ObjectStatusChange:
+
+        execution_timestamp = self.determine_timestamp_from_duration(instruction.timedelta_us)
         item = ObjectStatusChange(execution_time=execution_timestamp, object=instruction.object,
                                   status=instruction.new_status)
-        self.add_entry_to_queue(item)
+        return item
 
     def add_attribute_change_item(self, instruction: InstructionObjectAttributeUpdate):
+        return self.add_entry_to_queue(self.transform_attribute_change_instruction_to_queue_item(instruction))
+
+    def transform_attribute_change_instruction_to_queue_item(self, instruction: InstructionObjectAttributeUpdate) \
+            -> ObjectAttributeChange:
 
-        execution_timestamp = self.determine_timestamp_from_duration(duration=instruction.timedelta)
+        execution_timestamp = self.determine_timestamp_from_duration(instruction.timedelta_us)
         item = ObjectAttributeChange(execution_time=execution_timestamp, object=instruction.object,
                                   attribute_changes=instruction.attribute_changes)
-        self.add_entry_to_queue(item)
+        return item
 
     def add_quantity_change_item(self, instruction: InstructionObjectQuantityUpdate):
+        return self.add_entry_to_queue(self.transform_quantity_change_instruction_to_queue_item(instruction))
+
+    def transform_quantity_change_instruction_to_queue_item(self, instruction: InstructionObjectQuantityUpdate) \
+            -> ObjectQuantityChange:
 
-        execution_timestamp = self.determine_timestamp_from_duration(duration=instruction.timedelta)
+        execution_timestamp = self.determine_timestamp_from_duration(instruction.timedelta_us)
         item = ObjectQuantityChange(execution_time=execution_timestamp, object=instruction.object,
                                     quantity_changes=instruction.quantity_changes)
-        self.add_entry_to_queue(item)
+        return item
 
     def get_all_execution_times_in_queue(self) -> set[datetime.datetime]:
-        return {item.execution_time for item in self.queue}
+        return {us_to_datetime(entry[0]) for entry in self._entries() if entry[1] not in self._tombstones}
 
 
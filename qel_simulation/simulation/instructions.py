@@ -2,6 +2,7 @@ import datetime
 from collections import Counter
 from typing import Type, Any
 
+from qel_simulation.simulation.clock import timedelta_to_us, us_to_timedelta
 from qel_simulation.simulation.object import Object, Status, BindingFunction, MultisetObject
 from qel_simulation.qnet_elements.object_place import ObjectPlace
 
@@ -10,8 +11,18 @@ from qel_simulation.qnet_elements.object_place import ObjectPlace
 
 class Instruction:
 
-    def __init__(self, time_until_execution: datetime.timedelta):
-        self.timedelta = time_until_execution
+    def __init__(self, time_until_execution: datetime.timedelta | int):
+        """Time until execution is either a timedelta or an integer number of microseconds."""
+        self.timedelta_us = time_until_execution if isinstance(time_until_execution, int) \
+            else timedelta_to_us(time_until_execution)
+
+    @property
+    def timedelta(self) -> datetime.timedelta:
+        return us_to_timedelta(self.timedelta_us)
+
+    @timedelta.setter
+    def timedelta(self, time_until_execution: datetime.timedelta):
+        self.timedelta_us = timedelta_to_us(time_until_execution)
 
 
 class InstructionObjectCreation(Instruction):
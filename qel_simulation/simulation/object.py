@@ -1,6 +1,6 @@
 import datetime
 from collections import Counter
-from typing import Type
+from typing import Type, Callable
 
 from multiset import Multiset
 
@@ -83,7 +83,7 @@ class Object(LogElement):
     object_count = 0
     default_attributes = {"_id", "_status", "_log_object", "_name", "_label", "_properties", "object_type",
                           "quantities", 'last_change_attributes', 'last_change_quantities', "o2o",
-                          "changed_attributes", "object_type_name"}
+                          "changed_attributes", "object_type_name", "_status_observers"}
     object_type_name = ""
     log_object_type = True
 
@@ -100,6 +100,7 @@ class Object(LogElement):
         self.last_change_quantities = timestamp
         self.o2o = o2o if o2o else dict()
         self._status = StatusCreated()
+        self._status_observers: list[Callable[["Object", Status, Status], None]] = []
         self._log_object = type(self).log_object_type
 
         Object.object_count += 1
@@ -110,11 +111,18 @@ class Object(LogElement):
 
     @status.setter
     def status(self, status: Status):
+        previous_status = self._status
         self._status = status
+        if type(previous_status) is not type(status):
+            for observer in self._status_observers:
+                observer(self, previous_status, status)
 
-    @status.setter
-    def status(self, status: Status):
-        self._status = status
+    def add_status_observer(self, observer: Callable[["Object", Status, Status], None]):
+        """Observer is called with the object, the previous and the new status whenever the status changes."""
+        self._status_observers.append(observer)
+
+    def remove_status_observer(self, observer: Callable[["Object", Status, Status], None]):
+        self._status_observers.remove(observer)
 
     @property
     def status_active(self):
@@ -49,8 +49,10 @@ class QnetConfig(BaseElement):
         # transition labels (equivalent to activity names) (mandatory, if activities should be assigned to transitions)
         self.transition_labels: dict[str: str] = {}
         # transition specifying what combinations of objects or what object attribute-value combinations are allowed
-        # for firing this transition. (optional)
-        self.transition_object_guard: dict[str: Callable[[BindingFunction], bool]] = {}
+        # for firing this transition. Conditions on single objects are passed as object filters
+        # {object_type_name: Callable[[Object], bool]} and applied before bindings are built; a list combines an
+        # object guard and object filters. (optional)
+        self.transition_object_guard: dict[str: Callable[[BindingFunction], bool] | dict | list] = {}
         # guard considering the item levels of connected counters to consider whether the transition is enabled or
         # not. (optional)
         self.transition_quantity_guard: dict[str: Callable[[BindingFunction, CollectionCounter], bool] | QuantityGuard] = {}
@@ -71,10 +73,21 @@ class QnetConfig(BaseElement):
         self.small_stock_guards: dict[str: QuantityGuardSmallstockConfig] = {} # {transition_name: small_stock_guard_config}
         self.manually_initiated_transitions = {} # {transition_name: bool}
         self.transition_binding_selection: dict[str: Callable] = {} # {transition_name: Callable}}
+        # transitions whose enabled bindings are drawn uniformly at random instead of being enumerated (optional)
+        self.sampled_binding_transitions: set[str] = set() # {transition_name}
+        # join guards relating the objects of two input object types of a transition (optional)
+        self.transition_join_guards: dict[str: list[str]] = {} # {transition_name: ["Parcel o2o Warehouse Employee"]}
         self.variable_arcs: set[tuple[str, str]] = set() # {(start, target), ...}
         self.specify_variable_arc_object_tokens: dict[tuple[str, str]: int] = {} # {arc: number of objects}
         self.maximum_variable_arc_object_quantities: dict[tuple[str, str]: int] = {} # {arc: maximum objects}
         self.minimum_variable_arc_object_quantities: dict[tuple[str, str]: int] = {} # {arc: minimum objects}
+        # only recompute the enabled bindings of transitions whose input places or connected counters changed since
+        # the previous simulation step (optional)
+        self.incremental_enabling: bool = True
+        # cache the structural views of places and transitions once the net is created (optional)
+        self.freeze_net_structure: bool = True
+        # skip the enumeration of bindings of transitions whose input places hold too few active objects (optional)
+        self.count_screening: bool = True
 
         # ## Activities define activities with a name and a dict of attribute names and a default value,
         # activity classes are created automatically from passed parameters (optional)
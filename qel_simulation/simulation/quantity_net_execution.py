@@ -6,6 +6,7 @@ from qel_simulation.simulation.event import Event, create_activity
 from qel_simulation.simulation.object import Object, create_object_type, StatusActive, StatusTerminated, MultisetObject, BindingFunction
 from qel_simulation.qnet_elements.collection_point import CollectionPoint, CollectionCounter
 from qel_simulation.qnet_elements.guard import QuantityGuardSmallStock
+from qel_simulation.qnet_elements.transition import Transition
 from qel_simulation.components.quantity_event_log import QuantityEventLog
 from qel_simulation.components.quantity_net import QuantityNet
 from qel_simulation.simulation.instructions import (InstructionExecuteEvent, Instruction,
@@ -40,6 +41,11 @@ class QuantityNetExecution(BaseElement):
 
         self._object_type_names_classes = {}
         self._activity_names_classes = {}
+        # final markings per object type as frozensets of place names, compiled from the configuration
+        self._final_markings: dict[Type[Object], set[frozenset[str]]] = {}
+        # activity of every transition and additional objects every activity requires, compiled after net creation
+        self._transition_activities: dict[Transition, Type[Event]] = {}
+        self._activity_requirements: dict[Type[Event], dict[Type[Object], int]] = {}
 
         self.default_timestamp = datetime.datetime(month=10, year=2019, day=12, hour=12, minute=21)
 
@@ -48,6 +54,7 @@ class QuantityNetExecution(BaseElement):
         self.create_quantity_net()
         self._add_activities_from_config()
         self.update_final_markings()
+        self.compile_activity_maps()
 
     @property
     def quantity_net(self) -> QuantityNet:
@@ -57,6 +64,15 @@ class QuantityNetExecution(BaseElement):
     def quantity_net(self, quantity_net: QuantityNet):
         self._quantity_net = quantity_net
 
+    @property
+    def transition_activities(self) -> dict[Transition, Type[Event]]:
+        return self._transition_activities
+
+    @property
+    def activity_requirements(self) -> dict[Type[Event], dict[Type[Object], int]]:
+        """Additional objects of the output types that are not input types per activity requiring any."""
+        return self._activity_requirements
+
     @property
     def event_log(self) -> QuantityEventLog:
         return self._quantity_log
@@ -285,8 +301,9 @@ class QuantityNetExecution(BaseElement):
         self.quantity_net.set_place_types(new_place_type_mapping)
 
         # add transition guards
-        for transition, object_guard in self.config.transition_object_guard.items():
-            self.quantity_net.set_object_guard(transition=transition, object_guard=object_guard)
+        for transition, object_guards in self.config.transition_object_guard.items():
+            for object_guard in (object_guards if isinstance(object_guards, list) else [object_guards]):
+                self.quantity_net.set_object_guard(transition=transition, object_guard=object_guard)
         for transition, quantity_guard in self.config.transition_quantity_guard.items():
             self.quantity_net.set_quantity_guard(transition=transition, quantity_guard=quantity_guard)
         for transition, small_stock_guard_config in self.config.small_stock_guards.items():
@@ -314,6 +331,16 @@ class QuantityNetExecution(BaseElement):
 
         # add transition binding selection functions
         self.quantity_net.set_transition_binding_selection(self.config.transition_binding_selection)
+        self.quantity_net.set_sampled_binding_transitions(self.config.sampled_binding_transitions)
+        self.quantity_net.set_join_guards(self.config.transition_join_guards)
+        self.quantity_net.incremental_enabling = self.config.incremental_enabling
+        self.quantity_net.count_screening = self.config.count_screening
+
+        # cache structural views of the nodes, the net is not changed during the simulation
+        if self.config.freeze_net_structure:
+            self.quantity_net.freeze()
+        else:
+            pass
 
         print(f"Quantity net {self.quantity_net.name} successfully created according to {self.config.name}.")
 
@@ -498,14 +525,17 @@ class QuantityNetExecution(BaseElement):
 
     def get_enabled_activities(self) -> dict[Type[Event]: list[None] | list[dict[Type[Object]: set[Object]]]]:
         transition_bindings = self.quantity_net.get_enabled_bindings_all_transitions_for_input_types()
-        activity_bindings_names = {(transition.label if transition.label else transition.name): bindings
-                                   for transition, bindings in transition_bindings.items()}
-        activity_bindings = {self.identify_activity(activity): bindings
-                             for activity, bindings in activity_bindings_names.items()}
         active_bindings = {}
-        for activity, bindings in activity_bindings.items():
-            binding_list = [binding for binding in bindings if
-                            check_object_status_in_enabled_binding(binding_function=binding)]
+        transition_activities = self._transition_activities
+        for transition, bindings in transition_bindings.items():
+            activity = transition_activities[transition]
+            # enumerated bindings only consist of active objects, bindings returned by binding selection functions are
+            # checked again
+            if transition.binding_selection_function:
+                binding_list = [binding for binding in bindings if
+                                check_object_status_in_enabled_binding(binding_function=binding)]
+            else:
+                binding_list = bindings
             if binding_list:
                 active_bindings[activity] = binding_list
             else:
@@ -592,21 +622,23 @@ class QuantityNetExecution(BaseElement):
         """Log execution of event."""
         self.event_log.add_event_to_log(event=event)
 
-    def get_additional_requirements_for_bindings(self) -> dict[Type[Object]: int]:
-        """Pass transition or transition label and identify additional objects required for firing."""
+    def compile_activity_maps(self):
+        """Map every transition to its activity and determine the additional objects every activity requires. Has to
+        be called again if transitions, their labels or binding specifications change after the net was created."""
 
-        transition_overview = self.quantity_net.transitions_output_types_not_input
+        self._transition_activities = {
+            transition: self.identify_activity(transition.label if transition.label else transition.name)
+            for transition in self.quantity_net.transitions}
 
-        activity_overview_names = {(transition.label if transition.label else transition.name): additional_objects
-                                   for transition, additional_objects in transition_overview.items()}
-
-        activity_overview_names = {self.identify_activity(activity_name): additional_objects
-                                   for activity_name, additional_objects in activity_overview_names.items()}
+        transition_overview = self.quantity_net.transitions_output_types_not_input
+        self._activity_requirements = {self._transition_activities[transition]: additional_objects
+                                       for transition, additional_objects in transition_overview.items()
+                                       if additional_objects}
 
-        activities_with_requirements = {activity: additional_objects for activity, additional_objects in
-                                        activity_overview_names.items() if additional_objects}
+    def get_additional_requirements_for_bindings(self) -> dict[Type[Event], dict[Type[Object], int]]:
+        """Returns the additional objects required for firing per activity requiring any."""
 
-        return activities_with_requirements
+        return self._activity_requirements
 
     def update_final_markings(self):
         """Update configuration of specification of final markings per object type."""
@@ -635,6 +667,8 @@ class QuantityNetExecution(BaseElement):
             pass
 
         self.config.final_markings = new_config_final_marking
+        self._final_markings = {object_type: {frozenset(final_marking) for final_marking in final_markings}
+                                for object_type, final_markings in new_config_final_marking.items()}
 
     def get_location_of_object(self, obj: Object) -> set[str]:
         """Return names of places object is part of marking."""
@@ -647,7 +681,7 @@ class QuantityNetExecution(BaseElement):
     def check_if_object_in_final_marking(self, obj: Object) -> bool:
         """Check if object has completed process."""
 
-        if self.get_location_of_object(obj=obj) in self.config.final_markings[obj.object_type]:
+        if frozenset(self.get_location_of_object(obj=obj)) in self._final_markings[obj.object_type]:
             return True
         else:
             return False
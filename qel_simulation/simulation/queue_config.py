@@ -10,4 +10,25 @@ class QueueConfig(BaseElement):
         # initial time
         self.initial_time: datetime.datetime = datetime.datetime(month=10, year=2019, day=12, hour=12, minute=21)
 
+        # storage of the execution queue: "heap" (binary heap), "calendar" (calendar queue with time buckets) or
+        # "tiered" (binary heap for the near future, items beyond the time window are spilled to SQLite)
+        self.queue_type: str = "heap"
+
+        # calendar queue: initial width of a time bucket and initial number of buckets, adapted on resize
+        self.calendar_bucket_width: datetime.timedelta = datetime.timedelta(minutes=1)
+        self.calendar_initial_buckets: int = 64
+
+        # tiered queue: time window kept in memory, maximum number of items in memory and path of the SQLite database
+        # (an empty path creates a temporary database)
+        self.tiered_window: datetime.timedelta = datetime.timedelta(days=7)
+        self.tiered_max_items_in_memory: int = 100000
+        self.tiered_database_path: str = ""
+
+        # items scheduled within the time granularity after the current time are executed together with the current
+        # items (at the current time), reducing the number of simulation steps at the cost of timestamp accuracy
+        self.time_granularity: datetime.timedelta = datetime.timedelta(0)
+
+        # cancelled items are removed from the storage once their share of all stored items exceeds this ratio
+        self.compaction_ratio: float = 0.5
+
         # working time
@@ -0,0 +1,152 @@
+import uuid
+from typing import Type, Iterator
+
+from qel_simulation.simulation.event import Event
+from qel_simulation.simulation.object import Object, Status, StatusActive, StatusInactive, StatusTerminated
+
+
+class ObjectRegistry:
+    """Objects of a simulation in order of registration, indexed by name, id, object type and status. The status index
+    is kept up to date by observing the status of every registered object."""
+
+    def __init__(self):
+        self._objects_by_name: dict[str, Object] = {}
+        self._objects_by_id: dict[uuid.UUID, Object] = {}
+        # dicts with None values are used as insertion ordered sets
+        self._objects_by_type: dict[Type[Object], dict[Object, None]] = {}
+        self._objects_by_status: dict[Type[Status], dict[Object, None]] = {}
+        self._objects: tuple[Object, ...] | None = None  # read-only view, created again after objects were added
+
+    def __len__(self):
+        return len(self._objects_by_name)
+
+    def __iter__(self) -> Iterator[Object]:
+        return iter(self._objects_by_name.values())
+
+    def __contains__(self, obj: Object | str) -> bool:
+        if isinstance(obj, Object):
+            return self._objects_by_name.get(obj.name) is obj
+        else:
+            return obj in self._objects_by_name
+
+    @property
+    def objects(self) -> tuple[Object, ...]:
+        """Read-only view of the registered objects in order of registration, cached until an object is added. Use
+        add to register objects."""
+        if self._objects is None:
+            self._objects = tuple(self._objects_by_name.values())
+        else:
+            pass
+        return self._objects
+
+    @property
+    def object_types(self) -> list[Type[Object]]:
+        return list(self._objects_by_type)
+
+    def add(self, obj: Object):
+        if obj.name in self._objects_by_name:
+            raise ValueError(f"Object with name {obj.name} is already registered.")
+        else:
+            pass
+        self._objects_by_name[obj.name] = obj
+        self._objects_by_id[obj.id] = obj
+        self._objects = None
+        self._objects_by_type.setdefault(obj.object_type, {})[obj] = None
+        self._objects_by_status.setdefault(type(obj.status), {})[obj] = None
+        obj.add_status_observer(self._update_status)
+
+    def _update_status(self, obj: Object, previous_status: Status, status: Status):
+        self._objects_by_status[type(previous_status)].pop(obj, None)
+        self._objects_by_status.setdefault(type(status), {})[obj] = None
+
+    def get(self, name: str) -> Object | None:
+        return self._objects_by_name.get(name)
+
+    def get_by_id(self, object_id: uuid.UUID) -> Object | None:
+        return self._objects_by_id.get(object_id)
+
+    def objects_of_type(self, object_type: Type[Object]) -> Iterator[Object]:
+        """Objects of the passed object type in order of registration."""
+        return iter(self._objects_by_type.get(object_type, ()))
+
+    def number_of_objects_of_type(self, object_type: Type[Object]) -> int:
+        return len(self._objects_by_type.get(object_type, ()))
+
+    def objects_with_status(self, status: Type[Status], object_type: Type[Object] = None) -> Iterator[Object]:
+        """Objects currently having the passed status (of the passed object type) in order of registration."""
+        objects = self._objects_by_status.get(status, {})
+        if object_type is None:
+            return iter(objects)
+        else:
+            return (obj for obj in objects if obj.object_type is object_type)
+
+    def number_of_objects_with_status(self, status: Type[Status]) -> int:
+        return len(self._objects_by_status.get(status, ()))
+
+    def active_objects(self, object_type: Type[Object] = None) -> Iterator[Object]:
+        return self.objects_with_status(StatusActive, object_type=object_type)
+
+    def inactive_objects(self, object_type: Type[Object] = None) -> Iterator[Object]:
+        return self.objects_with_status(StatusInactive, object_type=object_type)
+
+    def terminated_objects(self, object_type: Type[Object] = None) -> Iterator[Object]:
+        return self.objects_with_status(StatusTerminated, object_type=object_type)
+
+
+class EventRegistry:
+    """Events of a simulation in order of execution start, indexed by name, id and activity."""
+
+    def __init__(self):
+        self._events_by_name: dict[str, Event] = {}
+        self._events_by_id: dict[uuid.UUID, Event] = {}
+        self._events_by_activity: dict[Type[Event], list[Event]] = {}
+        self._events: tuple[Event, ...] | None = None  # read-only view, created again after events were added
+
+    def __len__(self):
+        return len(self._events_by_name)
+
+    def __iter__(self) -> Iterator[Event]:
+        return iter(self._events_by_name.values())
+
+    def __contains__(self, event: Event | str) -> bool:
+        if isinstance(event, Event):
+            return self._events_by_name.get(event.name) is event
+        else:
+            return event in self._events_by_name
+
+    @property
+    def events(self) -> tuple[Event, ...]:
+        """Read-only view of the registered events in order of execution start, cached until an event is added. Use
+        add to register events."""
+        if self._events is None:
+            self._events = tuple(self._events_by_name.values())
+        else:
+            pass
+        return self._events
+
+    @property
+    def activities(self) -> list[Type[Event]]:
+        return list(self._events_by_activity)
+
+    def add(self, event: Event):
+        if event.name in self._events_by_name:
+            raise ValueError(f"Event with name {event.name} is already registered.")
+        else:
+            pass
+        self._events_by_name[event.name] = event
+        self._events_by_id[event.id] = event
+        self._events = None
+        self._events_by_activity.setdefault(event.activity, []).append(event)
+
+    def get(self, name: str) -> Event | None:
+        return self._events_by_name.get(name)
+
+    def get_by_id(self, event_id: uuid.UUID) -> Event | None:
+        return self._events_by_id.get(event_id)
+
+    def events_of_activity(self, activity: Type[Event]) -> Iterator[Event]:
+        """Events of the passed activity in order of execution start."""
+        return iter(self._events_by_activity.get(activity, ()))
+
+    def number_of_events_of_activity(self, activity: Type[Event]) -> int:
+        return len(self._events_by_activity.get(activity, ()))
@@ -1,22 +1,32 @@
 import datetime
 from collections import Counter
-from typing import Type
+from typing import Type, Callable, Iterator
 
 import numpy as np
 import pandas as pd
 
 from qel_simulation.components.base_element import BaseElement
+from qel_simulation.simulation.clock import datetime_to_us, us_to_timedelta
+from qel_simulation.simulation.duration_sampler import (DurationSampler, FixedDurationSampler,
+                                                        UniformDurationSampler, TruncatedNormalDurationSampler,
+                                                        BetaDurationSampler, GammaDurationSampler)
 from qel_simulation.simulation.event import Event
 from qel_simulation.simulation.object import Object, StatusActive, StatusInactive, StatusTerminated, Status, \
     BindingFunction, MultisetObject
+from qel_simulation.simulation.arrival_process import ArrivalProcess
+from qel_simulation.simulation.calendar_queue import CalendarExecutionQueue
 from qel_simulation.simulation.execution_queue import (ExecutionQueue, ObjectCreation, ObjectQuantityChange,
                                                        ObjectAttributeChange, EndEvent, StartEvent,
                                                        ObjectStatusChange, ScheduleTypeFixed,
-                                                       ScheduleTypeArrivalRate, ScheduleType)
+                                                       ScheduleTypeArrivalRate, ScheduleType, QueueItem)
 from qel_simulation.simulation.instructions import (InstructionObjectCreation, InstructionExecuteEvent,
                                                     InstructionTerminateEvent)
 from qel_simulation.simulation.quantity_net_execution import QuantityNetExecution
+from qel_simulation.simulation.registry import ObjectRegistry, EventRegistry
 from qel_simulation.simulation.simulation_config import SimulationConfig
+from qel_simulation.simulation.stop_conditions import (StopCondition, AnyStopCondition, MaxExecutionSteps,
+                                                       MaxSimulationTime, MaxTerminatedObjects, MaxEvents)
+from qel_simulation.simulation.tiered_queue import TieredExecutionQueue
 from qel_simulation.simulation.triggers import NetElementTrigger, MultiTrigger
 
 
@@ -28,20 +38,48 @@ class Simulation(BaseElement):
         super().__init__(name=name, label=label, properties=properties)
         self.config = config
         self.execution = QuantityNetExecution(name=f"{name}_execution", qnet_config=config.qnet_config)
-        self.queue = ExecutionQueue(self.config.queue_config)
-        self.object_overview = []
-        self.event_overview = []
+        self.queue = self.create_execution_queue()
+        self.object_registry = ObjectRegistry()
+        self.event_registry = EventRegistry()
         self.rng = np.random.default_rng(seed=self.config.random_seed)
+        self.execution.quantity_net.set_random_generator(self.rng)
         self._step_counter = 0
+        self.duration_samplers: dict[Type[Event], DurationSampler] = {}
+        self.arrival_processes: dict[Type[Object], ArrivalProcess] = {}
+        self._number_terminated_objects = 0
+        self._terminated_objects_per_type: Counter = Counter()
+        # handlers to execute queue items by item type
+        self._queue_item_handlers: dict[str, Callable[[QueueItem], None]] = {
+            ObjectCreation.item_type: self.execute_object_creation,
+            StartEvent.item_type: self.execute_event,
+            EndEvent.item_type: self.execute_event_termination,
+            ObjectStatusChange.item_type: self.execute_object_status_update,
+            ObjectAttributeChange.item_type: self.execute_object_attribute_update,
+            ObjectQuantityChange.item_type: self.execute_object_quantity_update,
+        }
 
         self.register_and_add_objects_from_config()
         self.set_initial_marking_collection_points()
         self.update_duration_specifications_in_config()
+        self.compile_duration_samplers()
         self.update_frequent_object_creations_in_config()
+        self.compile_arrival_processes()
         self.update_triggered_object_creation_in_config()
         self.update_activity_priorities_in_config()
         self.execute_initial_schedules()
 
+    def create_execution_queue(self) -> ExecutionQueue:
+        queue_config = self.config.queue_config
+        if queue_config.queue_type == "heap":
+            return ExecutionQueue(queue_config)
+        elif queue_config.queue_type == "calendar":
+            return CalendarExecutionQueue(queue_config)
+        elif queue_config.queue_type == "tiered":
+            return TieredExecutionQueue(queue_config)
+        else:
+            raise ValueError(f"Queue type {queue_config.queue_type} is not supported. "
+                             f"Choose one of 'heap', 'calendar' and 'tiered'.")
+
     @property
     def activities(self):
         return self.execution.activities
@@ -58,13 +96,70 @@ class Simulation(BaseElement):
     def state(self):
         return self.execution.state
 
+    @property
+    def object_overview(self) -> tuple[Object, ...]:
+        """Read-only view of all objects, register objects through the object registry."""
+        return self.object_registry.objects
+
+    @property
+    def event_overview(self) -> tuple[Event, ...]:
+        """Read-only view of all events, register events through the event registry."""
+        return self.event_registry.events
+
+    @property
+    def number_of_events(self) -> int:
+        return len(self.event_registry)
+
+    def objects_of_type(self, object_type: Type[Object] | str) -> Iterator[Object]:
+        """Registered objects of the passed object type in order of registration."""
+        return self.object_registry.objects_of_type(
+            object_type=self.execution.identify_object_type(object_type_name=object_type))
+
+    def active_objects(self, object_type: Type[Object] | str = None) -> Iterator[Object]:
+        """Registered objects (of the passed object type) that are currently active."""
+        if object_type is None:
+            return self.object_registry.active_objects()
+        else:
+            return self.object_registry.active_objects(
+                object_type=self.execution.identify_object_type(object_type_name=object_type))
+
+    def events_of_activity(self, activity: Type[Event] | str) -> Iterator[Event]:
+        """Executed events of the passed activity in order of execution start."""
+        return self.event_registry.events_of_activity(
+            activity=self.execution.identify_activity(activity_name=activity))
+
     @property
     def terminated_objects(self):
-        return {obj for obj in self.object_overview if isinstance(obj.status, StatusTerminated)}
+        return set(self.object_registry.terminated_objects())
+
+    @property
+    def number_terminated_objects(self) -> int:
+        return self._number_terminated_objects
+
+    @property
+    def terminated_objects_per_type(self) -> Counter:
+        return self._terminated_objects_per_type
 
     def get_terminated_objects_of_type(self, object_type: Type[Object]):
-        return {obj for obj in self.terminated_objects
-                if isinstance(obj, self.execution.identify_object_type(object_type_name=object_type))}
+        return set(self.object_registry.terminated_objects(
+            object_type=self.execution.identify_object_type(object_type_name=object_type)))
+
+    def get_number_terminated_objects_of_type(self, object_type: Type[Object] | str) -> int:
+        return self._terminated_objects_per_type[self.execution.identify_object_type(object_type_name=object_type)]
+
+    def _count_status_change(self, obj: Object, previous_status: Status, status: Status):
+        """Status observer of all registered objects, keeps the number of terminated objects up to date."""
+        if isinstance(status, StatusTerminated):
+            if isinstance(previous_status, StatusTerminated):
+                pass
+            else:
+                self._number_terminated_objects += 1
+                self._terminated_objects_per_type[obj.object_type] += 1
+        elif isinstance(previous_status, StatusTerminated):
+            self._number_terminated_objects -= 1
+            self._terminated_objects_per_type[obj.object_type] -= 1
+        else:
+            pass
 
     def register_and_add_objects_from_config(self):
         self.add_provided_objects_to_model()
@@ -100,7 +195,7 @@ class Simulation(BaseElement):
 
         objects = set()
         for i in np.arange(requested_objects):
-            qitem = ObjectCreation(execution_time=self.queue.time, object_type=object_type)
+            qitem = ObjectCreation(execution_time=self.queue.time_us, object_type=object_type)
             obj = self.create_object(qitem)
             objects.add(obj)
 
@@ -120,7 +215,7 @@ class Simulation(BaseElement):
         else:
             raise ValueError(f"Object you are trying to create is not of a type associated with the simulation model.")
 
-        if object_creation.execution_time == self.queue.time:
+        if self.queue.is_current(object_creation):
             pass
         else:
             raise ValueError("Object creation has to be scheduled for the current time.")
@@ -161,7 +256,13 @@ class Simulation(BaseElement):
 
         self.ensure_object_timestamp_in_accordance_with_simulation_model(obj=object_to_add)
 
-        self.object_overview.append(object_to_add)
+        self.object_registry.add(object_to_add)
+        object_to_add.add_status_observer(self._count_status_change)
+        if isinstance(object_to_add.status, StatusTerminated):
+            self._number_terminated_objects += 1
+            self._terminated_objects_per_type[object_to_add.object_type] += 1
+        else:
+            pass
 
     def ensure_object_timestamp_in_accordance_with_simulation_model(self, obj: Object):
         if obj.last_change_attributes > self.queue.time:
@@ -184,17 +285,19 @@ class Simulation(BaseElement):
 
     def execute_until_number_terminated(self, terminated_objects: int):
         """Executes time steps until the specified number of objects have been terminated."""
-        while len(self.terminated_objects) < terminated_objects:
+        while self.number_terminated_objects < terminated_objects:
             self.execute_simulation_step()
 
     def execute_until_time(self, time: datetime.datetime):
         """Executes time steps until the specified time."""
-        while self.queue.time < time:
+        time_us = datetime_to_us(time)
+        while self.queue.time_us < time_us:
             self.execute_simulation_step()
 
     def execute_until_number_terminated_object_type(self, object_type: Type[Object], terminated_objects: int):
         """Executes time steps until the specified number of objects of the specified type have been terminated."""
-        while len(self.get_terminated_objects_of_type(object_type=object_type)) < terminated_objects:
+        object_type = self.execution.identify_object_type(object_type_name=object_type)
+        while self._terminated_objects_per_type[object_type] < terminated_objects:
             self.execute_simulation_step()
 
     def get_enabled_activity_bindings(self) -> dict[Type[Event]: list[None] | list[dict[Type[Object]: set[Object]]]]:
@@ -294,7 +397,7 @@ class Simulation(BaseElement):
 
     def prepare_event_execution(self, start_event_item: StartEvent) -> InstructionExecuteEvent:
 
-        if self.queue.time == start_event_item.execution_time:
+        if self.queue.is_current(start_event_item):
             pass
         else:
             raise ValueError("Event execution time does not match current time.")
@@ -340,7 +443,7 @@ class Simulation(BaseElement):
                                  "in connection with this event should be added in 'execute_event_start' or "
                                  "'execute_event_end'.")
 
-            if instruction.timedelta == datetime.timedelta(0):
+            if instruction.timedelta_us == 0:
                 pass
             else:
                 raise ValueError("If object should be used in binding for event, timedelta has to be 0. "
@@ -366,7 +469,7 @@ class Simulation(BaseElement):
         return event_instruction
 
     def add_event_to_overview(self, event: Event):
-        self.event_overview.append(event)
+        self.event_registry.add(event)
 
     def execute_simulation_step(self):
 
@@ -390,26 +493,18 @@ class Simulation(BaseElement):
 
         # print("Execution items: ", execution_items)
 
+        handlers = self._queue_item_handlers
         for item in execution_items:
             # print(f"Executed Queue Item: {item}")
-            if isinstance(item, ObjectCreation):
-                self.execute_object_creation(object_creation=item)
-            elif isinstance(item, StartEvent):
-                self.execute_event(start_event=item)
-            elif isinstance(item, EndEvent):
-                self.execute_event_termination(event_ending=item)
-            elif isinstance(item, ObjectStatusChange):
-                self.execute_object_status_update(object_status_update=item)
-            elif isinstance(item, ObjectAttributeChange):
-                self.execute_object_attribute_update(object_attribute_update=item)
-            elif isinstance(item, ObjectQuantityChange):
-                self.execute_object_quantity_update(object_quantity_update=item)
+            handler = handlers.get(item.item_type)
+            if handler:
+                handler(item)
             else:
                 raise ValueError("Queue item is of unknown type.")
 
     def execute_object_status_update(self, object_status_update: ObjectStatusChange):
 
-        if self.queue.time == object_status_update.execution_time:
+        if self.queue.is_current(object_status_update):
             pass
         else:
             raise ValueError("Object status update time does not match current time.")
@@ -427,7 +522,7 @@ class Simulation(BaseElement):
 
     def execute_object_attribute_update(self, object_attribute_update: ObjectAttributeChange):
 
-        if self.queue.time == object_attribute_update.execution_time:
+        if self.queue.is_current(object_attribute_update):
             pass
         else:
             raise ValueError("Object attribute update time does not match current time.")
@@ -443,7 +538,7 @@ class Simulation(BaseElement):
 
     def execute_object_quantity_update(self, object_quantity_update: ObjectQuantityChange):
 
-        if self.queue.time == object_quantity_update.execution_time:
+        if self.queue.is_current(object_quantity_update):
             pass
         else:
             raise ValueError("Object quantity update time does not match current time.")
@@ -465,16 +560,8 @@ class Simulation(BaseElement):
         # execute event in model
         returned_instructions = self.execution.execute_event_start(event_instruction=event_instruction)
 
-        # define variable to check if some instructions should be executed immediately
-        execute_now = False
-
-        # add all instructions to queue
-        for instruction in returned_instructions:
-            if instruction.timedelta == datetime.timedelta(0):
-                execute_now = True
-            else:
-                pass
-            self.queue.add_instruction(instruction=instruction)
+        # add all instructions to queue, check if some instructions should be executed immediately
+        execute_now = self.queue.add_instructions(returned_instructions)
 
         # execute instructions that should be executed immediately
         if execute_now:
@@ -484,7 +571,7 @@ class Simulation(BaseElement):
 
     def execute_event_termination(self, event_ending: EndEvent):
 
-        if self.queue.time == event_ending.execution_time:
+        if self.queue.is_current(event_ending):
             pass
         else:
             raise ValueError("Event termination time does not match current time.")
@@ -499,16 +586,8 @@ class Simulation(BaseElement):
         # execute event termination in model
         returned_instructions = self.execution.execute_event_termination(termination=termination_instruction)
 
-        # define variable to check if some instructions should be executed immediately
-        execute_now = False
-
-        # add all instructions to queue
-        for instruction in returned_instructions:
-            if instruction.timedelta == datetime.timedelta(0):
-                execute_now = True
-            else:
-                pass
-            self.queue.add_instruction(instruction=instruction)
+        # add all instructions to queue, check if some instructions should be executed immediately
+        execute_now = self.queue.add_instructions(returned_instructions)
 
         # execute instructions that should be executed immediately
         if execute_now:
@@ -518,7 +597,7 @@ class Simulation(BaseElement):
 
     def execute_object_creation(self, object_creation: ObjectCreation):
 
-        if self.queue.time == object_creation.execution_time:
+        if self.queue.is_current(object_creation):
             pass
         else:
             raise ValueError("Object creation time does not match current time.")
@@ -557,8 +636,28 @@ class Simulation(BaseElement):
                                                                 specific_time: datetime.datetime = None):
         """Receive object type and add object creation queue item to queue."""
 
+        instruction = self._create_automated_object_creation_instruction(object_type=object_type,
+                                                                         schedule_type=schedule_type,
+                                                                         specific_time=specific_time)
+
+        # add instruction to queue, unless no further objects arrive
+        if instruction:
+            self.queue.add_object_creation(object_creation=instruction, schedule_type=schedule_type)
+        else:
+            pass
+
+    def _create_automated_object_creation_instruction(self, object_type: Type[Object],
+                                                      schedule_type: ScheduleType,
+                                                      specific_time: datetime.datetime = None) \
+            -> InstructionObjectCreation | None:
+        """Receive object type and create the instruction for its next scheduled object creation.
+        Returns None if no further objects of the type arrive."""
+
         # get duration until next object has to be created
-        if isinstance(schedule_type, ScheduleTypeFixed):
+        if specific_time:
+            duration = datetime_to_us(specific_time) - self.queue.time_us
+
+        elif isinstance(schedule_type, ScheduleTypeFixed):
             param_from_config = self.config.object_creation_fixed_time_interval[object_type]
             if isinstance(param_from_config, (int, float)):
                 duration = datetime.timedelta(hours=param_from_config)
@@ -568,21 +667,20 @@ class Simulation(BaseElement):
                 raise ValueError("Duration has to be of type datetime.timedelta, int or float.")
 
         elif isinstance(schedule_type, ScheduleTypeArrivalRate):
-            param_from_config = self.config.object_creation_frequencies_arrival_rates[object_type]
-            objects_per_day = self.draw_from_poisson_distribution(lam=param_from_config)
-            if objects_per_day == 0:
-                duration = datetime.timedelta(days=1)
+            arrival_process = self.arrival_processes.get(object_type)
+            if arrival_process:
+                pass
             else:
-                duration = datetime.timedelta(days=1) / objects_per_day
+                arrival_process = self.arrival_processes[object_type] = \
+                    self.create_arrival_process(object_type=object_type)
+            arrival_time = arrival_process.next_arrival(time_us=self.queue.time_us)
+            if arrival_time is None:
+                return None
+            duration = arrival_time - self.queue.time_us
 
         else:
             raise ValueError("Schedule type has to be of type ScheduleTypeFixed or ScheduleTypeArrivalRate.")
 
-        if specific_time:
-            duration = specific_time - self.queue.time
-        else:
-            pass
-
         # create object creation instruction
         instruction = InstructionObjectCreation(timedelta=duration,
                                                 object_type=object_type,
@@ -592,8 +690,7 @@ class Simulation(BaseElement):
                                                 add_to_binding=False,
                                                 o2o=None)
 
-        # add instruction to queue
-        self.queue.add_object_creation(object_creation=instruction, schedule_type=schedule_type)
+        return instruction
 
     def add_missing_objects_to_execution(self, event_execution_instruction: InstructionExecuteEvent):
 
@@ -601,7 +698,7 @@ class Simulation(BaseElement):
         additional_objects_created = event_execution_instruction.additional_objects.copy()
 
         # check if selected activity requires additional object creations
-        additional_objects_required = self.get_activities_with_additional_requirements()
+        additional_objects_required = self.execution.activity_requirements
         # print(f"All additional objects created: {event_execution_instruction.additional_objects}")
 
         # check if this activity requires additional objects
@@ -648,14 +745,14 @@ class Simulation(BaseElement):
     def _identify_object(self, obj: Object | str) -> Object:
 
         if isinstance(obj, Object):
-            if obj in self.object_overview:
+            if obj in self.object_registry:
                 return obj
             else:
                 raise ValueError(f"Object {obj} not found in simulation model.")
         elif isinstance(obj, str):
-            for known_obj in self.object_overview:
-                if known_obj.name == obj:
-                    return known_obj
+            known_obj = self.object_registry.get(obj)
+            if known_obj:
+                return known_obj
             else:
                 raise ValueError(f"Object with name {obj} not found in simulation model.")
         else:
@@ -747,56 +844,56 @@ class Simulation(BaseElement):
 
         self.config.durations_gamma = new_durations_gamma
 
-    def get_specified_duration(self, activity: Type[Event]) -> datetime.timedelta:
-        """Draws a duration for an event as specified in config.
-        Checks in the order: fixed duration, uniform, normal, beta, gamma."""
-
-        duration = datetime.timedelta(minutes=-1)
-        tries = 0  # to avoid infinite loops
-
-        while duration < datetime.timedelta(0) or tries < 50:
-            if activity in self.config.durations_fixed.keys():
-                duration = self.config.durations_fixed[activity]
-                if isinstance(duration, datetime.timedelta):
-                    pass
-                elif isinstance(duration, (int, float)):
-                    duration = datetime.timedelta(minutes=duration)
-                else:
-                    raise ValueError("Duration has to be of type datetime.timedelta, int or float.")
-            elif activity in self.config.durations_min_uniform:
-                params = self.config.durations_min_uniform[activity]
-                minutes = self.draw_from_uniform_distribution(low=params[0], high=params[1])
-                duration = datetime.timedelta(minutes=minutes)
-            elif activity in self.config.durations_min_normal:
-                params = self.config.durations_min_normal[activity]
-                minutes = self.draw_from_normal_distribution(mean=params[0], std=params[1])
-                duration = datetime.timedelta(minutes=minutes)
-            elif activity in self.config.durations_beta:
-                params = self.config.durations_beta[activity]
-                minutes = self.draw_from_beta_distribution(a=params[0], b=params[1])
-                duration = datetime.timedelta(minutes=minutes)
-            elif activity in self.config.durations_gamma:
-                params = self.config.durations_gamma[activity]
-                minutes = self.draw_from_gamma_distribution(shape=params[0], scale=params[1])
-                duration = datetime.timedelta(minutes=minutes)
-            else:
-                minutes = self.draw_from_normal_distribution(mean=self.config.durations_default_normal_min_params[0],
-                                                             std=self.config.durations_default_normal_min_params[1])
-                duration = datetime.timedelta(minutes=minutes)
-
-            tries += 1
-
-        if duration < datetime.timedelta(0):
-            raise ValueError("The provided parameters for drawing a duration did not achieve a positive duration in 50 "
-                             "tries. Provide different parameters and try again..")
+    def compile_duration_samplers(self):
+        """Resolves the duration specification of every activity once and creates the corresponding sampler."""
+        self.duration_samplers = {activity: self.create_duration_sampler(activity=activity)
+                                  for activity in self.activities}
+
+    def create_duration_sampler(self, activity: Type[Event]) -> DurationSampler:
+        """Creates a duration sampler for an activity as specified in config.
+        Checks in the order: fixed duration, uniform, normal, beta, gamma; default: normal."""
+
+        batch_size = self.config.duration_sample_batch_size
+
+        if activity in self.config.durations_fixed.keys():
+            return FixedDurationSampler(duration=self.config.durations_fixed[activity])
+        elif activity in self.config.durations_min_uniform:
+            params = self.config.durations_min_uniform[activity]
+            return UniformDurationSampler(low=params[0], high=params[1], rng=self.rng, batch_size=batch_size)
+        elif activity in self.config.durations_min_normal:
+            params = self.config.durations_min_normal[activity]
+            return TruncatedNormalDurationSampler(mean=params[0], std=params[1], rng=self.rng, batch_size=batch_size)
+        elif activity in self.config.durations_beta:
+            params = self.config.durations_beta[activity]
+            return BetaDurationSampler(a=params[0], b=params[1], rng=self.rng, batch_size=batch_size)
+        elif activity in self.config.durations_gamma:
+            params = self.config.durations_gamma[activity]
+            return GammaDurationSampler(shape=params[0], scale=params[1], rng=self.rng, batch_size=batch_size)
         else:
+            params = self.config.durations_default_normal_min_params
+            return TruncatedNormalDurationSampler(mean=params[0], std=params[1], rng=self.rng, batch_size=batch_size)
+
+    def get_specified_duration_us(self, activity: Type[Event]) -> int:
+        """Draws a non-negative duration in microseconds for an event as specified in config."""
+        sampler = self.duration_samplers.get(activity)
+        if sampler:
             pass
+        else:
+            sampler = self.duration_samplers[activity] = self.create_duration_sampler(activity=activity)
+        return sampler()
 
-        return duration
+    def get_specified_duration(self, activity: Type[Event]) -> datetime.timedelta:
+        """Draws a non-negative duration for an event as specified in config."""
+        return us_to_timedelta(self.get_specified_duration_us(activity=activity))
 
     def get_event_by_name(self, event_name: Event | str) -> Event:
-        event = [event for event in self.event_overview if event.name == event_name][0]
-        return event
+        if isinstance(event_name, Event):
+            event_name = event_name.name
+        event = self.event_registry.get(event_name)
+        if event:
+            return event
+        else:
+            raise ValueError(f"Event with name {event_name} not found in simulation model.")
 
     def update_frequent_object_creations_in_config(self):
         """exchange object type names for the actual object types in config"""
@@ -823,6 +920,29 @@ class Simulation(BaseElement):
 
         self.config.object_creation_fixed_time_interval = new_creation_frequencies_fixed_duration
 
+        for profiles in [self.config.arrival_rate_hourly_profiles, self.config.arrival_rate_weekday_profiles]:
+            new_profiles = {}
+            for object_type_name, profile in profiles.items():
+                if object_type_name in self.object_types:
+                    object_type = object_type_name
+                else:
+                    object_type = self.execution.identify_object_type(object_type_name=object_type_name)
+                new_profiles[object_type] = profile
+            profiles.clear()
+            profiles.update(new_profiles)
+
+    def compile_arrival_processes(self):
+        """Creates the arrival process of every object type created according to an arrival rate."""
+        self.arrival_processes = {object_type: self.create_arrival_process(object_type=object_type)
+                                  for object_type in self.config.object_creation_frequencies_arrival_rates}
+
+    def create_arrival_process(self, object_type: Type[Object]) -> ArrivalProcess:
+        return ArrivalProcess(rate_per_day=self.config.object_creation_frequencies_arrival_rates[object_type],
+                              rng=self.rng,
+                              batch_size=self.config.arrival_sample_batch_size,
+                              hourly_profile=self.config.arrival_rate_hourly_profiles.get(object_type),
+                              weekday_profile=self.config.arrival_rate_weekday_profiles.get(object_type))
+
     def export_simulated_log(self, path_to_folder: str = None):
         """pass path to folder where log should be saved.
         If no path is passed, log is saved in a folder called 'event_logs'."""
@@ -900,6 +1020,9 @@ class Simulation(BaseElement):
 
         scheduled_types_specified_initial_executions = set()
 
+        # initial object creations per schedule type, added to the queue in one batch each
+        initial_instructions = {ScheduleTypeArrivalRate: [], ScheduleTypeFixed: []}
+
         for specified_initial_executions, execution_time in self.config.initial_scheduled_executions.items():
 
             # identify corresponding activity or object type
@@ -917,10 +1040,11 @@ class Simulation(BaseElement):
             else:
                 schedule_type = ScheduleTypeFixed()
 
-            # add initial entry to queue
-            self._add_new_automated_object_creation_instruction_to_queue(object_type=scheduled_type,
-                                                                         schedule_type=schedule_type,
-                                                                         specific_time=execution_time)
+            # create initial entry
+            initial_instructions[type(schedule_type)].append(
+                self._create_automated_object_creation_instruction(object_type=scheduled_type,
+                                                                   schedule_type=schedule_type,
+                                                                   specific_time=execution_time))
 
             scheduled_types_specified_initial_executions.add(scheduled_type)
 
@@ -932,9 +1056,15 @@ class Simulation(BaseElement):
             else:
                 schedule_type = ScheduleTypeFixed()
 
-            # add initial entry to queue
-            self._add_new_automated_object_creation_instruction_to_queue(object_type=scheduled_type,
-                                                                         schedule_type=schedule_type)
+            # create initial entry
+            initial_instructions[type(schedule_type)].append(
+                self._create_automated_object_creation_instruction(object_type=scheduled_type,
+                                                                   schedule_type=schedule_type))
+
+        # add initial entries to queue (object types without arrivals have no entry)
+        for schedule_type, instructions in initial_instructions.items():
+            self.queue.add_instructions([instruction for instruction in instructions if instruction],
+                                        schedule_type=schedule_type())
 
     def print_enabled_bindings(self):
 
@@ -954,18 +1084,23 @@ class Simulation(BaseElement):
         qty_state_overview = qty_state_overview.fillna(0)
         return qty_state_overview
 
-    def start_simulation(self):
-        start_time = self.queue.time  # apparently no copy needed, as datetime objects are immutable
-        end_time = self.config.max_simulation_time + start_time
+    def create_stop_condition(self) -> StopCondition:
+        """Combines the end conditions of the config and the additional stop conditions; the simulation stops as soon
+        as the first one is met."""
+        stop_condition = AnyStopCondition([MaxExecutionSteps(steps=self.config.max_execution_steps),
+                                           MaxSimulationTime(duration=self.config.max_simulation_time),
+                                           MaxTerminatedObjects(number_of_objects=self.config.max_objects),
+                                           MaxEvents(number_of_events=self.config.max_events),
+                                           *self.config.stop_conditions])
+        stop_condition.bind(self)
+        return stop_condition
 
-        c1 = lambda: self.step_counter < self.config.max_execution_steps
-        c2 = lambda: self.queue.time <= end_time
-        c3 = lambda: len(self.terminated_objects) <= self.config.max_objects
-        c4 = lambda: len(self.event_overview) <= self.config.max_events
+    def start_simulation(self):
+        stop_condition = self.create_stop_condition()
 
-        while c1() and c2() and c3() and c4():
+        while not stop_condition.check_stopping():
             # print(f"Simulation Step: {self.step_counter}")
             # print(f"Time: {self.queue.time}")
-            # print(f"Number of terminated objects: {len(self.terminated_objects)}")
+            # print(f"Number of terminated objects: {self.number_terminated_objects}")
             # print(f"Number of events: {len(self.event_overview)}")
             self.execute_simulation_step()
@@ -6,6 +6,7 @@ from qel_simulation.simulation.event import Event
 from qel_simulation.simulation.object import Object
 from qel_simulation.simulation.qnet_config import QnetConfig
 from qel_simulation.simulation.queue_config import QueueConfig
+from qel_simulation.simulation.stop_conditions import StopCondition
 from qel_simulation.simulation.triggers import Trigger
 
 
@@ -33,6 +34,8 @@ class SimulationConfig(BaseElement):
         self.durations_gamma: dict[str | Type[Event], tuple[
             float | int, float | int]] = {}  # {activity_name: (alpha, beta)} => mode: (alpha-1)*beta, mean = alpha*beta
         self.durations_default_normal_min_params: tuple[float | int, float | int] = (12, 3)
+        # number of durations drawn at once per activity
+        self.duration_sample_batch_size: int = 1024
 
         # object creation
         self.object_creation_triggered: dict[Trigger: Type[Object]] = {}  # {trigger: object_type}
@@ -40,6 +43,11 @@ class SimulationConfig(BaseElement):
             str | Type[Object], int | float] = {}  # {object_type: expected arrival rate per business day (lambda)}
         self.object_creation_fixed_time_interval: dict[
             str | Type[Object], datetime.timedelta | int | float] = {}  # {object_type: duration (if int or float: unit it is multiplied by is hours)}
+        self.arrival_rate_hourly_profiles: dict[
+            str | Type[Object], list[float]] = {}  # {object_type: multipliers of the arrival rate per hour of the day (24)}
+        self.arrival_rate_weekday_profiles: dict[
+            str | Type[Object], list[float]] = {}  # {object_type: multipliers of the arrival rate per weekday (7, Monday first)}
+        self.arrival_sample_batch_size: int = 1024  # number of interarrival times drawn at once per object type
         self.initial_scheduled_executions: dict[
             str | Type[Object], datetime.datetime] = {}  # {object type: first execution time}
 
@@ -56,3 +64,5 @@ class SimulationConfig(BaseElement):
         self.max_objects: int = 50000
         # simulation runs while fewer than passed number of events have been executed
         self.max_events: int = 10000
+        # additional conditions, simulation stops as soon as one of them is met
+        self.stop_conditions: list[StopCondition] = []
@@ -0,0 +1,124 @@
+import datetime
+from abc import ABC, abstractmethod
+from typing import Any, Type
+
+from qel_simulation.simulation.clock import timedelta_to_us
+from qel_simulation.simulation.object import Object
+
+
+class StopCondition(ABC):
+    """Condition to end a simulation run, checked once per simulation step. Before the run, the condition is bound to
+    the simulation, so that it can resolve everything it needs once and only read incrementally maintained counters
+    of the simulation in every step."""
+
+    def __init__(self):
+        self._simulation = None
+
+    @property
+    def simulation(self):
+        return self._simulation
+
+    def bind(self, simulation: Any):
+        self._simulation = simulation
+
+    @abstractmethod
+    def check_stopping(self) -> bool:
+        """Returns whether the simulation has to stop."""
+        ...
+
+
+class MultiStopCondition(StopCondition, ABC):
+
+    def __init__(self, conditions: list[StopCondition]):
+        super().__init__()
+        self._conditions = conditions
+
+    @property
+    def conditions(self):
+        return self._conditions
+
+    def bind(self, simulation: Any):
+        super().bind(simulation)
+        for condition in self.conditions:
+            condition.bind(simulation)
+
+
+class AnyStopCondition(MultiStopCondition):
+
+    def check_stopping(self) -> bool:
+        """Stops as soon as one of the conditions is met."""
+        for condition in self.conditions:
+            if condition.check_stopping():
+                return True
+        return False
+
+
+class AllStopCondition(MultiStopCondition):
+
+    def check_stopping(self) -> bool:
+        """Stops once all conditions are met."""
+        for condition in self.conditions:
+            if condition.check_stopping():
+                pass
+            else:
+                return False
+        return True
+
+
+class MaxExecutionSteps(StopCondition):
+
+    def __init__(self, steps: int):
+        super().__init__()
+        self.steps = steps
+
+    def check_stopping(self) -> bool:
+        return self.simulation.step_counter >= self.steps
+
+
+class MaxSimulationTime(StopCondition):
+    """Stops once the simulation time passes the time at binding plus the passed duration."""
+
+    def __init__(self, duration: datetime.timedelta):
+        super().__init__()
+        self.duration = duration
+        self._end_time_us = None
+
+    def bind(self, simulation: Any):
+        super().bind(simulation)
+        self._end_time_us = simulation.queue.time_us + timedelta_to_us(self.duration)
+
+    def check_stopping(self) -> bool:
+        return self.simulation.queue.time_us > self._end_time_us
+
+
+class MaxTerminatedObjects(StopCondition):
+    """Stops once more than the passed number of objects (of the passed object type) have terminated."""
+
+    def __init__(self, number_of_objects: int, object_type: Type[Object] | str = None):
+        super().__init__()
+        self.number_of_objects = number_of_objects
+        self.object_type = object_type
+
+    def bind(self, simulation: Any):
+        super().bind(simulation)
+        if self.object_type is None:
+            pass
+        else:
+            self.object_type = simulation.execution.identify_object_type(object_type_name=self.object_type)
+
+    def check_stopping(self) -> bool:
+        if self.object_type is None:
+            return self.simulation.number_terminated_objects > self.number_of_objects
+        else:
+            return self.simulation.terminated_objects_per_type[self.object_type] > self.number_of_objects
+
+
+class MaxEvents(StopCondition):
+    """Stops once more than the passed number of events have been executed."""
+
+    def __init__(self, number_of_events: int):
+        super().__init__()
+        self.number_of_events = number_of_events
+
+    def check_stopping(self) -> bool:
+        return self.simulation.number_of_events > self.number_of_events
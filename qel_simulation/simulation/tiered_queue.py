@@ -0,0 +1,273 @@
+import bisect
+import datetime
+import heapq
+import io
+import pickle
+import sqlite3
+from collections import Counter
+
+from qel_simulation.simulation.clock import timedelta_to_us, us_to_datetime
+from qel_simulation.simulation.execution_queue import ExecutionQueue, QueueItem
+from qel_simulation.simulation.queue_config import QueueConfig
+
+# values that are stored with the spilled queue items, all other objects (objects, events, object and event types,
+# places, executions, ...) stay in memory and are referenced from the stored item to preserve their identity
+STORED_BY_VALUE = (QueueItem, str, bytes, int, float, bool, type(None), datetime.datetime, datetime.timedelta,
+                   dict, list, set, frozenset, tuple, Counter)
+
+
+class _ItemPickler(pickle.Pickler):
+
+    def __init__(self, file, references: dict[int, object], reference_counts: Counter):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.references = references
+        self.reference_counts = reference_counts
+
+    def persistent_id(self, obj):
+        if isinstance(obj, STORED_BY_VALUE):
+            return None
+        else:
+            self.references[id(obj)] = obj
+            self.reference_counts[id(obj)] += 1
+            return id(obj)
+
+
+class _ItemUnpickler(pickle.Unpickler):
+
+    def __init__(self, file, references: dict[int, object], reference_counts: Counter, release: bool = True):
+        super().__init__(file)
+        self.references = references
+        self.reference_counts = reference_counts
+        self.release = release  # whether the stored item is removed, i.e., its references are no longer required
+
+    def persistent_load(self, pid):
+        obj = self.references[pid]
+        if self.release:
+            pass
+        else:
+            return obj
+        self.reference_counts[pid] -= 1
+        if self.reference_counts[pid] == 0:
+            del self.references[pid]
+            del self.reference_counts[pid]
+        return obj
+
+
+class TieredExecutionQueue(ExecutionQueue):
+    """Execution queue for long simulation horizons. Items up to the spill boundary are kept in the in-memory heap,
+    later items are spilled to a SQLite database. The boundary starts at the end of the time window of the queue
+    config; if the heap exceeds the configured number of items, its later half is spilled and the boundary moves
+    back. Spilled items are reloaded in time order once the clock reaches the boundary or the heap runs empty: the
+    window following the current time is loaded, but at most half of the configured number of items, so that the
+    heap can take new items again before it is spilled the next time.
+    Objects, events and other net elements referenced by spilled items are kept in memory, so reloaded items refer to
+    the same instances as before. The queue items themselves are reloaded as copies: remove_items_from_queue, which
+    compares items by identity, cannot remove items that have been spilled; cancel them through the handles returned
+    by schedule_item and schedule_instruction instead. The queue property and remove_items_from_queue read all
+    spilled items from the database and are meant for inspection and rare corrections only."""
+
+    def __init__(self, config: QueueConfig):
+        super().__init__(config)
+        if config.tiered_window > datetime.timedelta(0):
+            pass
+        else:
+            raise ValueError("Time window of the tiered queue has to be positive.")
+        if config.tiered_max_items_in_memory >= 2:
+            pass
+        else:
+            raise ValueError("Tiered queue has to keep at least two items in memory.")
+
+        self._window: int = timedelta_to_us(config.tiered_window)
+        self._max_items_in_memory: int = config.tiered_max_items_in_memory
+        self._reload_items: int = config.tiered_max_items_in_memory // 2  # items in memory after a reload at most
+        self._boundary: int = self._current_time_us + self._window  # latest time of items in memory
+        self._unsplittable_time: int | None = None  # time shared by all items in memory if they could not be split
+        self._spilled = 0
+        self._references: dict[int, object] = {}
+        self._reference_counts: Counter = Counter()
+
+        # an empty path creates a temporary database on disk that is deleted when the connection is closed
+        self._connection = sqlite3.connect(config.tiered_database_path)
+        self._connection.execute("DROP TABLE IF EXISTS queue_entries")
+        self._connection.execute("CREATE TABLE queue_entries "
+                                 "(execution_time INTEGER, sequence INTEGER, item BLOB, "
+                                 "PRIMARY KEY (execution_time, sequence))")
+        self._connection.execute("CREATE INDEX IF NOT EXISTS queue_entries_sequence ON queue_entries (sequence)")
+
+    @property
+    def spilled_items(self) -> int:
+        return self._spilled
+
+    def close(self):
+        self._connection.close()
+
+    ##### serialisation #####
+
+    def _dump_item(self, item: QueueItem) -> bytes:
+        file = io.BytesIO()
+        _ItemPickler(file, self._references, self._reference_counts).dump(item)
+        return file.getvalue()
+
+    def _load_item(self, data: bytes, release: bool = True) -> QueueItem:
+        return _ItemUnpickler(io.BytesIO(data), self._references, self._reference_counts, release=release).load()
+
+    ##### spilling and reloading #####
+
+    def _spill(self, entries: list[tuple]):
+        self._connection.executemany("INSERT INTO queue_entries VALUES (?, ?, ?)",
+                                     [(entry[0], entry[1], self._dump_item(entry[-1]))
+                                      for entry in entries])
+        self._spilled += len(entries)
+
+    def _spill_latest_items(self):
+        """Spills the later half of the in-memory items and moves the boundary accordingly. If the later half shares
+        the latest time, all items of that time are spilled."""
+        entries = sorted(self._queue)
+        boundary = entries[len(entries) // 2 - 1][0]
+        if boundary == entries[-1][0]:
+            times = [entry[0] for entry in entries]
+            split = bisect.bisect_left(times, times[-1])
+            if split == 0:
+                # all items share the same time and cannot be split until an item of another time is added
+                self._unsplittable_time = times[-1]
+                return
+            else:
+                boundary = times[split - 1]
+        else:
+            pass
+        self._boundary = boundary
+        self._queue = [entry for entry in entries if entry[0] <= boundary]  # sorted list satisfies the heap property
+        self._spill([entry for entry in entries if entry[0] > boundary])
+
+    def _reload(self):
+        """Moves the spilled items up to the end of the time window after the current time into memory, but only up to
+        half of the maximum number of items in memory. If memory is empty, at least the next spilled time is loaded."""
+        boundary = self._current_time_us + self._window
+        if self._queue:
+            pass
+        else:
+            row = self._connection.execute("SELECT MIN(execution_time) FROM queue_entries").fetchone()
+            boundary = max(boundary, row[0])
+
+        limit = max(self._reload_items - len(self._queue), 1)
+        rows = self._connection.execute("SELECT execution_time, sequence, item FROM queue_entries "
+                                        "WHERE execution_time <= ? ORDER BY execution_time, sequence LIMIT ?",
+                                        (boundary, limit)).fetchall()
+        if len(rows) == limit:
+            # reload limit reached: the boundary is the last loaded time, whose remaining items are loaded as well
+            last_time, last_sequence = rows[-1][0], rows[-1][1]
+            rows += self._connection.execute("SELECT execution_time, sequence, item FROM queue_entries "
+                                             "WHERE execution_time = ? AND sequence > ? ORDER BY sequence",
+                                             (last_time, last_sequence)).fetchall()
+            boundary = last_time
+        else:
+            pass
+        self._connection.execute("DELETE FROM queue_entries WHERE execution_time <= ?", (boundary,))
+        self._boundary = max(self._boundary, boundary)
+        self._spilled -= len(rows)
+        self._unsplittable_time = None
+
+        for execution_time, sequence, data in rows:
+            item = self._load_item(data)
+            handle = self._handles.get(sequence)
+            if handle:
+                handle.item = item
+            heapq.heappush(self._queue, (execution_time, sequence, item))
+
+    ##### storage #####
+
+    def _number_of_entries(self) -> int:
+        return len(self._queue) + self._spilled
+
+    def _push_entry(self, entry: tuple):
+        if entry[0] > self._boundary:
+            self._spill([entry])
+        else:
+            heapq.heappush(self._queue, entry)
+            if entry[0] == self._unsplittable_time:
+                pass
+            else:
+                self._unsplittable_time = None
+                if len(self._queue) > self._max_items_in_memory:
+                    self._spill_latest_items()
+                else:
+                    pass
+
+    def _push_entries(self, entries: list[tuple]):
+        for entry in entries:
+            self._push_entry(entry)
+
+    def _peek_entry(self) -> tuple | None:
+        # all spilled items are later than the items in memory: reload only once memory has run empty or the clock
+        # has reached the boundary, not whenever the window extends beyond the boundary after a spill
+        if self._spilled and (not self._queue or self._current_time_us >= self._boundary):
+            self._reload()
+        return super()._peek_entry()
+
+    def _pop_entries_before(self, horizon: int) -> list[tuple]:
+        entries = []
+        entry = self._peek_entry()
+        while entry is not None and entry[0] < horizon:
+            # reloads spilled entries if the horizon extends beyond the items in memory
+            entries.extend(super()._pop_entries_before(horizon))
+            entry = self._peek_entry()
+        return entries
+
+    def _entries(self) -> list[tuple]:
+        """All entries including the spilled ones, which are unpickled from the database on every call."""
+        spilled_entries = []
+        for sequence, data in self._connection.execute("SELECT sequence, item FROM queue_entries"):
+            item = self._load_item(data, release=False)
+            spilled_entries.append((item.execution_time_us, sequence, item))
+        return self._queue + spilled_entries
+
+    def _spilled_entries_before(self, horizon: int) -> list[tuple]:
+        spilled_entries = []
+        for execution_time, sequence, data in self._connection.execute(
+                "SELECT execution_time, sequence, item FROM queue_entries WHERE execution_time < ?", (horizon,)):
+            spilled_entries.append((execution_time, sequence, self._load_item(data, release=False)))
+        return spilled_entries
+
+    def get_current_items(self) -> list[QueueItem]:
+        """Returns the items scheduled for the current time without removing them from the queue. Only the spilled
+        items of the current batch are read from the database."""
+        relevant_entries = sorted(entry for entry in self._queue + self._spilled_entries_before(self._horizon_us)
+                                  if self._current_time_us <= entry[0] < self._horizon_us
+                                  and entry[1] not in self._tombstones)
+        return [entry[-1] for entry in relevant_entries]
+
+    def get_all_execution_times_in_queue(self) -> set[datetime.datetime]:
+        """Reads the execution times of the spilled items without unpickling them."""
+        execution_times = {entry[0] for entry in self._queue if entry[1] not in self._tombstones}
+        for execution_time, sequence in self._connection.execute(
+                "SELECT execution_time, sequence FROM queue_entries"):
+            if sequence in self._tombstones:
+                pass
+            else:
+                execution_times.add(execution_time)
+        return {us_to_datetime(execution_time) for execution_time in execution_times}
+
+    def _rebuild(self, entries: list[tuple]):
+        self._connection.execute("DELETE FROM queue_entries")
+        self._references.clear()
+        self._reference_counts.clear()
+        self._spilled = 0
+        self._queue = []
+        self._unsplittable_time = None
+        for entry in entries:
+            self._push_entry(entry)
+
+    def compact(self):
+        """Removes all tombstones from memory and from the database."""
+        if self._tombstones:
+            for sequence in self._tombstones:
+                for (data,) in self._connection.execute("SELECT item FROM queue_entries WHERE sequence = ?",
+                                                        (sequence,)).fetchall():
+                    self._load_item(data)  # releases the references of the removed item
+            self._connection.executemany("DELETE FROM queue_entries WHERE sequence = ?",
+                                         [(sequence,) for sequence in self._tombstones])
+            self._spilled = self._connection.execute("SELECT COUNT(*) FROM queue_entries").fetchone()[0]
+            self._queue = [entry for entry in self._queue if entry[1] not in self._tombstones]
+            heapq.heapify(self._queue)
+            self._tombstones.clear()
+            self.statistics.compactions += 1